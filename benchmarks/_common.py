@@ -0,0 +1,29 @@
+"""
+Fixture builders shared by the benchmarks.
+
+The benchmarks are run as scripts from the root of the repository, so
+this module is imported from the script's own directory.
+"""
+import math
+from os.path import join
+
+from praatio import textgrid
+
+
+def fixturePath(name: str) -> str:
+    """The path to a fixture in tests/files/."""
+    return join(".", "tests", "files", name)
+
+
+def scaleTextgrid(tg: textgrid.Textgrid, scale: int) -> textgrid.Textgrid:
+    """A textgrid /scale/ times as long, with the entries of /tg/ repeated."""
+    # Whole seconds keep the shifted copies from overlapping due to rounding
+    duration = float(math.ceil(tg.maxTimestamp))
+    scaledTg = textgrid.Textgrid()
+    for tier in tg.tiers:
+        entries = [
+            entry + i * duration for i in range(scale) for entry in tier.entries
+        ]
+        scaledTg.addTier(tier.new(entries=entries, maxTimestamp=duration * scale))
+
+    return scaledTg
@@ -0,0 +1,74 @@
+"""
+Benchmarks for opening and saving many textgrids in parallel.
+
+Times openTextgrids() and saveTextgrids() with an increasing number of
+worker processes, against a plain loop over openTextgrid() and
+Textgrid.save().  The inputs are copies of a fixture from tests/files/
+scaled up by repeating its entries, written to a temporary directory.
+
+Run from the root of the repository:
+PYTHONPATH=. python benchmarks/benchmark_bulk_io.py
+"""
+import os
+import tempfile
+import time
+from os.path import join
+
+from praatio import textgrid
+
+from _common import fixturePath, scaleTextgrid
+
+SCALE = 100
+NUM_FILES = 48
+
+fn = fixturePath("bobby_words_with_newlines_longfile.TextGrid")
+
+
+def timeIt(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    tg = scaleTextgrid(textgrid.openTextgrid(fn, True), SCALE)
+    numCpus = os.cpu_count() or 1
+    workerCounts = sorted({1, 2, 4, numCpus} | {2**i for i in range(numCpus.bit_length())})
+
+    with tempfile.TemporaryDirectory() as tmpDir:
+        fns = [join(tmpDir, f"{i}.TextGrid") for i in range(NUM_FILES)]
+        for outputFN in fns:
+            tg.save(outputFN, "long_textgrid", True)
+
+        numEntries = sum(len(tier) for tier in tg.tiers)
+        print(f"{NUM_FILES} files x {numEntries} entries, {numCpus} cpus")
+
+        baseline = timeIt(lambda: [textgrid.openTextgrid(fn, True) for fn in fns])
+        print(f"open, loop:            {baseline:.2f}s")
+        for workers in workerCounts:
+            duration = timeIt(
+                lambda: list(textgrid.openTextgrids(fns, True, workers=workers))
+            )
+            print(
+                f"open, {workers:2d} workers:      {duration:.2f}s "
+                f"({baseline / duration:.1f}x)"
+            )
+
+        baseline = timeIt(lambda: [tg.save(fn, "long_textgrid", True) for fn in fns])
+        print(f"save, loop:            {baseline:.2f}s")
+        for workers in workerCounts:
+            duration = timeIt(
+                lambda: list(
+                    textgrid.saveTextgrids(
+                        [(fn, tg) for fn in fns], "long_textgrid", True, workers=workers
+                    )
+                )
+            )
+            print(
+                f"save, {workers:2d} workers:      {duration:.2f}s "
+                f"({baseline / duration:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
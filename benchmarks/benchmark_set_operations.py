@@ -0,0 +1,128 @@
+"""
+Benchmarks for set operations between two interval tiers.
+
+Times intersection(), mergeLabels(), difference() and union() between
+two annotations of the same long recording, as when comparing the tiers
+of two annotators.  Each operation sweeps once over both sorted tiers.
+For comparison, the operations are also run as before: intersection()
+and mergeLabels() cropping one tier for each entry of the other,
+difference() erasing each entry of the other tier in turn, and union()
+inserting each entry of the other tier in turn.
+
+Run from the root of the repository:
+PYTHONPATH=. python benchmarks/benchmark_set_operations.py
+"""
+import random
+import timeit
+from typing import List
+
+from praatio import textgrid
+from praatio.utilities import constants
+from praatio.utilities.constants import Interval
+
+NUM_INTERVALS = 10000
+REPEATS = 3
+
+
+def legacyIntersection(self, tier, demarcator="-"):
+    retEntries: List[Interval] = []
+    for interval in tier.entries:
+        subTier = self.crop(
+            interval.start, interval.end, constants.CropCollision.TRUNCATED, False
+        )
+        retEntries.extend(
+            Interval(
+                subInterval.start,
+                subInterval.end,
+                f"{subInterval.label}{demarcator}{interval.label}",
+            )
+            for subInterval in subTier.entries
+        )
+
+    return self.new(f"{self.name}-{tier.name}", retEntries)
+
+
+def legacyMergeLabels(self, tier, demarcator=","):
+    retEntries: List[Interval] = []
+    for interval in self.entries:
+        subTier = tier.crop(
+            interval.start, interval.end, constants.CropCollision.TRUNCATED, False
+        )
+        if not subTier._entries:
+            continue
+
+        subLabel = demarcator.join([entry.label for entry in subTier.entries])
+        label = f"{interval.label}({subLabel})"
+        start = min(interval.start, subTier._entries[0].start)
+        end = max(interval.end, subTier._entries[-1].end)
+        retEntries.append(Interval(start, end, label))
+
+    return self.new(f"{self.name}-{tier.name}", retEntries)
+
+
+def legacyDifference(self, tier):
+    retTier = self.new()
+    for entry in tier.entries:
+        retTier = retTier.eraseRegion(
+            entry.start,
+            entry.end,
+            collisionMode=constants.EraseCollision.TRUNCATE,
+            doShrink=False,
+        )
+
+    return retTier
+
+
+def legacyUnion(self, tier):
+    retTier = self.new()
+    for entry in tier.entries:
+        retTier.insertEntry(
+            entry,
+            collisionMode=constants.IntervalCollision.MERGE,
+            collisionReportingMode=constants.ErrorReportingMode.SILENCE,
+        )
+
+    return retTier
+
+
+def makeAnnotatorTier(name: str, seed: int) -> textgrid.IntervalTier:
+    """Words of 0.2-0.4s, shared by both annotators, with their own jitter and pauses."""
+    rng = random.Random(seed)
+    entries = []
+    for i in range(NUM_INTERVALS):
+        if rng.random() < 0.1:
+            continue
+        start = i * 0.5 + rng.uniform(0, 0.1)
+        end = start + rng.uniform(0.2, 0.4)
+        entries.append(Interval(start, end, f"w{i}"))
+
+    return textgrid.IntervalTier(name, entries, 0, NUM_INTERVALS * 0.5)
+
+
+def main():
+    tierA = makeAnnotatorTier("annotator1", 0)
+    tierB = makeAnnotatorTier("annotator2", 1)
+    print(f"{len(tierA)} x {len(tierB)} intervals")
+
+    for name, legacyOperation, operation in [
+        ("intersection", legacyIntersection, textgrid.IntervalTier.intersection),
+        ("mergeLabels", legacyMergeLabels, textgrid.IntervalTier.mergeLabels),
+        ("difference", legacyDifference, textgrid.IntervalTier.difference),
+        ("union", legacyUnion, textgrid.IntervalTier.union),
+    ]:
+        assert operation(tierA, tierB) == legacyOperation(tierA, tierB)
+        baseline = min(
+            timeit.repeat(
+                lambda: legacyOperation(tierA, tierB), number=1, repeat=REPEATS
+            )
+        )
+        duration = min(
+            timeit.repeat(lambda: operation(tierA, tierB), number=1, repeat=REPEATS)
+        )
+        print(
+            f"{name:>14}: {baseline:.3f}s -> {duration:.3f}s ({baseline / duration:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+Benchmarks for parsing long-format and short-format textgrids.
+
+Compares the single-pass tokenizer in textgrid_io with the regex-based
+parser it replaced for long textgrids, and the line-split parser with
+the _fetchRow() based parser it replaced for short textgrids.  The input
+is a fixture from tests/files/ scaled up by repeating its entries: one
+with many multi-line labels and one with none.
+
+Run from the root of the repository:
+PYTHONPATH=. python benchmarks/benchmark_textgrid_parsing.py
+"""
+import re
+import timeit
+from typing import Dict, List, Any, Optional, Tuple
+
+from praatio import textgrid
+from praatio.data_classes.textgrid import _tgToDictionary
+from praatio.utilities import errors
+from praatio.utilities import textgrid_io
+from praatio.utilities import utils
+from praatio.utilities.constants import Interval, Point, INTERVAL_TIER, POINT_TIER
+
+from _common import fixturePath, scaleTextgrid
+
+SCALE = 1000
+REPEATS = 3
+
+fns = [
+    fixturePath("bobby_words_with_newlines_longfile.TextGrid"),
+    fixturePath("mary.TextGrid"),
+]
+
+
+def legacyReSearch(pattern, string, flags=None):
+    matches = re.search(pattern, string, flags) if flags else re.search(pattern, string)
+    if not matches:
+        raise errors.ParsingError("Expected field in Textgrid missing.")
+    return matches
+
+
+def legacyParseNormalTextgrid(data: str) -> Dict:
+    """The regex-based parser, as it was before the single-pass tokenizer."""
+    data = data.replace("\r\n", "\n")
+
+    header, data = re.split(r"item ?\[", data, maxsplit=1, flags=re.MULTILINE)
+    headerList = header.split("\n")
+    tgMin = float(headerList[3].split("=")[1].strip())
+    tgMax = float(headerList[4].split("=")[1].strip())
+
+    tiers: List[Dict] = []
+    for tierTxt in re.split(r"item ?\[", data, flags=re.MULTILINE)[1:]:
+        if 'class = "IntervalTier"' in tierTxt:
+            tierType = INTERVAL_TIER
+            searchWord = r"intervals ?\["
+        else:
+            tierType = POINT_TIER
+            searchWord = r"points ?\["
+
+        d = re.split(searchWord, tierTxt, flags=re.MULTILINE)
+        header, tierData = d[0], d[1:]
+        tierName = legacyReSearch(
+            r"name ?= ?\"(.*)\"\s*$", header, flags=re.MULTILINE
+        ).groups()[0]
+        tierName = re.sub(r'""', '"', tierName)
+        tierStartTime = legacyReSearch(
+            r"xmin ?= ?-?([\d.]+)\s*$", header, flags=re.MULTILINE
+        ).groups()[0]
+        tierEndTime = legacyReSearch(
+            r"xmax ?= ?([\d.]+)\s*$", header, flags=re.MULTILINE
+        ).groups()[0]
+
+        entries: List[Any] = []
+        if tierType == INTERVAL_TIER:
+            for element in tierData:
+                timeStart = legacyReSearch(
+                    r"xmin ?= ?-?([\d.]+)\s*$", element, flags=re.MULTILINE
+                ).groups()[0]
+                timeEnd = legacyReSearch(
+                    r"xmax ?= ?([\d.]+)\s*$", element, flags=re.MULTILINE
+                ).groups()[0]
+                label = legacyReSearch(
+                    r"text ?= ?\"(.*)\"\s*$", element, flags=re.MULTILINE | re.DOTALL
+                ).groups()[0]
+                label = re.sub(r'""', '"', label.strip())
+                entries.append(Interval(timeStart, timeEnd, label))
+        else:
+            for element in tierData:
+                time = legacyReSearch(
+                    r"number ?= ?-?([\d.]+)\s*$", element, flags=re.MULTILINE
+                ).groups()[0]
+                label = legacyReSearch(
+                    r"mark ?= ?\"(.*)\"\s*$", element, flags=re.MULTILINE | re.DOTALL
+                ).groups()[0]
+                entries.append(Point(time, label.strip()))
+
+        tiers.append(
+            {
+                "class": tierType,
+                "name": tierName,
+                "xmin": float(tierStartTime),
+                "xmax": float(tierEndTime),
+                "entries": entries,
+            }
+        )
+
+    return {"xmin": tgMin, "xmax": tgMax, "tiers": tiers}
+
+
+def legacyParseShortTextgrid(data: str) -> Dict:
+    """The _fetchRow() based parser, as it was before the line-split parser."""
+    data = data.replace("\r\n", "\n")
+
+    intervalIndicies = [(i, True) for i in utils.findAll(data, '"IntervalTier"')]
+    pointIndicies = [(i, False) for i in utils.findAll(data, '"TextTier"')]
+
+    indexList = [*intervalIndicies, *pointIndicies]
+    indexList.append((len(data), True))  # The 'end' of the file
+    indexList.sort()
+
+    tupleList = [
+        (indexList[i][0], indexList[i + 1][0], indexList[i][1])
+        for i in range(len(indexList) - 1)
+    ]
+
+    # Set the textgrid's min and max times
+    header = data[: tupleList[0][0]]
+    headerList = header.split("\n")
+    tgMin = float(headerList[3].strip())
+    tgMax = float(headerList[4].strip())
+
+    # Load the data for each tier
+    tiers: List[Dict] = []
+    for blockStartI, blockEndI, isInterval in tupleList:
+        tierData = data[blockStartI:blockEndI]
+
+        # First row contains the tier type, which we already know
+        metaStartI = legacyFetchRow(tierData, 0)[1]
+
+        # Tier meta-information
+        tierName, tierNameEndI = legacyFetchTextRow(tierData, metaStartI)
+        tierStartTimeStr, tierStartTimeI = legacyFetchRow(tierData, tierNameEndI)
+        tierEndTimeStr, tierEndTimeI = legacyFetchRow(tierData, tierStartTimeI)
+        startTimeI = legacyFetchRow(tierData, tierEndTimeI)[1]
+
+        tierStartTime = utils.strToIntOrFloat(tierStartTimeStr)
+        tierEndTime = utils.strToIntOrFloat(tierEndTimeStr)
+
+        # Tier entry data
+        entries: List[Any] = []
+        if isInterval:
+            className = INTERVAL_TIER
+            while True:
+                try:
+                    startTime, endTimeI = legacyFetchRow(tierData, startTimeI)
+                    endTime, labelI = legacyFetchRow(tierData, endTimeI)
+                    label, startTimeI = legacyFetchTextRow(tierData, labelI)
+                except (ValueError, IndexError):
+                    break
+
+                label = label.strip()
+                entries.append(Interval(startTime, endTime, label))
+        else:
+            className = POINT_TIER
+            while True:
+                try:
+                    time, labelI = legacyFetchRow(tierData, startTimeI)
+                    label, startTimeI = legacyFetchTextRow(tierData, labelI)
+                except (ValueError, IndexError):
+                    break
+                label = label.strip()
+                entries.append(Point(time, label))
+
+        tierAsDict = {
+            "class": className,
+            "name": tierName,
+            "xmin": float(tierStartTime),
+            "xmax": float(tierEndTime),
+            "entries": entries,
+        }
+        tiers.append(tierAsDict)
+
+    tgDict = {"xmin": tgMin, "xmax": tgMax, "tiers": tiers}
+
+    return tgDict
+
+
+def legacyFetchRow(
+    dataStr: str, index: int, searchStr: Optional[str] = None
+) -> Tuple[str, int]:
+    if searchStr is None:
+        startIndex = index
+    else:
+        startIndex = dataStr.index(searchStr, index) + len(searchStr)
+
+    endIndex = dataStr.index("\n", startIndex)
+
+    word = dataStr[startIndex:endIndex]
+    word = word.strip()
+    if word[0] == '"' and word[-1] == '"':
+        word = word[1:-1]
+    word = word.strip()
+
+    return word, endIndex + 1
+
+
+def legacyFetchTextRow(
+    dataStr: str, index: int, searchStr: Optional[str] = None
+) -> Tuple[str, int]:
+    if searchStr is None:
+        startIndex = index
+    else:
+        startIndex = dataStr.index(searchStr, index) + len(searchStr)
+
+    # A textgrid text is ended by double quotes. Double quotes that
+    # appear in the text are escaped by a preceeding double quotes.
+    # We know we're at the end of a text if the number of double
+    # quotes is odd.
+    endIndex = startIndex + 1
+    while True:
+        quoteStartIndex = dataStr.index('"', endIndex)
+        quoteEndIndex = quoteStartIndex
+        while dataStr[quoteEndIndex] == '"':
+            quoteEndIndex += 1
+
+        endIndex = quoteEndIndex
+
+        if (quoteEndIndex - quoteStartIndex) % 2 != 0:
+            break
+
+    word = dataStr[startIndex:endIndex]
+    word = word[1:-1]  # Remove the quote marks around the text
+    word = word.strip()
+
+    word = word.replace('""', '"')  # Unescape quote marks
+
+    # Advance to the end of the line
+    endIndex = dataStr.index("\n", endIndex)
+
+    return word, endIndex + 1
+
+
+def main():
+    for fn in fns:
+        tg = scaleTextgrid(textgrid.openTextgrid(fn, True), SCALE)
+        numEntries = sum(len(tier) for tier in tg.tiers)
+
+        for format, parsers in [
+            (
+                "long_textgrid",
+                [
+                    ("regex parser", legacyParseNormalTextgrid),
+                    ("single-pass tokenizer", textgrid_io._parseNormalTextgrid),
+                ],
+            ),
+            (
+                "short_textgrid",
+                [
+                    ("_fetchRow parser", legacyParseShortTextgrid),
+                    ("line-split parser", textgrid_io._parseShortTextgrid),
+                ],
+            ),
+        ]:
+            data = textgrid_io.getTextgridAsStr(_tgToDictionary(tg), format, True)
+            print(
+                f"{format}, {fn} x{SCALE}: "
+                f"{len(data) / 1e6:.1f} MB, {numEntries} entries"
+            )
+            for name, parser in parsers:
+                duration = min(
+                    timeit.repeat(lambda: parser(data), number=1, repeat=REPEATS)
+                )
+                print(f"{name:>24}: {duration:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
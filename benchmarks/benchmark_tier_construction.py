@@ -0,0 +1,77 @@
+"""
+Benchmarks for deriving tiers from other tiers.
+
+Times a chain of crop(), editTimestamps(), appendTier() and Textgrid.new()
+on a large textgrid.  The operations build their results with
+TextgridTier.fromSortedEntries(), which reuses entries that are known to
+be valid.  For comparison, the chain is also run with fromSortedEntries()
+swapped for the constructor and Textgrid.new() for a deepcopy, as before
+the trusted path existed.
+
+Run from the root of the repository:
+PYTHONPATH=. python benchmarks/benchmark_tier_construction.py
+"""
+import contextlib
+import copy
+import timeit
+
+from praatio import textgrid
+from praatio.data_classes.textgrid_tier import TextgridTier
+
+from _common import fixturePath, scaleTextgrid
+
+SCALE = 2000
+REPEATS = 3
+
+fn = fixturePath("mary.TextGrid")
+
+
+def chainOperations(tg: textgrid.Textgrid) -> textgrid.Textgrid:
+    half = tg.maxTimestamp / 2
+    croppedTg = tg.crop(0, half, "truncated", True)
+    shiftedTg = croppedTg.editTimestamps(1.0, "silence")
+
+    appendedTg = textgrid.Textgrid()
+    for tier in shiftedTg.tiers:
+        appendedTg.addTier(tier.appendTier(tier))
+
+    return appendedTg.new()
+
+
+@contextlib.contextmanager
+def untrustedConstruction():
+    """Build every tier with the constructor, as before fromSortedEntries()."""
+
+    def fromSortedEntries(cls, name, entries, minT=None, maxT=None, errorMode="warning"):
+        return cls(name, entries, minT, maxT)
+
+    trustedFromSortedEntries = TextgridTier.__dict__["fromSortedEntries"]
+    trustedNew = textgrid.Textgrid.new
+    TextgridTier.fromSortedEntries = classmethod(fromSortedEntries)  # type: ignore
+    textgrid.Textgrid.new = copy.deepcopy  # type: ignore
+    try:
+        yield
+    finally:
+        TextgridTier.fromSortedEntries = trustedFromSortedEntries  # type: ignore
+        textgrid.Textgrid.new = trustedNew  # type: ignore
+
+
+def main():
+    tg = scaleTextgrid(textgrid.openTextgrid(fn, True), SCALE)
+    numEntries = sum(len(tier) for tier in tg.tiers)
+    print(f"{fn} x{SCALE}: {numEntries} entries")
+
+    with untrustedConstruction():
+        expectedTg = chainOperations(tg)
+        baseline = min(
+            timeit.repeat(lambda: chainOperations(tg), number=1, repeat=REPEATS)
+        )
+    print(f"{'constructor':>20}: {baseline:.3f}s")
+
+    assert chainOperations(tg) == expectedTg
+    duration = min(timeit.repeat(lambda: chainOperations(tg), number=1, repeat=REPEATS))
+    print(f"{'fromSortedEntries':>20}: {duration:.3f}s ({baseline / duration:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
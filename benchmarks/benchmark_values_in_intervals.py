@@ -0,0 +1,106 @@
+"""
+Benchmarks for splitting up sampled data (e.g. a pitch track) by interval.
+
+Times IntervalTier.getValuesInIntervals() for a long track of samples
+over a tier with many intervals.  Samples that are already sorted by
+time are merged with the intervals in one pass; the time column can also
+be passed on its own (as an array, or a numpy column if numpy is
+installed).  For comparison, it is also run as before: first by sorting
+the samples and binary searching them for each interval, and originally
+by scanning all of the samples for each interval with
+utils.getValuesInInterval().  The scan is only timed for a subset of the
+intervals, as it takes too long for all of them, and scaled up.
+
+Run from the root of the repository:
+PYTHONPATH=. python benchmarks/benchmark_values_in_intervals.py
+"""
+import bisect
+import timeit
+from array import array
+
+from praatio import textgrid
+from praatio.utilities import utils
+
+NUM_SAMPLES = 100000
+NUM_INTERVALS = 10000
+NUM_SCANNED_INTERVALS = 100
+REPEATS = 3
+
+
+def legacyScan(tier: textgrid.IntervalTier, dataTupleList, entries=None):
+    entries = tier.entries if entries is None else entries
+    return [
+        (interval, utils.getValuesInInterval(dataTupleList, interval.start, interval.end))
+        for interval in entries
+    ]
+
+
+def legacySortAndSearch(tier: textgrid.IntervalTier, dataTupleList):
+    dataTupleList = list(dataTupleList)
+    order = sorted(range(len(dataTupleList)), key=lambda i: dataTupleList[i][0])
+    times = [dataTupleList[i][0] for i in order]
+
+    returnList = []
+    for interval in tier.entries:
+        lo = bisect.bisect_left(times, interval.start)
+        hi = bisect.bisect_right(times, interval.end)
+        intervalDataList = [dataTupleList[i] for i in sorted(order[lo:hi])]
+        returnList.append((interval, intervalDataList))
+
+    return returnList
+
+
+def main():
+    # Intervals of 0.5s with 0.5s gaps; samples every 0.1s
+    tier = textgrid.IntervalTier(
+        "words", [(i, i + 0.5, "word") for i in range(NUM_INTERVALS)]
+    )
+    dataList = [
+        (i * NUM_INTERVALS / NUM_SAMPLES, i % 300, i % 70) for i in range(NUM_SAMPLES)
+    ]
+    times = array("d", [dataTuple[0] for dataTuple in dataList])
+    print(f"{NUM_SAMPLES} samples over {NUM_INTERVALS} intervals")
+
+    expected = legacySortAndSearch(tier, dataList)
+    subset = tier.entries[:NUM_SCANNED_INTERVALS]
+    assert legacyScan(tier, dataList, subset) == expected[:NUM_SCANNED_INTERVALS]
+    assert tier.getValuesInIntervals(dataList) == expected
+    assert tier.getValuesInIntervals(dataList, times) == expected
+
+    scanned = min(
+        timeit.repeat(
+            lambda: legacyScan(tier, dataList, subset), number=1, repeat=REPEATS
+        )
+    )
+    baseline = scanned * NUM_INTERVALS / NUM_SCANNED_INTERVALS
+    print(f"{'scan each interval':>24}: {baseline:.3f}s (scaled up)")
+
+    cases = [
+        ("sort and search", lambda: legacySortAndSearch(tier, dataList)),
+        ("merge", lambda: tier.getValuesInIntervals(dataList)),
+        ("merge, array times", lambda: tier.getValuesInIntervals(dataList, times)),
+    ]
+    try:
+        import numpy
+    except ImportError:
+        print("numpy is not installed; skipping the numpy time column")
+    else:
+        data = numpy.array(dataList)
+        assert [
+            (interval, [tuple(row) for row in rows])
+            for interval, rows in tier.getValuesInIntervals(data, data[:, 0])
+        ] == expected
+        cases.append(
+            (
+                "merge, numpy times",
+                lambda: tier.getValuesInIntervals(data, data[:, 0]),
+            )
+        )
+
+    for name, run in cases:
+        duration = min(timeit.repeat(run, number=1, repeat=REPEATS))
+        print(f"{name:>24}: {duration:.3f}s ({baseline / duration:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,11 +20,5 @@ if not os.path.exists(outputPath):
     os.mkdir(outputPath)
 
 originalTg = textgrid.openTextgrid(inputFN, False)
-newTg = textgrid.Textgrid()
-referenceTier = originalTg.getTier("word")
-for tier in originalTg.tiers:
-    if tier == referenceTier:
-        newTg.addTier(tier)
-        continue
-    newTg.addTier(tier.dejitter(referenceTier, maxDifference))
+newTg = originalTg.dejitter("word", maxDifference)
 newTg.save(outputFN, "short_textgrid", True)
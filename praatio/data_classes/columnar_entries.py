@@ -0,0 +1,255 @@
+"""
+The storage for the entries of a tier, one column per entry field.
+
+Timestamps (and other numeric fields) are stored in arrays of doubles
+and labels in a list, instead of as one NamedTuple per entry.  A tier
+with a million intervals takes around 40 MB this way, rather than
+around 150 MB as a list of Intervals.
+
+Labels can also be stored categorically: as a vocabulary of the distinct
+labels and one integer code per entry.  Phone and word tiers only use a
+few distinct labels, so this shrinks them further, and labels can be
+compared by their code.
+
+Entries are read back as NamedTuples, created when they are accessed.
+"""
+import functools
+from array import array
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    MutableSequence,
+    Optional,
+    Type,
+    TypeVar,
+    overload,
+)
+
+from praatio.utilities import errors
+from praatio.utilities.constants import Interval, Point, KlattPoint
+
+EntryType = TypeVar("EntryType", Point, Interval, KlattPoint)
+
+# An array of doubles (or of label codes) or a list of labels
+Column = MutableSequence[Any]
+
+
+class ColumnarEntries(MutableSequence[EntryType], Generic[EntryType]):
+    """A list of entries, stored column by column.
+
+    Behaves like a list of entries of type /entryType/.  Entries must
+    already be valid; they are not converted or checked.
+
+    If /categorical/ is True, labels are stored as codes into
+    /vocabulary/, the list of distinct labels in the order they were
+    first seen.
+    """
+
+    def __init__(
+        self,
+        entryType: Type[EntryType],
+        entries: Iterable[EntryType] = (),
+        categorical: bool = False,
+    ):
+        self.entryType: Type[EntryType] = entryType
+        # Fields annotated as floats are stored in arrays, others in lists
+        self._isNumeric = [
+            fieldType is float for fieldType in entryType.__annotations__.values()
+        ]
+        self._makeEntry: Callable[[Iterable[Any]], EntryType] = functools.partial(
+            tuple.__new__, entryType
+        )
+
+        self.vocabulary: Optional[List[str]] = None
+        self._labelCodes: Dict[str, int] = {}
+        if categorical:
+            if "label" not in entryType._fields:
+                raise errors.ArgumentError(
+                    f"{entryType.__name__} entries have no labels to store categorically."
+                )
+            self._labelIndex = entryType._fields.index("label")
+            self.vocabulary = []
+
+        if (
+            isinstance(entries, ColumnarEntries)
+            and entries.entryType is entryType
+            and entries.isCategorical == categorical
+        ):
+            self._columns: List[Column] = [column[:] for column in entries._columns]
+            if entries.vocabulary is not None:
+                self.vocabulary = entries.vocabulary[:]
+                self._labelCodes = dict(entries._labelCodes)
+        else:
+            self._columns = self._toColumns(list(entries))
+
+    @property
+    def isCategorical(self) -> bool:
+        return self.vocabulary is not None
+
+    def _encodeLabel(self, label: str) -> int:
+        code = self._labelCodes.get(label)
+        if code is None:
+            code = self._labelCodes[label] = len(self._labelCodes)
+            self.vocabulary.append(label)  # type: ignore[union-attr]
+
+        return code
+
+    def labelCode(self, label: str) -> Optional[int]:
+        """The code of /label/ in the vocabulary, or None if it isn't in it."""
+        return self._labelCodes.get(label)
+
+    def _encode(self, entry: Iterable[Any]) -> List[Any]:
+        """The field values of /entry/, as they are stored."""
+        values = list(entry)
+        if self.vocabulary is not None:
+            values[self._labelIndex] = self._encodeLabel(values[self._labelIndex])
+
+        return values
+
+    def _decode(self, columns: List[Any]) -> List[Any]:
+        """The columns (or values of one entry), with labels instead of codes."""
+        if self.vocabulary is None:
+            return columns
+
+        decoded = list(columns)
+        codes = decoded[self._labelIndex]
+        if isinstance(codes, int):
+            decoded[self._labelIndex] = self.vocabulary[codes]
+        else:
+            decoded[self._labelIndex] = map(self.vocabulary.__getitem__, codes)
+
+        return decoded
+
+    def _toColumns(self, entries: List[Any]) -> List[Column]:
+        columns: List[Column] = []
+        for i, isNumeric in enumerate(self._isNumeric):
+            values = [entry[i] for entry in entries]
+            if isNumeric:
+                columns.append(array("d", values))
+            elif self.vocabulary is not None and i == self._labelIndex:
+                columns.append(array("I", map(self._encodeLabel, values)))
+            else:
+                columns.append(values)
+
+        return columns
+
+    def column(self, i: int) -> Column:
+        """The values of the /i/th field of all entries.
+
+        The column is returned as it is stored, not as a copy.
+        Don't modify it.  For categorical entries, the label column
+        holds the codes of the labels in /vocabulary/.
+        """
+        return self._columns[i]
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def __iter__(self) -> Iterator[EntryType]:
+        return map(self._makeEntry, zip(*self._decode(self._columns)))
+
+    def __reversed__(self) -> Iterator[EntryType]:
+        return map(
+            self._makeEntry,
+            zip(*self._decode([reversed(column) for column in self._columns])),
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> EntryType:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[EntryType]:
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(
+                map(
+                    self._makeEntry,
+                    zip(*self._decode([column[index] for column in self._columns])),
+                )
+            )
+        return self._makeEntry(self._decode([column[index] for column in self._columns]))
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            newColumns = self._toColumns(list(value))
+            for column, newColumn in zip(self._columns, newColumns):
+                column[index] = newColumn
+        else:
+            for column, fieldValue in zip(self._columns, self._encode(value)):
+                column[index] = fieldValue
+
+    def __delitem__(self, index) -> None:
+        for column in self._columns:
+            del column[index]
+
+    def insert(self, index: int, value: EntryType) -> None:
+        for column, fieldValue in zip(self._columns, self._encode(value)):
+            column.insert(index, fieldValue)
+
+    def append(self, value: EntryType) -> None:
+        for column, fieldValue in zip(self._columns, self._encode(value)):
+            column.append(fieldValue)
+
+    def extend(self, values: Iterable[EntryType]) -> None:
+        if (
+            isinstance(values, ColumnarEntries)
+            and not values.isCategorical
+            and not self.isCategorical
+        ):
+            newColumns = values._columns
+        else:
+            newColumns = self._toColumns(list(values))
+        for column, newColumn in zip(self._columns, newColumns):
+            column.extend(newColumn)
+
+    def sort(self, key: Any = None, reverse: bool = False) -> None:
+        self._columns = self._toColumns(sorted(self, key=key, reverse=reverse))
+
+    def copy(self) -> "ColumnarEntries[EntryType]":
+        return ColumnarEntries(self.entryType, self, self.isCategorical)
+
+    def __add__(self, other: Iterable[EntryType]) -> "ColumnarEntries[EntryType]":
+        combined = self.copy()
+        combined.extend(other)
+        return combined
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (ColumnarEntries, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            entry == otherEntry for entry, otherEntry in zip(self, other)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __reduce__(self):
+        return (
+            _restoreColumnarEntries,
+            (self.entryType, self._columns, self.vocabulary),
+        )
+
+
+def _restoreColumnarEntries(
+    entryType: Type[EntryType],
+    columns: List[Column],
+    vocabulary: Optional[List[str]] = None,
+) -> ColumnarEntries[EntryType]:
+    entries: ColumnarEntries[EntryType] = ColumnarEntries(
+        entryType, categorical=vocabulary is not None
+    )
+    entries._columns = columns
+    if vocabulary is not None:
+        entries.vocabulary = vocabulary
+        entries._labelCodes = {label: code for code, label in enumerate(vocabulary)}
+    return entries
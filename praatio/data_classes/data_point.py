@@ -7,11 +7,11 @@ PointObject2D stores temporal data and some other data (eg pitch).  It's not
 so different from a PointTier, except that PointTiers specifically hold annotation
 data.
 """
-import io
 from typing import List, Optional, Tuple, Iterable
 
 from praatio.utilities import constants
 from praatio.utilities import errors
+from praatio.utilities import utils
 
 
 class PointObject:
@@ -66,7 +66,7 @@ class PointObject:
 
         outputStr = u"%s\n%s\n" % (header, strPoints)
 
-        with io.open(fn, "w", encoding="utf-8") as fd:
+        with utils.openFile(fn, "w", encoding="utf-8") as fd:
             fd.write(outputStr)
 
     def getPointsInInterval(
@@ -0,0 +1,238 @@
+"""
+An index of the intervals of one or more IntervalTiers, for finding the
+intervals that overlap with, contain, or are contained in a time range.
+
+The tiers may overlap with each other (e.g. the same words annotated by
+different annotators), so the intervals can't simply be binary searched.
+Instead, they are stored as an implicit interval tree: sorted by start
+time, with each position of the sorted array acting as a node of a
+balanced binary tree that knows the latest end time below it.  A query
+only visits the subtrees that could hold a match, so it takes
+O(log n + k) time for k matches, rather than comparing every interval.
+"""
+import bisect
+from typing import Iterable, List, NamedTuple, Tuple, Union
+
+from praatio.utilities.constants import Interval
+from praatio.utilities import errors
+from praatio.utilities import utils
+
+from praatio.data_classes.interval_tier import IntervalTier
+
+# Subtrees this deep or shallower are scanned rather than searched
+_SCAN_DEPTH = 3
+
+
+class IndexedInterval(NamedTuple):
+    """An interval found by an IntervalIndex and the index of its tier."""
+
+    tierIndex: int
+    interval: Interval
+
+
+class IntervalIndex:
+    """An index of the intervals in one or more IntervalTiers.
+
+    The index is a snapshot: later changes to the tiers are not seen.
+
+    Queries return IndexedIntervals, ordered by start time, then end
+    time, then tier.  tierIndex is the position of the interval's tier
+    in the tiers the index was built from, so tiers with the same name
+    (e.g. from different annotators' textgrids) can be told apart.
+    """
+
+    def __init__(self, tiers: Union[IntervalTier, Iterable[IntervalTier]]):
+        """
+        Args:
+            tiers: the tier or tiers to index
+
+        Raises:
+            IncompatibleTierError: one of the tiers is not an IntervalTier
+        """
+        if isinstance(tiers, IntervalTier):
+            tiers = [tiers]
+
+        entries: List[Tuple[float, float, int, str]] = []
+        for tierIndex, tier in enumerate(tiers):
+            if not isinstance(tier, IntervalTier):
+                raise errors.IncompatibleTierError(tier)
+            entries.extend(
+                (start, end, tierIndex, label) for start, end, label in tier
+            )
+        entries.sort()
+
+        self._starts = [entry[0] for entry in entries]
+        self._ends = [entry[1] for entry in entries]
+        self._entries = [
+            IndexedInterval(tierIndex, Interval(start, end, label))
+            for start, end, tierIndex, label in entries
+        ]
+        self._maxEnds, self._depth = self._buildTree(self._ends)
+
+    @staticmethod
+    def _buildTree(ends: List[float]) -> Tuple[List[float], int]:
+        """The latest end time in the subtree under each node, and the tree's depth.
+
+        The node at position i of the sorted intervals is at depth k, where
+        k is the number of trailing 1 bits of i.  Its children are at
+        i - 2**(k-1) and i + 2**(k-1), which may be past the end of the
+        array for the last nodes; then, the latest end time of the
+        nodes there that do exist is used.
+        """
+        numEntries = len(ends)
+        maxEnds = list(ends)
+        if numEntries == 0:
+            return maxEnds, 0
+
+        # The last leaf, and the latest end time under the last node
+        # seen at each depth, for nodes whose right child is missing
+        lastI = (numEntries - 1) & ~1
+        lastMaxEnd = maxEnds[lastI]
+
+        k = 1
+        while 1 << k <= numEntries:
+            x = 1 << (k - 1)
+            for i in range((x << 1) - 1, numEntries, x << 2):
+                rightMaxEnd = maxEnds[i + x] if i + x < numEntries else lastMaxEnd
+                maxEnds[i] = max(ends[i], maxEnds[i - x], rightMaxEnd)
+
+            lastI = lastI - x if (lastI >> k) & 1 else lastI + x
+            if lastI < numEntries:
+                lastMaxEnd = max(lastMaxEnd, maxEnds[lastI])
+            k += 1
+
+        return maxEnds, k - 1
+
+    def _findTouching(self, start: float, end: float) -> List[int]:
+        """The positions of the intervals that overlap or touch [start, end]."""
+        starts = self._starts
+        ends = self._ends
+        maxEnds = self._maxEnds
+        numEntries = len(starts)
+
+        found: List[int] = []
+        # Nodes to visit: (depth, position, whether the left child is done)
+        stack = [(self._depth, (1 << self._depth) - 1, False)]
+        while stack:
+            k, x, leftDone = stack.pop()
+            if k <= _SCAN_DEPTH:
+                i = x >> k << k
+                stop = min(i + (1 << (k + 1)) - 1, numEntries)
+                while i < stop and starts[i] <= end:
+                    if ends[i] >= start:
+                        found.append(i)
+                    i += 1
+            elif not leftDone:
+                stack.append((k, x, True))
+                leftChild = x - (1 << (k - 1))
+                if leftChild >= numEntries or maxEnds[leftChild] >= start:
+                    stack.append((k - 1, leftChild, False))
+            elif x < numEntries and starts[x] <= end:
+                if ends[x] >= start:
+                    found.append(x)
+                stack.append((k - 1, x + (1 << (k - 1)), False))
+
+        return found
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def findOverlapping(
+        self,
+        start: float,
+        end: float,
+        percentThreshold: float = 0,
+        timeThreshold: float = 0,
+        boundaryInclusive: bool = False,
+    ) -> List[IndexedInterval]:
+        """Find the intervals that overlap with the interval [start, end].
+
+        Overlap is judged as in utils.intervalOverlapCheck().
+
+        Args:
+            start: the start of the query interval
+            end: the end of the query interval
+            percentThreshold: if greater than 0, intervals must overlap
+                by at least this fraction of the time spanned by both
+                intervals
+            timeThreshold: if greater than 0, intervals must overlap by
+                at least this much time
+            boundaryInclusive: if True, intervals that only share a
+                boundary with the query interval also overlap with it
+
+        Returns:
+            the intervals that overlap
+        """
+        queryInterval = Interval(start, end, "")
+        return [
+            self._entries[i]
+            for i in self._findTouching(start, end)
+            if utils.intervalOverlapCheck(
+                queryInterval,
+                self._entries[i].interval,
+                percentThreshold,
+                timeThreshold,
+                boundaryInclusive,
+            )
+        ]
+
+    def findWithin(self, start: float, end: float) -> List[IndexedInterval]:
+        """Find the intervals that lie entirely within [start, end]."""
+        lo = bisect.bisect_left(self._starts, start)
+        hi = bisect.bisect_right(self._starts, end)
+        return [self._entries[i] for i in range(lo, hi) if self._ends[i] <= end]
+
+    def findContaining(self, start: float, end: float) -> List[IndexedInterval]:
+        """Find the intervals that entirely contain [start, end]."""
+        return [
+            self._entries[i]
+            for i in self._findTouching(end, end)
+            if self._starts[i] <= start
+        ]
+
+    def findAt(self, time: float, boundaryInclusive: bool = False) -> List[IndexedInterval]:
+        """Find the intervals that contain a point in time.
+
+        Args:
+            time: the time to look up
+            boundaryInclusive: if False, an interval contains the times
+                from its start up to, but not including, its end, as in
+                IntervalTier.indicesAt().  If True, it also contains its end.
+
+        Returns:
+            the intervals that contain /time/
+        """
+        return [
+            self._entries[i]
+            for i in self._findTouching(time, time)
+            if boundaryInclusive or time < self._ends[i]
+        ]
+
+    def findOverlappingPairs(
+        self,
+        percentThreshold: float = 0,
+        timeThreshold: float = 0,
+        boundaryInclusive: bool = False,
+    ) -> List[Tuple[IndexedInterval, IndexedInterval]]:
+        """Find every pair of intervals from different tiers that overlap.
+
+        See findOverlapping() for the arguments.  Each pair is found
+        once, with the interval from the earlier tier first.
+
+        Returns:
+            the pairs of overlapping intervals
+        """
+        pairs: List[Tuple[IndexedInterval, IndexedInterval]] = []
+        for entry in self._entries:
+            interval = entry.interval
+            for match in self.findOverlapping(
+                interval.start,
+                interval.end,
+                percentThreshold,
+                timeThreshold,
+                boundaryInclusive,
+            ):
+                if entry.tierIndex < match.tierIndex:
+                    pairs.append((entry, match))
+
+        return pairs
@@ -1,6 +1,8 @@
 """
 An IntervalTier is a tier containing an array of intervals -- data that spans a period of time.
 """
+import bisect
+import heapq
 from typing import List, Tuple, Optional, Iterable, Callable, Sequence, Any
 from typing_extensions import Literal
 from itertools import chain
@@ -51,6 +53,28 @@ class IntervalTier(TextgridTier[Interval]):
     def timestamps(self) -> List[float]:
         return sorted(set(chain.from_iterable(entry[:2] for entry in self._entries)))
 
+    def _findOverlappingEntries(self, start: float, end: float) -> Tuple[int, int]:
+        """Find the entries that overlap with the region (start, end).
+
+        Uses a binary search, since entries are sorted and don't overlap.
+
+        Returns:
+            the range of indices [lo, hi) of the overlapping entries
+        """
+        lo = self._findTime(start)
+        # Only the entry before can start before /start/ and still overlap
+        if lo > 0 and self._entries[lo - 1].end > start:
+            lo -= 1
+        hi = self._findTime(end)
+
+        return lo, max(lo, hi)
+
+    def _isDisjoint(self, entries: Sequence[Interval]) -> bool:
+        return all(entry.start < entry.end for entry in entries) and all(
+            entry.end <= nextEntry.start
+            for entry, nextEntry in zip(entries, entries[1:])
+        )
+
     def crop(
         self,
         cropStart: float,
@@ -87,8 +111,9 @@ class IntervalTier(TextgridTier[Interval]):
                 f"Crop error: start time ({cropStart}) must occur before end time ({cropEnd})"
             )
 
+        lo, hi = self._findOverlappingEntries(cropStart, cropEnd)
         newEntries = utils.getIntervalsInInterval(
-            cropStart, cropEnd, self.entries, mode
+            cropStart, cropEnd, self._entries[lo:hi], mode
         )
 
         if rebaseToZero:
@@ -101,7 +126,7 @@ class IntervalTier(TextgridTier[Interval]):
             minT = cropStart
             maxT = cropEnd
 
-        return self.new(entries=newEntries, minTimestamp=minT, maxTimestamp=maxT)
+        return self.fromSortedEntries(self.name, newEntries, minT, maxT)
 
     def dejitter(
         self,
@@ -123,13 +148,16 @@ class IntervalTier(TextgridTier[Interval]):
 
         Returns:
             the modified version of the current tier
+
+        Raises:
+            ValueError: The reference tier is empty and this tier is not.
         """
         referenceTimestamps = referenceTier.timestamps
 
         newEntries: List[Interval] = []
         for start, end, label in self.entries:
-            startCompare = min(referenceTimestamps, key=lambda x: abs(x - start))
-            endCompare = min(referenceTimestamps, key=lambda x: abs(x - end))
+            startCompare = utils.getNearestValue(start, referenceTimestamps)
+            endCompare = utils.getNearestValue(end, referenceTimestamps)
             if my_math.lessThanOrEqual(abs(start - startCompare), maxDifference):
                 start = startCompare
             if my_math.lessThanOrEqual(abs(end - endCompare), maxDifference):
@@ -150,15 +178,32 @@ class IntervalTier(TextgridTier[Interval]):
         Returns:
             the modified version of the current tier
         """
-        retTier = self.new()
-
-        for entry in tier.entries:
-            retTier = retTier.eraseRegion(
-                entry.start,
-                entry.end,
-                collisionMode=constants.EraseCollision.TRUNCATE,
-                doShrink=False,
-            )
+        # Both tiers are sorted, so a single pass over them finds,
+        # for each entry, the entries of /tier/ that overlap with it
+        otherEntries = tier._entries
+        retEntries: List[Interval] = []
+        j = 0
+        for entry in self._entries:
+            while j < len(otherEntries) and otherEntries[j].end <= entry.start:
+                j += 1
+
+            # Keep the parts of the entry between the overlapping entries
+            start = entry.start
+            k = j
+            while k < len(otherEntries) and otherEntries[k].start < entry.end:
+                if start < otherEntries[k].start:
+                    retEntries.append(Interval(start, otherEntries[k].start, entry.label))
+                start = otherEntries[k].end
+                k += 1
+
+            if start < entry.end:
+                retEntries.append(Interval(start, entry.end, entry.label))
+
+        retTier = self.fromSortedEntries(
+            self.name, retEntries, self.minTimestamp, self.maxTimestamp
+        )
+        if self.isCompact:
+            retTier.compact(self.isCategorical)
 
         return retTier
 
@@ -200,7 +245,34 @@ class IntervalTier(TextgridTier[Interval]):
 
             newEntries.append(Interval(newStart, newEnd, label))
 
-        return IntervalTier(self.name, newEntries, self.minTimestamp, self.maxTimestamp)
+        return self.fromSortedEntries(
+            self.name, newEntries, self.minTimestamp, self.maxTimestamp
+        )
+
+    def entriesAt(self, times: Iterable[float]) -> List[Optional[Interval]]:
+        """Get the interval that contains each time.
+
+        See indicesAt().  Useful for labeling frames (e.g. pitch or
+        video frames) with the phones or words they fall in.
+
+        Returns:
+            for each time, the interval that contains it, or None
+        """
+        entries = self._entries
+        return [None if i is None else entries[i] for i in self.indicesAt(times)]
+
+    def entryAt(self, time: float) -> Optional[Interval]:
+        """Get the interval that contains a time.
+
+        See indicesAt()
+
+        Returns:
+            the interval that contains the time, or None if no interval does
+        """
+        i = self._findTime(time, after=True) - 1
+        if i >= 0 and time < self._entries[i].end:
+            return self._entries[i]
+        return None
 
     def eraseRegion(
         self,
@@ -232,10 +304,17 @@ class IntervalTier(TextgridTier[Interval]):
             CollisionError: potentially raised if the interval to remove overlaps with
                             an existing interval
             WrongOption: the collisionMode is not valid
+            ArgumentError: start occurs after end
         """
         utils.validateOption("collisionMode", collisionMode, constants.EraseCollision)
 
-        matchList = self.crop(start, end, constants.CropCollision.LAX, False).entries
+        if start >= end:
+            raise errors.ArgumentError(
+                f"EraseRegion error: start time ({start}) must occur before end time ({end})"
+            )
+
+        lo, hi = self._findOverlappingEntries(start, end)
+        matchList = self._entries[lo:hi]
         newTier = self.new()
 
         if matchList:
@@ -245,25 +324,25 @@ class IntervalTier(TextgridTier[Interval]):
                     "If this was expected, consider setting the collisionMode"
                 )
 
-            # Remove all the matches from the entries
-            # Go in reverse order because we're destructively altering
-            # the order of the list (messes up index order)
-            for interval in matchList[::-1]:
-                newTier.deleteEntry(interval)
-
-            # If we're only truncating, reinsert entries on the left and
-            # right edges
-            # if categorical, it doesn't make it into the list at all
+            # If we're only truncating, keep the parts of the entries on
+            # the left and right edges that are outside of the region.
+            # If categorical, the entries are removed entirely
+            edgeEntries: List[Interval] = []
             if collisionMode == constants.EraseCollision.TRUNCATE:
                 # Check left edge
                 if matchList[0].start < start:
-                    newEntry = Interval(matchList[0].start, start, matchList[0].label)
-                    newTier.insertEntry(newEntry)
+                    edgeEntries.append(
+                        Interval(matchList[0].start, start, matchList[0].label)
+                    )
 
                 # Check right edge
                 if matchList[-1].end > end:
-                    newEntry = Interval(end, matchList[-1].end, matchList[-1].label)
-                    newTier.insertEntry(newEntry)
+                    edgeEntries.append(
+                        Interval(end, matchList[-1].end, matchList[-1].label)
+                    )
+
+            newTier._ownEntries()
+            newTier._entries[lo:hi] = edgeEntries
 
         if doShrink:
             diff = end - start
@@ -295,12 +374,19 @@ class IntervalTier(TextgridTier[Interval]):
                     # so if we've found it, move on
                     break
 
-            newTier = newTier.new(entries=newEntries, maxTimestamp=newTier.maxTimestamp - diff)
+            newTier = newTier.fromSortedEntries(
+                newTier.name,
+                newEntries,
+                newTier.minTimestamp,
+                newTier.maxTimestamp - diff,
+            )
 
         return newTier
 
     def getValuesInIntervals(
-        self, dataTupleList: Iterable[Tuple[float, ...]]
+        self,
+        dataTupleList: Iterable[Tuple[float, ...]],
+        times: Optional[Iterable[float]] = None,
     ) -> List[Tuple[Interval, List[Tuple[float, ...]]]]:
         """Return data from dataTupleList contained in labeled intervals.
 
@@ -308,14 +394,58 @@ class IntervalTier(TextgridTier[Interval]):
 
         dataTupleList should be of the form:
         [(time1, value1a, value1b,...), (time2, value2a, value2b...), ...]
+
+        Args:
+            dataTupleList: the data to split up by interval
+            times: the time of each row in dataTupleList, if the times
+                are already in their own column (e.g. the first column
+                of a numpy array).  If None, the first value of each
+                row is used.
+
+        Returns:
+            a list of (interval, data) tuples, with the data in each
+            interval in its original order
+
+        Raises:
+            ArgumentError: /times/ and /dataTupleList/ have different lengths
         """
 
-        returnList: List[Tuple[Interval, List[Tuple[float, ...]]]] = []
+        dataTupleList = list(dataTupleList)
+        if times is None:
+            timeList = [dataTuple[0] for dataTuple in dataTupleList]
+        elif hasattr(times, "tolist"):
+            # Arrays (array.array or numpy) convert to a list in one call
+            timeList = times.tolist()  # type: ignore[attr-defined]
+        else:
+            timeList = list(times)
 
-        for interval in self.entries:
-            intervalDataList = utils.getValuesInInterval(
-                dataTupleList, interval.start, interval.end
+        if len(timeList) != len(dataTupleList):
+            raise errors.ArgumentError(
+                f"Got {len(timeList)} times for {len(dataTupleList)} rows of data."
             )
+
+        returnList: List[Tuple[Interval, List[Tuple[float, ...]]]] = []
+        if utils.isSorted(timeList):
+            # Sorted data (e.g. a pitch track) can be merged with the
+            # intervals in one pass; the search for each interval starts
+            # where the previous one did, as they may share a boundary
+            lo = 0
+            for interval in self.entries:
+                lo = bisect.bisect_left(timeList, interval.start, lo)
+                hi = bisect.bisect_right(timeList, interval.end, lo)
+                returnList.append((interval, dataTupleList[lo:hi]))
+
+            return returnList
+
+        # Otherwise, order the data by time once, so the data in each
+        # interval can be found with a binary search
+        order = sorted(range(len(timeList)), key=timeList.__getitem__)
+        sortedTimes = [timeList[i] for i in order]
+        for interval in self.entries:
+            lo = bisect.bisect_left(sortedTimes, interval.start)
+            hi = bisect.bisect_right(sortedTimes, interval.end)
+            # Keep the data in its original order
+            intervalDataList = [dataTupleList[i] for i in sorted(order[lo:hi])]
             returnList.append((interval, intervalDataList))
 
         return returnList
@@ -345,6 +475,30 @@ class IntervalTier(TextgridTier[Interval]):
 
         return self._homogenizeEntries(invertedEntries, sort=False)
 
+    def indicesAt(self, times: Iterable[float]) -> List[Optional[int]]:
+        """Get the index of the interval that contains each time.
+
+        An interval contains the times from its start up to, but not
+        including, its end, so a time on the boundary between two
+        intervals belongs to the later one.  Each time is found with a
+        binary search, in any order.
+
+        Returns:
+            for each time, the index of the interval that contains it, or
+            None if the time falls in a gap or outside of all intervals
+        """
+        starts, ends = self._timeColumns()
+        indices: List[Optional[int]] = []
+        for time in times:
+            # The last interval that starts at or before /time/
+            i = bisect.bisect_right(starts, time) - 1
+            if i >= 0 and time < ends[i]:
+                indices.append(i)
+            else:
+                indices.append(None)
+
+        return indices
+
     def insertEntry(
         self,
         entry: Sequence[Any],
@@ -370,6 +524,7 @@ class IntervalTier(TextgridTier[Interval]):
             CollisionError: potentially raised if the interval to insert overlaps with
                             an existing interval
             WrongOption: the collisionMode or collisionReportingMode is not valid
+            ArgumentError: the interval starts after it ends
         """
         utils.validateOption(
             "collisionMode", collisionMode, constants.IntervalCollision
@@ -381,32 +536,35 @@ class IntervalTier(TextgridTier[Interval]):
         )
         collisionReporter = utils.getErrorReporter(collisionReportingMode)
 
+        if self._pendingEntries is not None:
+            self._pendingEntries.append(
+                (Interval.build(entry), collisionMode, collisionReportingMode)
+            )
+            return
+
         interval = Interval.build(entry)
+        if interval.start >= interval.end:
+            raise errors.ArgumentError(
+                f"The start time of an interval ({interval.start}) "
+                f"must occur before its end time ({interval.end})"
+            )
 
-        matchList = self.crop(
-            interval.start, interval.end, constants.CropCollision.LAX, False
-        )._entries
+        lo, hi = self._findOverlappingEntries(interval.start, interval.end)
+        matchList = self._entries[lo:hi]
 
         if not matchList:
-            self._entries.append(interval)
+            newInterval = interval
 
         elif collisionMode == constants.IntervalCollision.REPLACE:
-            for matchEntry in matchList:
-                self.deleteEntry(matchEntry)
-            self._entries.append(interval)
+            newInterval = interval
 
         elif collisionMode == constants.IntervalCollision.MERGE:
-            for matchEntry in matchList:
-                self.deleteEntry(matchEntry)
-            matchList.append(interval)
-            matchList.sort()  # By starting time
-
+            mergeList = sorted(matchList + [interval])  # By starting time
             newInterval = Interval(
-                min([tmpInterval.start for tmpInterval in matchList]),
-                max([tmpInterval.end for tmpInterval in matchList]),
-                "-".join([tmpInterval.label for tmpInterval in matchList]),
+                min([tmpInterval.start for tmpInterval in mergeList]),
+                max([tmpInterval.end for tmpInterval in mergeList]),
+                "-".join([tmpInterval.label for tmpInterval in mergeList]),
             )
-            self._entries.append(newInterval)
 
         else:
             raise errors.CollisionError(
@@ -416,10 +574,12 @@ class IntervalTier(TextgridTier[Interval]):
                 + " already exist"
             )
 
-        self.sort()
-        self.minTimestamp, self.maxTimestamp = self._calculateMinAndMaxTime(
-            minT=self.minTimestamp, maxT=self.maxTimestamp
-        )
+        # The entries stay sorted, with the new interval in place of any matches
+        self._ownEntries()
+        self._entries[lo:hi] = [newInterval]
+        self._invalidateLabelIndex()
+        self.minTimestamp = min(self.minTimestamp, newInterval.start)
+        self.maxTimestamp = max(self.maxTimestamp, newInterval.end)
 
         if matchList:
             collisionReporter(
@@ -515,23 +675,28 @@ class IntervalTier(TextgridTier[Interval]):
         Returns:
             IntervalTier: the modified version of the current tier
         """
+        # Sweep over both sorted tiers at once, always moving past
+        # whichever of the two current entries ends first
+        entries = self._entries
+        otherEntries = tier._entries
         retEntries: List[Interval] = []
-        for interval in tier.entries:
-            subTier = self.crop(
-                interval.start, interval.end, constants.CropCollision.TRUNCATED, False
-            )
-
-            # Combine the labels in the two tiers
-            subEntries = [
-                Interval(
-                    subInterval.start,
-                    subInterval.end,
-                    f"{subInterval.label}{demarcator}{interval.label}",
+        i = j = 0
+        while i < len(entries) and j < len(otherEntries):
+            entry = entries[i]
+            otherEntry = otherEntries[j]
+
+            start = max(entry.start, otherEntry.start)
+            end = min(entry.end, otherEntry.end)
+            if start < end:
+                # Combine the labels in the two tiers
+                retEntries.append(
+                    Interval(start, end, f"{entry.label}{demarcator}{otherEntry.label}")
                 )
-                for subInterval in subTier.entries
-            ]
 
-            retEntries.extend(subEntries)
+            if entry.end < otherEntry.end:
+                i += 1
+            else:
+                j += 1
 
         return self.new(f"{self.name}-{tier.name}", retEntries)
 
@@ -554,21 +719,25 @@ class IntervalTier(TextgridTier[Interval]):
         Returns:
             IntervalTier: the modified version of the current tier
         """
+        # Both tiers are sorted, so a single pass over them finds,
+        # for each interval, the entries of /tier/ that overlap with it
+        otherEntries = tier._entries
         retEntries: List[Interval] = []
-        for interval in self.entries:
-            subTier = tier.crop(
-                interval.start, interval.end, constants.CropCollision.TRUNCATED, False
-            )
-            if not subTier._entries:
+        j = 0
+        for interval in self._entries:
+            while j < len(otherEntries) and otherEntries[j].end <= interval.start:
+                j += 1
+
+            k = j
+            while k < len(otherEntries) and otherEntries[k].start < interval.end:
+                k += 1
+            if k == j:
                 continue
 
-            subLabel = demarcator.join([entry.label for entry in subTier.entries])
+            subLabel = demarcator.join([entry.label for entry in otherEntries[j:k]])
             label = f"{interval.label}({subLabel})"
 
-            start = min(interval.start, subTier._entries[0].start)
-            end = max(interval.end, subTier._entries[-1].end)
-
-            retEntries.append(Interval(start, end, label))
+            retEntries.append(Interval(interval.start, interval.end, label))
 
         return self.new(f"{self.name}-{tier.name}", retEntries)
 
@@ -627,6 +796,51 @@ class IntervalTier(TextgridTier[Interval]):
 
         return self.new(entries=intervals)
 
+    def union(self, tier: "IntervalTier") -> "IntervalTier":
+        """The given tier is set unioned to this tier.
+
+        All entries in the given tier are added to the current tier.
+        Overlapping entries are merged, as with insertEntry() in 'merge' mode.
+        """
+        retEntries: List[Interval] = []
+        group: List[Interval] = []
+        groupEnd = 0.0
+
+        def mergeGroup():
+            if len(group) == 1:
+                retEntries.append(group[0])
+            else:
+                retEntries.append(
+                    Interval(
+                        group[0].start,
+                        groupEnd,
+                        "-".join([entry.label for entry in group]),
+                    )
+                )
+
+        # Sweep over the entries of both tiers in order.  Entries that
+        # overlap, directly or through a chain of overlapping entries,
+        # are merged into one.
+        for entry in heapq.merge(self._entries, tier._entries):
+            if group and entry.start < groupEnd:
+                group.append(entry)
+                groupEnd = max(groupEnd, entry.end)
+            else:
+                if group:
+                    mergeGroup()
+                group = [entry]
+                groupEnd = entry.end
+        if group:
+            mergeGroup()
+
+        retTier = self.fromSortedEntries(
+            self.name, retEntries, self.minTimestamp, self.maxTimestamp
+        )
+        if self.isCompact:
+            retTier.compact(self.isCategorical)
+
+        return retTier
+
     def validate(
         self, reportingMode: Literal["silence", "warning", "error"] = "warning"
     ) -> bool:
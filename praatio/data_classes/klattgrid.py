@@ -2,13 +2,13 @@
 
 KlattGrids can be used for synthesizing and manipulating speech
 """
-import io
 from typing import List, Optional, Dict, Callable, Union, Any, TypeVar, Generic
 
 from praatio.utilities.constants import KlattPoint
 from praatio.data_classes.textgrid import BaseTextgrid
 from praatio.data_classes.textgrid_tier import TextgridTier
 from praatio.utilities import errors
+from praatio.utilities import utils
 
 
 class KlattPointTier(TextgridTier[KlattPoint]):
@@ -37,6 +37,9 @@ class KlattPointTier(TextgridTier[KlattPoint]):
     def insertEntry(self):
         raise NotImplementedError
 
+    def insertEntries(self):
+        raise NotImplementedError
+
     def insertSpace(self):
         raise NotImplementedError
 
@@ -179,6 +182,8 @@ class Klattgrid(BaseTextgrid[Union[KlattPointTier, KlattContainerTier]]):
         """
         minimumIntervalLength is used for compatibility with Textgrid.save()
             but it has no impact on a Klattgrid.
+
+        If /fn/ ends in '.gz', '.bz2' or '.xz', the file is compressed.
         """
 
         # Header
@@ -196,7 +201,7 @@ class Klattgrid(BaseTextgrid[Union[KlattPointTier, KlattContainerTier]]):
 
         outputTxt = _cleanNumericValues(outputTxt)
 
-        with io.open(fn, "w", encoding="utf-8") as fd:
+        with utils.openFile(fn, "w", encoding="utf-8") as fd:
             fd.write(outputTxt)
 
 
@@ -1,7 +1,8 @@
 """
 A PointTier is a tier containing an array of points -- data that exists at a specific point in time.
 """
-from typing import List, Tuple, Iterable, Sequence, Any
+import bisect
+from typing import List, Tuple, Optional, Iterable, Sequence, Any
 
 from typing_extensions import Literal
 
@@ -20,11 +21,19 @@ class PointTier(TextgridTier[Point]):
 
     tierType = POINT_TIER
     entryType = Point
+    # insertEntry() doesn't expand the tier's bounds to fit new points
+    _insertExpandsTimestamps = False
 
     @property
     def timestamps(self) -> List[float]:
         return sorted(set(time for time, _ in self._entries))
 
+    def _isDisjoint(self, entries: Sequence[Point]) -> bool:
+        return all(
+            entry.time != nextEntry.time
+            for entry, nextEntry in zip(entries, entries[1:])
+        )
+
     def crop(
         self,
         cropStart: float,
@@ -50,7 +59,9 @@ class PointTier(TextgridTier[Point]):
                 f"Crop error: start time ({cropStart}) must occur before end time ({cropEnd})"
             )
 
-        newEntries = [entry for entry in self._entries if cropStart <= entry.time <= cropEnd]
+        lo = self._findTime(cropStart)
+        hi = self._findTime(cropEnd, after=True)
+        newEntries = self._entries[lo:hi]
 
         if rebaseToZero:
             newEntries = [entry - cropStart for entry in newEntries]
@@ -60,10 +71,10 @@ class PointTier(TextgridTier[Point]):
             minT = cropStart
             maxT = cropEnd
 
-        return self.new(entries=newEntries, minTimestamp=minT, maxTimestamp=maxT)
+        return self.fromSortedEntries(self.name, newEntries, minT, maxT)
 
     def dejitter(
-        self, referenceTier: "PointTier", maxDifference: float = 0.001
+        self, referenceTier: TextgridTier, maxDifference: float = 0.001
     ) -> "PointTier":
         """
         Set timestamps in this tier to be the same as values in the reference tier.
@@ -80,12 +91,15 @@ class PointTier(TextgridTier[Point]):
 
         Returns:
             the modified version of the current tier
+
+        Raises:
+            ValueError: The reference tier is empty and this tier is not.
         """
         referenceTimestamps = referenceTier.timestamps
 
         newEntries: List[Point] = []
         for time, label in self.entries:
-            timeCompare = min(referenceTimestamps, key=lambda x: abs(x - time))
+            timeCompare = utils.getNearestValue(time, referenceTimestamps)
 
             if my_math.lessThanOrEqual(abs(time - timeCompare), maxDifference):
                 time = timeCompare
@@ -136,50 +150,133 @@ class PointTier(TextgridTier[Point]):
         if newMax < self.maxTimestamp:
             newMax = self.maxTimestamp
 
-        return PointTier(self.name, newEntries, newMin, newMax)
+        return self.fromSortedEntries(self.name, newEntries, newMin, newMax)
+
+    def entriesAt(self, times: Iterable[float]) -> List[Optional[Point]]:
+        """Get the nearest point to each time.
+
+        See indicesAt()
+
+        Returns:
+            for each time, the nearest point, or None if the tier is empty
+        """
+        entries = self._entries
+        return [None if i is None else entries[i] for i in self.indicesAt(times)]
 
     def getValuesAtPoints(
         self,
         dataTupleList: Iterable[Tuple[float, ...]],
         fuzzyMatching: bool = False,
+        times: Optional[Iterable[float]] = None,
+        interpolate: bool = False,
     ) -> List[Tuple[Any, ...]]:
         """Get the values that occur at points in the point tier.
 
-        The procedure assumes that all data is ordered in time.
         dataTupleList should be in the form
         [(t1, v1a, v1b, ..), (t2, v2a, v2b, ..), ..]
 
         It returns the data in the form of
         [(t1, v1a, v1b, ..), (t2, v2a, v2b), ..]
 
-        The procedure makes one pass through dataTupleList and one
-        pass through self.entries.  If the data is not sequentially
-        ordered, the incorrect response will be returned.
+        The data is found for each point with a binary search.  If the
+        times are passed in, they are used as they are if they are
+        already in order (e.g. the times of a pitch track), otherwise the
+        data is sorted first.
+
+        If several rows have the time that is found for a point, the
+        first of them is returned: the first in dataTupleList if /times/
+        is given, otherwise the smallest, as the rows are sorted as tuples.
+        This is the same for every point, exact or fuzzy matched.
 
         Args:
             dataTupleList:
             fuzzyMatching: if True, if there is not a feature value
                 at a point, the nearest feature value will be taken.
+                If two values are equally near, the earlier one is taken.
+            times: the time of each row in dataTupleList, if the times
+                are already in their own column (e.g. the first column
+                of a numpy array).  If None, the first value of each
+                row is used.
+            interpolate: if True, if there is not a feature value at a
+                point, the values are linearly interpolated from the
+                feature values before and after it.  The values must
+                be numeric.  For points before the first or after the
+                last feature value, fuzzyMatching applies.
 
         Returns:
-            A list of values that exist at the given timepoints
+            A list of values that exist at the given timepoints; an empty
+            tuple for points without a value
+
+        Raises:
+            ArgumentError: /times/ and /dataTupleList/ have different lengths
         """
+        if times is None:
+            sortedDataTupleList = sorted(dataTupleList)
+            timeList = [dataTuple[0] for dataTuple in sortedDataTupleList]
+        else:
+            sortedDataTupleList = list(dataTupleList)
+            if hasattr(times, "tolist"):
+                # Arrays (array.array or numpy) convert to a list in one call
+                timeList = times.tolist()  # type: ignore[attr-defined]
+            else:
+                timeList = list(times)
+
+            if len(timeList) != len(sortedDataTupleList):
+                raise errors.ArgumentError(
+                    f"Got {len(timeList)} times for "
+                    f"{len(sortedDataTupleList)} rows of data."
+                )
 
-        currentIndex = 0
-        retList: List[Tuple[Any, ...]] = []
+            if not utils.isSorted(timeList):
+                order = sorted(range(len(timeList)), key=timeList.__getitem__)
+                sortedDataTupleList = [sortedDataTupleList[i] for i in order]
+                timeList = [timeList[i] for i in order]
 
-        sortedDataTupleList = sorted(dataTupleList)
-        for timestamp, label in self.entries:
-            retRow, currentIndex = utils.getValueAtTime(
-                timestamp,
-                sortedDataTupleList,
-                fuzzyMatching=fuzzyMatching,
-                startI=currentIndex,
-            )
-            retList.append(retRow)
+        numRows = len(timeList)
+        retList: List[Tuple[Any, ...]] = []
+        for timestamp in self._timeColumns()[0]:
+            i = bisect.bisect_left(timeList, timestamp)
+            if i < numRows and timeList[i] == timestamp:
+                retList.append(sortedDataTupleList[i])
+            elif interpolate and 0 < i < numRows:
+                retList.append(
+                    self._interpolateRow(
+                        timestamp,
+                        timeList[i - 1],
+                        sortedDataTupleList[i - 1],
+                        timeList[i],
+                        sortedDataTupleList[i],
+                    )
+                )
+            elif not fuzzyMatching or numRows == 0:
+                retList.append(())
+            elif i < numRows and (
+                i == 0 or timeList[i] - timestamp < timestamp - timeList[i - 1]
+            ):
+                retList.append(sortedDataTupleList[i])
+            else:
+                # The first of the rows that share the earlier time
+                j = bisect.bisect_left(timeList, timeList[i - 1], 0, i)
+                retList.append(sortedDataTupleList[j])
 
         return retList
 
+    @staticmethod
+    def _interpolateRow(
+        timestamp: float,
+        beforeTime: float,
+        beforeRow: Tuple[Any, ...],
+        afterTime: float,
+        afterRow: Tuple[Any, ...],
+    ) -> Tuple[Any, ...]:
+        """The row at /timestamp/, linearly interpolated between two rows."""
+        fraction = (timestamp - beforeTime) / (afterTime - beforeTime)
+        values = [
+            before + fraction * (after - before)
+            for before, after in zip(beforeRow[1:], afterRow[1:])
+        ]
+        return (timestamp, *values)
+
     def eraseRegion(
         self,
         start: float,
@@ -201,16 +298,15 @@ class PointTier(TextgridTier[Point]):
             The modified version of the current tier
         """
 
-        newTier = self.new()
-        croppedTier = newTier.crop(start, end, constants.CropCollision.TRUNCATED, False)
-        matchList = croppedTier.entries
+        if start >= end:
+            raise errors.ArgumentError(
+                f"EraseRegion error: start time ({start}) must occur before end time ({end})"
+            )
 
-        if matchList:
-            # Remove all the matches from the entries
-            # Go in reverse order because we're destructively altering
-            # the order of the list (messes up index order)
-            for point in matchList[::-1]:
-                newTier.deleteEntry(point)
+        newTier = self.new()
+        newTier._ownEntries()
+        # Remove all the points in the region
+        del newTier._entries[self._findTime(start) : self._findTime(end, after=True)]
 
         if doShrink:
             newEntries: List[Point] = []
@@ -221,10 +317,38 @@ class PointTier(TextgridTier[Point]):
                 elif point.time > end:
                     newEntries.append(point - diff)
 
-            newTier = newTier.new(entries=newEntries, maxTimestamp=newTier.maxTimestamp - diff)
+            newTier = newTier.fromSortedEntries(
+                newTier.name,
+                newEntries,
+                newTier.minTimestamp,
+                newTier.maxTimestamp - diff,
+            )
 
         return newTier
 
+    def indicesAt(self, times: Iterable[float]) -> List[Optional[int]]:
+        """Get the index of the nearest point to each time.
+
+        If two points are equally close, the earlier one is chosen.  Each
+        time is found with a binary search, in any order.
+
+        Returns:
+            for each time, the index of the nearest point, or None if the
+            tier is empty
+        """
+        (pointTimes,) = self._timeColumns()
+        return [self._nearestIndex(pointTimes, time) for time in times]
+
+    @staticmethod
+    def _nearestIndex(pointTimes: Sequence[float], time: float) -> Optional[int]:
+        i = bisect.bisect_left(pointTimes, time)
+        if i == len(pointTimes):
+            i -= 1
+        elif i > 0 and time - pointTimes[i - 1] <= pointTimes[i] - time:
+            i -= 1
+
+        return i if i >= 0 else None
+
     def insertEntry(
         self,
         entry: Sequence[Any],
@@ -256,27 +380,31 @@ class PointTier(TextgridTier[Point]):
         )
         collisionReporter = utils.getErrorReporter(collisionReportingMode)
 
+        if self._pendingEntries is not None:
+            self._pendingEntries.append(
+                (Point.build(entry), collisionMode, collisionReportingMode)
+            )
+            return
+
         newPoint = Point.build(entry)
 
+        i = self._findTime(newPoint.time)
         match = None
-        for point in self.entries:
-            if point.time == newPoint.time:
-                match = point
-                break
+        if i < len(self._entries) and self._entries[i].time == newPoint.time:
+            match = self._entries[i]
 
+        self._ownEntries()
         if match is None:
-            self._entries.append(newPoint)
+            self._entries.insert(i, newPoint)
 
         elif collisionMode == constants.IntervalCollision.REPLACE:
-            self.deleteEntry(match)
-            self._entries.append(newPoint)
+            self._entries[i] = newPoint
 
         elif collisionMode == constants.IntervalCollision.MERGE:
             mergedPoint = Point(
                 newPoint.time, match.label + "-" + newPoint.label
             )
-            self.deleteEntry(match)
-            self._entries.append(mergedPoint)
+            self._entries[i] = mergedPoint
 
         else:
             raise errors.CollisionError(
@@ -284,7 +412,7 @@ class PointTier(TextgridTier[Point]):
                 f"of textgrid but overlapping entry {match} already exists"
             )
 
-        self.sort()
+        self._invalidateLabelIndex()
 
         if match is not None:
             collisionReporter(
@@ -319,6 +447,20 @@ class PointTier(TextgridTier[Point]):
 
         return self.new(entries=newEntries, maxTimestamp=self.maxTimestamp + duration)
 
+    def nearest(self, time: float) -> Optional[Point]:
+        """Get the nearest point to a time.
+
+        See indicesAt()
+
+        Returns:
+            the nearest point, or None if the tier is empty
+        """
+        # Only the points either side of /time/ are needed
+        i = self._findTime(time)
+        neighbours = self._entries[max(i - 1, 0) : i + 1]
+        j = self._nearestIndex([point.time for point in neighbours], time)
+        return None if j is None else neighbours[j]
+
     def toZeroCrossings(self, wavFN: str) -> "PointTier":
         """Move all timestamps to the nearest zero crossing."""
         wav = audio.QueryWav(wavFN)
@@ -3,7 +3,6 @@ Functions for reading/writing/manipulating Textgrid classes.
 
 This is the 'heart' of praatio.
 """
-import io
 import copy
 from typing import (
     TYPE_CHECKING, Optional, Union, Tuple, List, Iterable, Any, TypeVar, Generic, overload, cast
@@ -276,7 +275,7 @@ class BaseTextgrid(Generic[TierType]):
         oldTier = self.getTier(oldName)
         tierIndex = self.tierNames.index(oldName)
         self.removeTier(oldName)
-        self.addTier(oldTier.new(newName, oldTier.entries), tierIndex)  # type: ignore
+        self.addTier(oldTier.new(newName), tierIndex)  # type: ignore
 
     def removeTier(self, name: str) -> TierType:
         """
@@ -301,6 +300,26 @@ class BaseTextgrid(Generic[TierType]):
 
 
 class Textgrid(BaseTextgrid[Union[PointTier, IntervalTier]]):
+    def new(self) -> "Textgrid":
+        """Return a copy of this Textgrid.
+
+        The tiers are copied with TextgridTier.new(), so each copy shares
+        its entries with the original tier until either one is modified.
+        """
+        newTg = copy.copy(self)
+        newTg._tierDict = OrderedDict(
+            (name, tier.new()) for name, tier in self._tierDict.items()
+        )
+        return newTg
+
+    def compact(self, categorical: bool = False) -> None:
+        """Store the entries of every tier column by column, to use less memory.
+
+        See TextgridTier.compact()
+        """
+        for tier in self.tiers:
+            tier.compact(categorical)
+
     def appendTextgrid(self, tg: "Textgrid", onlyMatchingNames: bool) -> "Textgrid":
         """Append one textgrid to the end of this one.
 
@@ -420,6 +439,37 @@ class Textgrid(BaseTextgrid[Union[PointTier, IntervalTier]]):
 
         return newTG
 
+    def dejitter(
+        self, referenceTierName: str, maxDifference: float = 0.001
+    ) -> "Textgrid":
+        """Set timestamps in all tiers to be the same as values in the reference tier.
+
+        Each tier is dejittered against the reference tier, as with
+        IntervalTier.dejitter() and PointTier.dejitter().  The reference
+        tier itself is not changed.
+
+        Args:
+            referenceTierName: the name of the tier to use as a reference
+            maxDifference: the maximum amount to allow timestamps to be moved by
+
+        Returns:
+            the modified version of the current textgrid
+
+        Raises:
+            KeyError: The referenceTierName does not exist.
+        """
+        referenceTier = self.getTier(referenceTierName)
+
+        newTG = Textgrid(self.minTimestamp, self.maxTimestamp)
+        for tier in self.tiers:
+            if tier is referenceTier:
+                newTier = tier.new()
+            else:
+                newTier = tier.dejitter(referenceTier, maxDifference)
+            newTG.addTier(newTier)
+
+        return newTG
+
     def eraseRegion(self, start: float, end: float, doShrink: bool) -> "Textgrid":
         """Make a region in a tier blank (removes all contained entries).
 
@@ -576,7 +626,14 @@ class Textgrid(BaseTextgrid[Union[PointTier, IntervalTier]]):
     def save(
         self,
         fn: str,
-        format: Literal["short_textgrid", "long_textgrid", "json", "textgrid_json"],
+        format: Literal[
+            "short_textgrid",
+            "long_textgrid",
+            "json",
+            "textgrid_json",
+            "binary_textgrid",
+            "columnar_json",
+        ],
         includeBlankSpaces: bool,
         minTimestamp: Optional[float] = None,
         maxTimestamp: Optional[float] = None,
@@ -586,11 +643,15 @@ class Textgrid(BaseTextgrid[Union[PointTier, IntervalTier]]):
         """Save the current textgrid to a file.
 
         Args:
-            fn: the fullpath filename of the output
-            format: one of ['short_textgrid', 'long_textgrid', 'json', 'textgrid_json']
-                'short_textgrid' and 'long_textgrid' are both used by praat
-                'json' and 'textgrid_json' are two json variants. 'json' cannot represent
-                tiers with different min and max timestamps than the textgrid.
+            fn: the fullpath filename of the output; if it ends in '.gz',
+                '.bz2' or '.xz', the file is compressed
+            format: one of ['short_textgrid', 'long_textgrid', 'json', 'textgrid_json',
+                'binary_textgrid', 'columnar_json']
+                'short_textgrid', 'long_textgrid' and 'binary_textgrid' are all used by praat
+                'json', 'textgrid_json' and 'columnar_json' are json variants. 'json'
+                cannot represent tiers with different min and max timestamps than the
+                textgrid. 'columnar_json' stores the timestamps and labels of each tier
+                as parallel lists, which is smaller and faster to load.
             includeBlankSpaces: if True, blank sections in interval
                 tiers will be filled in with an empty interval
                 (with a label of ""). If you are unsure, True is recommended
@@ -625,17 +686,23 @@ class Textgrid(BaseTextgrid[Union[PointTier, IntervalTier]]):
 
         tgAsDict = _tgToDictionary(self)
 
-        textgridStr = textgrid_io.getTextgridAsStr(
-            tgAsDict,
-            format,
-            includeBlankSpaces,
-            minTimestamp,
-            maxTimestamp,
-            minimumIntervalLength,
-        )
-
-        with io.open(fn, "w", encoding="utf-8") as fd:
-            fd.write(textgridStr)
+        if format == TextgridFormats.BINARY_TEXTGRID:
+            mode, encoding = "wb", None
+        else:
+            mode, encoding = "w", "utf-8"
+
+        # The file is only replaced once it has been written in full, so
+        # an error while writing doesn't leave a partial file behind
+        with utils.openFileForReplacing(fn, mode, encoding=encoding) as fd:
+            textgrid_io.writeTextgrid(
+                tgAsDict,
+                fd,
+                format,
+                includeBlankSpaces,
+                minTimestamp,
+                maxTimestamp,
+                minimumIntervalLength,
+            )
 
     def validate(
         self, reportingMode: Literal["silence", "warning", "error"] = "warning"
@@ -1,8 +1,13 @@
 """The abstract class used by all textgrid tiers."""
 import re
 import math
+import bisect
+import contextlib
+import functools
+import itertools
 from typing import (
-    Optional, Union, Tuple, List, Sequence, Type, TypeVar, Iterable, Any, Generic, overload
+    Optional, Union, Tuple, List, Dict, Sequence, Type, TypeVar, Iterable, Iterator, Callable,
+    Any, Generic, overload,
 )
 from abc import ABC, abstractmethod
 
@@ -11,6 +16,7 @@ from typing_extensions import Literal
 from praatio.utilities import constants
 from praatio.utilities import errors
 from praatio.utilities import utils
+from praatio.data_classes.columnar_entries import ColumnarEntries
 
 
 # EntryType: for defining TextgridTier as a generic container class
@@ -21,10 +27,35 @@ TextgridEntryType = TypeVar("TextgridEntryType", constants.Point, constants.Inte
 TierType = TypeVar("TierType", bound="TextgridTier")
 
 
+class _AfterEverything:
+    """Compares greater than any other value."""
+
+    def __lt__(self, other: Any) -> bool:
+        return False
+
+    def __gt__(self, other: Any) -> bool:
+        return True
+
+
+_AFTER_EVERYTHING = _AfterEverything()
+
+
+def _containsSubstring(substring: str, text: str) -> bool:
+    return substring in text
+
+
 class TextgridTier(ABC, Generic[EntryType]):
     """A container that stores and operates over interval and point tiers."""
     tierType: str
     entryType: Type[EntryType]
+    # Entries waiting to be inserted at the end of a batch(), with their modes
+    _pendingEntries: Optional[List[Tuple[Any, str, str]]] = None
+    # The indices of the entries with each label, for find(); see _getLabelIndex()
+    _labelIndex: Optional[Dict[str, List[int]]] = None
+    # True if the entries may be shared with another tier; see _ownEntries()
+    _entriesShared: bool = False
+    # True if insertEntry() expands minTimestamp and maxTimestamp to fit the entry
+    _insertExpandsTimestamps: bool = True
 
     def __init__(
         self,
@@ -51,6 +82,43 @@ class TextgridTier(ABC, Generic[EntryType]):
         self.minTimestamp, self.maxTimestamp = self._calculateMinAndMaxTime(minT=minT, maxT=maxT)
         self.errorReporter = utils.getErrorReporter(errorMode)
 
+    @classmethod
+    def fromSortedEntries(
+        cls: Type[TierType],
+        name: str,
+        entries: Iterable[EntryType],
+        minT: Optional[float] = None,
+        maxT: Optional[float] = None,
+        errorMode: Literal["silence", "warning", "error"] = "warning",
+    ) -> TierType:
+        """
+        Create a tier from entries that are already valid, skipping all checks.
+
+        Unlike the constructor, the entries are not converted, sorted, or
+        validated.  This is much faster for large tiers, but the entries must
+        be instances of the tier's entryType, with stripped labels, sorted by
+        time and, for interval tiers, not overlapping--for example, entries
+        taken from another tier.  Use the constructor for anything else.
+
+        Entries taken from a compact tier make a compact tier.
+        """
+        tier = cls.__new__(cls)
+        tier.name = name
+        if isinstance(entries, ColumnarEntries):
+            tier._entries = entries.copy()
+        else:
+            tier._entries = list(entries)
+        timestamps: List[float] = []
+        if tier._entries:
+            # The first start time and the last end time (or time) of sorted entries
+            timestamps = [tier._entries[0][0], tier._entries[-1][-2]]
+        tier.minTimestamp, tier.maxTimestamp = tier._calculateMinAndMaxTime(
+            timestamps, minT, maxT
+        )
+        tier.errorReporter = utils.getErrorReporter(errorMode)
+
+        return tier
+
     def new(
         self: TierType,
         name: Optional[str] = None,
@@ -63,16 +131,45 @@ class TextgridTier(ABC, Generic[EntryType]):
 
         Also copies, converts and sorts all entries, and expands the minT
         and maxT like the __init__ constructor.
+
+        If no entries are given, the new tier shares this tier's entries
+        rather than copying them, so this is cheap even for large tiers.
+        The entries are only copied when either tier is first modified.
         """
         if name is None:
             name = self.name
-        if entries is None:
-            entries = self._entries
         if minTimestamp is None:
             minTimestamp = self.minTimestamp
         if maxTimestamp is None:
             maxTimestamp = self.maxTimestamp
-        return type(self)(name, entries, minTimestamp, maxTimestamp)
+        if entries is not None:
+            return type(self)(name, entries, minTimestamp, maxTimestamp)
+
+        tier = self.fromSortedEntries(name, [], minTimestamp, maxTimestamp)
+        tier._entries = self._entries
+        tier._labelIndex = self._labelIndex
+        tier._entriesShared = self._entriesShared = True
+        if self._entries:
+            tier.minTimestamp, tier.maxTimestamp = tier._calculateMinAndMaxTime(
+                [self._entries[0][0], self._entries[-1][-2]],
+                minTimestamp,
+                maxTimestamp,
+            )
+
+        return tier
+
+    def _ownEntries(self) -> None:
+        """Copy the entries if they are shared, before modifying them in place.
+
+        Tiers made with new() share their entries with the original.
+        Neither tier knows when the other has made its own copy, so
+        both copy on their first modification.  The index of entries
+        by label is dropped too, as the entries are about to change.
+        """
+        if self._entriesShared:
+            self._entries = self._entries.copy()
+            self._entriesShared = False
+        self._invalidateLabelIndex()
 
     def __len__(self):
         return len(self._entries)
@@ -110,7 +207,9 @@ class TextgridTier(ABC, Generic[EntryType]):
             CollisionError: Inserted entry overlaps with an existing entry.
         """
         # First remove all selected entries.
+        self._ownEntries()
         del self._entries[index]
+        self._invalidateLabelIndex()
         # Then insert given entries.
         # Either one or multiple entries may be inserted (compatible with slicing syntax).
         # Determine which by using entryType.build to test if types match.
@@ -126,8 +225,7 @@ class TextgridTier(ABC, Generic[EntryType]):
                 )
         # No matter one or multiple entries, they are converted to a list of entries.
         # Now insert these entries.
-        for e in entries:
-            self.insertEntry(e)
+        self.insertEntries(entries)
 
     def __delitem__(self, index: Union[int, slice]):
         """Supports integer index and slicing.
@@ -135,7 +233,9 @@ class TextgridTier(ABC, Generic[EntryType]):
         Raises:
             IndexError: The index out of range.
         """
+        self._ownEntries()
         del self._entries[index]
+        self._invalidateLabelIndex()
 
     def __eq__(self, other: Any) -> bool:
         return (
@@ -154,6 +254,38 @@ class TextgridTier(ABC, Generic[EntryType]):
     def entries(self) -> Tuple[EntryType, ...]:
         return tuple(self._entries)
 
+    @property
+    def isCompact(self) -> bool:
+        """True if the entries are stored column by column.  See compact()."""
+        return isinstance(self._entries, ColumnarEntries)
+
+    @property
+    def isCategorical(self) -> bool:
+        """True if the labels are stored as codes into a vocabulary.  See compact()."""
+        return isinstance(self._entries, ColumnarEntries) and self._entries.isCategorical
+
+    def compact(self, categorical: bool = False) -> None:
+        """Store the entries column by column, to use less memory.
+
+        Timestamps are kept in arrays of doubles and labels in a list,
+        instead of as one Interval or Point per entry.  This takes about
+        a third of the memory, which matters when holding whole corpora
+        in memory.  Entries are still read as Intervals or Points, but
+        they are created whenever they are accessed, so most operations
+        are slower on a compact tier.
+
+        If /categorical/ is True, the labels are instead kept as a
+        vocabulary of the distinct labels and an integer code per entry.
+        This suits tiers with few distinct labels, like phone tiers, and
+        lets find() match each distinct label once, instead of each entry.
+
+        Copies made with new() are compact too; other derived tiers
+        (e.g. from crop()) are not.
+        """
+        if not self.isCompact or self.isCategorical != categorical:
+            self._entries = ColumnarEntries(self.entryType, self._entries, categorical)
+            self._entriesShared = False
+
     @property
     @abstractmethod
     def timestamps(self) -> List[float]:  # pragma: no cover
@@ -192,7 +324,42 @@ class TextgridTier(ABC, Generic[EntryType]):
         # of the same data type.  The entry list is sorted whenever
         # the entry list is modified, so this is probably the best
         # place to enforce the data type
-        self._entries = self._homogenizeEntries(self._entries)
+        entries = self._homogenizeEntries(self._entries)
+        self._invalidateLabelIndex()
+        if self.isCompact:
+            self._entries = ColumnarEntries(self.entryType, entries, self.isCategorical)
+        else:
+            self._entries = entries
+        self._entriesShared = False
+
+    def _findTime(self, time: float, after: bool = False) -> int:
+        """Find where /time/ falls among the entries, with a binary search.
+
+        Returns the index of the first entry whose (start) time is at or
+        after /time/, or, if /after/ is True, strictly after it.
+        """
+        if isinstance(self._entries, ColumnarEntries):
+            times = self._entries.column(0)
+            if after:
+                return bisect.bisect_right(times, time)
+            return bisect.bisect_left(times, time)
+
+        # Entries are tuples, so (time,) sorts before any entry with
+        # this (start) time and (time, _AFTER_EVERYTHING) sorts after them
+        if after:
+            return bisect.bisect_left(self._entries, (time, _AFTER_EVERYTHING))
+        return bisect.bisect_left(self._entries, (time,))
+
+    def _timeColumns(self) -> List[Sequence[float]]:
+        """The timestamps of all entries, one sequence per field before the label.
+
+        For compact tiers these are the stored columns, otherwise they
+        are built, so use them for many lookups at once.
+        """
+        numTimes = len(self.entryType._fields) - 1
+        if isinstance(self._entries, ColumnarEntries):
+            return [self._entries.column(i) for i in range(numTimes)]
+        return [[entry[i] for entry in self._entries] for i in range(numTimes)]
 
     def _calculateMinAndMaxTime(
         self,
@@ -234,9 +401,14 @@ class TextgridTier(ABC, Generic[EntryType]):
             self.maxTimestamp, constants.ErrorReportingMode.SILENCE
         )
 
-        return self.new(
-            entries=self._entries + appendTier._entries,
-            maxTimestamp=self.maxTimestamp + tier.maxTimestamp,
+        # The appended entries all come after this tier's entries
+        entries = self._entries.copy()
+        entries.extend(appendTier._entries)
+        return self.fromSortedEntries(
+            self.name,
+            entries,
+            self.minTimestamp,
+            self.maxTimestamp + tier.maxTimestamp,
         )
 
     def find(
@@ -247,6 +419,11 @@ class TextgridTier(ABC, Generic[EntryType]):
     ) -> List[int]:
         """Return the index of all intervals that match the given label.
 
+        The first search builds an index of the entries by label, which
+        later searches reuse until the tier is modified.  Substrings and
+        regular expressions are matched once for each distinct label,
+        rather than for each entry.
+
         Args:
             matchLabel: the label to search for
             substrMatchFlag: if True, match any label containing matchLabel.
@@ -256,22 +433,78 @@ class TextgridTier(ABC, Generic[EntryType]):
         Returns:
             A list of indicies
         """
-        returnList: List[int] = []
+        # A function that is truthy for matching labels, or None for exact matches
+        isMatch: Optional[Callable[[str], Any]] = None
         if usingRE:
-            for i, entry in enumerate(self.entries):
-                matchList = re.findall(matchLabel, entry.label, re.I)
-                if matchList != []:
-                    returnList.append(i)
+            isMatch = re.compile(matchLabel, re.I).search
+        elif substrMatchFlag:
+            isMatch = functools.partial(_containsSubstring, matchLabel)
+
+        if self.isCategorical:
+            return self._findCategorical(matchLabel, isMatch)
+
+        labelIndex = self._getLabelIndex()
+        if isMatch is None:
+            return list(labelIndex.get(matchLabel, []))
+
+        return sorted(
+            itertools.chain.from_iterable(
+                indices for label, indices in labelIndex.items() if isMatch(label)
+            )
+        )
+
+    def findAll(
+        self: "TextgridTier[TextgridEntryType]",
+        matchLabels: Iterable[str],
+        substrMatchFlag: bool = False,
+        usingRE: bool = False,
+    ) -> Dict[str, List[int]]:
+        """Find many labels at once.
+
+        Args:
+            matchLabels: the labels to search for
+            substrMatchFlag: see find()
+            usingRE: see find()
+
+        Returns:
+            A dictionary from each label to the list of indicies that
+            find() returns for it
+        """
+        return {
+            matchLabel: self.find(matchLabel, substrMatchFlag, usingRE)
+            for matchLabel in matchLabels
+        }
+
+    def _getLabelIndex(self) -> Dict[str, List[int]]:
+        """The indices of the entries with each label, built when first needed."""
+        if self._labelIndex is None:
+            labelIndex: Dict[str, List[int]] = {}
+            for i, entry in enumerate(self._entries):
+                labelIndex.setdefault(entry[-1], []).append(i)
+            self._labelIndex = labelIndex
+
+        return self._labelIndex
+
+    def _invalidateLabelIndex(self) -> None:
+        """Drop the index of entries by label, after the entries are modified."""
+        self._labelIndex = None
+
+    def _findCategorical(
+        self, matchLabel: str, isMatch: Optional[Callable[[str], Any]]
+    ) -> List[int]:
+        """find() for categorical tiers, matching each label in the vocabulary once."""
+        entries: ColumnarEntries = self._entries  # type: ignore[assignment]
+        if isMatch is None:
+            matchingCodes = {entries.labelCode(matchLabel)}
         else:
-            for i, entry in enumerate(self.entries):
-                if not substrMatchFlag:
-                    if entry.label == matchLabel:
-                        returnList.append(i)
-                else:
-                    if matchLabel in entry.label:
-                        returnList.append(i)
+            matchingCodes = {
+                code
+                for code, label in enumerate(entries.vocabulary)  # type: ignore[arg-type]
+                if isMatch(label)
+            }
 
-        return returnList
+        # The label is the last field of Intervals and Points
+        return [i for i, code in enumerate(entries.column(-1)) if code in matchingCodes]
 
     def union(self: TierType, tier: TierType) -> TierType:
         """The given tier is set unioned to this tier.
@@ -280,15 +513,11 @@ class TextgridTier(ABC, Generic[EntryType]):
         Overlapping entries are merged.
         """
         retTier = self.new()
-
-        for entry in tier.entries:
-            retTier.insertEntry(
-                entry,
-                collisionMode=constants.IntervalCollision.MERGE,
-                collisionReportingMode=constants.ErrorReportingMode.SILENCE,
-            )
-
-        retTier.sort()
+        retTier.insertEntries(
+            tier.entries,
+            collisionMode=constants.IntervalCollision.MERGE,
+            collisionReportingMode=constants.ErrorReportingMode.SILENCE,
+        )
 
         return retTier
 
@@ -309,6 +538,125 @@ class TextgridTier(ABC, Generic[EntryType]):
     ) -> None:  # pragma: no cover
         pass
 
+    def insertEntries(
+        self,
+        entries: Iterable[Sequence[Any]],
+        collisionMode: Literal["replace", "merge", "error"] = "error",
+        collisionReportingMode: Literal["silence", "warning"] = "warning",
+    ) -> None:
+        """Insert many entries into the tier.
+
+        The result is the same as calling insertEntry() for each entry, in
+        order, but much faster for many entries.  If none of the entries
+        collide, the existing and new entries are merged in one pass,
+        instead of searching for a place for each entry.  Otherwise, the
+        entries are inserted one at a time with insertEntry(), to resolve
+        the collisions in order.
+
+        minTimestamp and maxTimestamp are expanded to fit the new entries
+        if insertEntry() would expand them (for interval tiers, but not for
+        point tiers).
+
+        Args:
+            entries: the entries to insert
+            collisionMode: determines the behavior if entries collide;
+                see insertEntry()
+            collisionReportingMode: Determines the behavior if an entry
+                collides with another one
+
+        Raises:
+            CollisionError: potentially raised if an entry collides with
+                            another one
+            WrongOption: the collisionMode or collisionReportingMode is not valid
+        """
+        utils.validateOption(
+            "collisionMode", collisionMode, constants.IntervalCollision
+        )
+        utils.validateOption(
+            "collisionReportingMode",
+            collisionReportingMode,
+            constants.ErrorReportingMode,
+        )
+
+        newEntries = [self.entryType.build(entry) for entry in entries]
+        if self._pendingEntries is not None:
+            self._pendingEntries.extend(
+                (entry, collisionMode, collisionReportingMode) for entry in newEntries
+            )
+            return
+        if not newEntries:
+            return
+
+        # The existing entries are one sorted run, so this only
+        # needs to sort the new entries and merge them in
+        mergedEntries = sorted(itertools.chain(self._entries, newEntries))
+        if self._isDisjoint(mergedEntries):
+            self._invalidateLabelIndex()
+            if self.isCompact:
+                self._entries = ColumnarEntries(
+                    self.entryType, mergedEntries, self.isCategorical
+                )
+            else:
+                self._entries = mergedEntries
+            self._entriesShared = False
+            if self._insertExpandsTimestamps:
+                self.minTimestamp, self.maxTimestamp = self._calculateMinAndMaxTime(
+                    [self._entries[0][0], self._entries[-1][-2]],
+                    self.minTimestamp,
+                    self.maxTimestamp,
+                )
+        else:
+            for entry in newEntries:
+                self.insertEntry(entry, collisionMode, collisionReportingMode)
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer inserting entries until the end of a block of edits.
+
+        Use as a context manager:
+            with tier.batch():
+                for entry in entries:
+                    tier.insertEntry(entry)
+
+        Entries passed to insertEntry() or insertEntries() inside the
+        block are checked and inserted, together, when the block ends,
+        with insertEntries().  The result, including minTimestamp and
+        maxTimestamp, is the same as inserting them one at a time.  Until
+        then, they are not part of the tier.
+
+        If the block raises an exception, the entries are discarded.
+        """
+        if self._pendingEntries is not None:
+            # Already in a batch; the outer one inserts the entries
+            yield
+            return
+
+        self._pendingEntries = []
+        try:
+            yield
+            pendingEntries = self._pendingEntries
+        finally:
+            self._pendingEntries = None
+
+        # Consecutive entries with the same modes are inserted together
+        for modes, group in itertools.groupby(
+            pendingEntries, key=lambda pendingEntry: pendingEntry[1:]
+        ):
+            self.insertEntries([entry for entry, *_ in group], *modes)
+
+    def _isDisjoint(self, entries: Sequence[EntryType]) -> bool:
+        """True if none of the (sorted) entries collide with each other.
+
+        Each entry is taken to span from its first field to its second to
+        last one, as with Intervals and Points.  Entries that only touch
+        count as colliding, so they are inserted one at a time with
+        insertEntry().  Subclasses can override this to match the way
+        their insertEntry() checks for collisions.
+        """
+        return all(entry[0] <= entry[-2] for entry in entries) and all(
+            entry[-2] < nextEntry[0] for entry, nextEntry in zip(entries, entries[1:])
+        )
+
     @abstractmethod
     def dejitter(
         self: TierType,
@@ -352,7 +700,9 @@ class TextgridTier(ABC, Generic[EntryType]):
         Raises:
             ValueError: The entry does not exist.
         """
+        self._ownEntries()
         self._entries.remove(entry)
+        self._invalidateLabelIndex()
 
     @abstractmethod
     def toZeroCrossings(self: TierType, wavFN: str) -> TierType:  # pragma: no cover
@@ -3,17 +3,16 @@
 see **examples/get_vowel_points.py**
 """
 
-import io
-from typing import List, Tuple
+from typing import List, Tuple, Optional
 
 from praatio.data_classes.data_point import PointObject1D, PointObject2D
+from praatio.utilities import utils
 
 
-def open1DPointObject(fn: str) -> PointObject1D:
-    with io.open(fn, "r", encoding="utf-8") as fd:
-        data = fd.read()
+def open1DPointObject(fn: str, encoding: Optional[str] = None) -> PointObject1D:
+    data = utils.readTextFile(fn, encoding)
     if "xmin" in data[:100]:  # Kindof lazy
-        data, objectType, minT, maxT = _parseNormalHeader(fn)
+        data, objectType, minT, maxT = _parseNormalHeader(data)
 
         start = 0
         dataList: List[Tuple[float]] = []
@@ -29,18 +28,17 @@ def open1DPointObject(fn: str) -> PointObject1D:
         po = PointObject1D(dataList, objectType, minT, maxT)
 
     else:
-        data, objectType, minT, maxT = _parseShortHeader(fn)
+        data, objectType, minT, maxT = _parseShortHeader(data)
         dataList = [(float(val),) for val in data.split("\n") if val.strip() != ""]
         po = PointObject1D(dataList, objectType, minT, maxT)
 
     return po
 
 
-def open2DPointObject(fn: str) -> PointObject2D:
-    with io.open(fn, "r", encoding="utf-8") as fd:
-        data = fd.read()
+def open2DPointObject(fn: str, encoding: Optional[str] = None) -> PointObject2D:
+    data = utils.readTextFile(fn, encoding)
     if "xmin" in data[:100]:  # Kindof lazy
-        data, objectType, minT, maxT = _parseNormalHeader(fn)
+        data, objectType, minT, maxT = _parseNormalHeader(data)
 
         start = 0
         dataList: List[Tuple[float, float]] = []
@@ -68,7 +66,7 @@ def open2DPointObject(fn: str) -> PointObject2D:
         po = PointObject2D(dataList, objectType, minT, maxT)
 
     else:
-        data, objectType, minT, maxT = _parseShortHeader(fn)
+        data, objectType, minT, maxT = _parseShortHeader(data)
         dataStrList = data.split("\n")
         dataList = [
             (float(dataStrList[i]), float(dataStrList[i + 1]))
@@ -80,10 +78,7 @@ def open2DPointObject(fn: str) -> PointObject2D:
     return po
 
 
-def _parseNormalHeader(fn: str) -> Tuple[str, str, float, float]:
-    with io.open(fn, "r", encoding="utf-8") as fd:
-        data = fd.read()
-
+def _parseNormalHeader(data: str) -> Tuple[str, str, float, float]:
     chunkedData = data.split("\n", 7)
 
     objectType = chunkedData[1].split("=")[-1]
@@ -102,10 +97,7 @@ def _getNextValue(data: str, start: int) -> Tuple[str, int]:
     return value, end
 
 
-def _parseShortHeader(fn: str) -> Tuple[str, str, float, float]:
-    with io.open(fn, "r", encoding="utf-8") as fd:
-        data = fd.read()
-
+def _parseShortHeader(data: str) -> Tuple[str, str, float, float]:
     chunkedData = data.split("\n", 6)
 
     objectType = chunkedData[1].split("=")[-1]
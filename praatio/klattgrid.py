@@ -21,7 +21,6 @@ any points
 see **examples/klatt_resynthesis.py**
 """
 
-import io
 from os.path import join
 from typing import List, Sequence, Tuple, Optional
 
@@ -35,14 +34,17 @@ from praatio.data_classes.klattgrid import (
 from praatio.utilities import utils
 
 
-def openKlattgrid(fnFullPath: str) -> Klattgrid:
-    try:
-        with io.open(fnFullPath, "r", encoding="utf-16") as fd:
-            data = fd.read()
-    except UnicodeError:
-        with io.open(fnFullPath, "r", encoding="utf-8") as fd:
-            data = fd.read()
-    data = data.replace("\r\n", "\n")
+def openKlattgrid(fnFullPath: str, encoding: Optional[str] = None) -> Klattgrid:
+    """Open a klattgrid file.
+
+    Files compressed with gzip, bzip2 or xz are detected automatically.
+
+    Args:
+        fnFullPath: the path to the klattgrid to open
+        encoding: the encoding of the file.  If None, it is detected
+            from the byte order mark or the first few bytes of the file.
+    """
+    data = utils.readTextFile(fnFullPath, encoding)
 
     # Right now, can only open normal klatt grid and not short ones
     kg = _openNormalKlattgrid(data)
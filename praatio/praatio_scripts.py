@@ -120,8 +120,7 @@ def _shiftTimes(
                 tier.deleteEntry(entry)
                 insertEntries.append(Interval(newStart, newStop, entry[2]))
 
-            for entry in insertEntries:
-                tier.insertEntry(entry)
+            tier.insertEntries(insertEntries)
 
         elif isinstance(tier, textgrid.PointTier):
             entries = [entry for entry in tier.entries if entry[0] == timeV]
@@ -244,8 +243,7 @@ def splitTierEntries(
 
     # Or insert new entries into existing target tier
     else:
-        for entry in newEntries:
-            targetTier.insertEntry(entry, constants.IntervalCollision.ERROR)
+        targetTier.insertEntries(newEntries, constants.IntervalCollision.ERROR)
 
     # Insert the tier into the textgrid
     if targetTierName in tg.tierNames:
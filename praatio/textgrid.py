@@ -9,6 +9,9 @@ either interval data (IntervalTier) or point data (PointTier).
 Tiers in a Textgrid are ordered and must contain a unique name.
 
 openTextgrid() can be used to open a textgrid file.
+openTextgrids() and saveTextgrids() open and save many files in parallel.
+probeTextgrid() can be used to summarize a textgrid file without opening it.
+IntervalIndex finds overlapping intervals across one or more IntervalTiers.
 Textgrid.save() can be used to save a Textgrid object to a file.
 
 Historically, these three classes lived in this file. To
@@ -22,8 +25,25 @@ Textgrid in data_classes/textgrid.py
 see the **examples/** directory for examples using textgrid.py
 """
 
-import io
-from typing import Union, Type, List
+import collections
+import concurrent.futures
+import itertools
+import os
+import pickle
+from typing import (
+    Union,
+    Type,
+    List,
+    Optional,
+    Iterable,
+    Iterator,
+    Tuple,
+    NamedTuple,
+    Callable,
+    Deque,
+    Any,
+    TypeVar,
+)
 
 from typing_extensions import Literal
 
@@ -32,28 +52,51 @@ from praatio.utilities.constants import (
     INTERVAL_TIER,
 )
 from praatio.data_classes.interval_tier import IntervalTier
+# Re-exported, so the index can be used from this module like the tiers
+from praatio.data_classes.interval_index import IntervalIndex, IndexedInterval  # noqa: F401
 from praatio.data_classes.point_tier import PointTier
-from praatio.data_classes.textgrid import Textgrid
+from praatio.data_classes.textgrid import Textgrid, _tgToDictionary
 from praatio.utilities import textgrid_io
+from praatio.utilities import textgrid_cache
 from praatio.utilities import utils
 from praatio.utilities import constants
 from praatio.utilities import errors
 
+T = TypeVar("T")
+
 
 def openTextgrid(
     fnFullPath: str,
     includeEmptyIntervals: bool,
     reportingMode: Literal["silence", "warning", "error"] = "warning",
     duplicateNamesMode: Literal["error", "rename"] = "error",
+    tierNames: Optional[Iterable[str]] = None,
+    encoding: Optional[str] = None,
+    cacheDir: Optional[str] = None,
+    cacheUsesHash: bool = False,
 ) -> Textgrid:
     """Open a textgrid file (.TextGrid and .json are both fine).
 
+    Text, json, and binary textgrids are all detected automatically, as
+    are files compressed with gzip, bzip2 or xz.
+
     https://www.fon.hum.uva.nl/praat/manual/TextGrid_file_formats.html
 
     Args:
         fnFullPath: the path to the textgrid to open
         includeEmptyIntervals: if False, points and intervals with
              an empty label '' are not included in the returned Textgrid
+        tierNames: if given, only the tiers with these names are loaded.
+             The entries of the other tiers are skipped without being parsed,
+             which is much faster when only a few tiers are needed.
+        encoding: the encoding of a text textgrid.  If None, it is detected
+             from the byte order mark or the first few bytes of the file.
+        cacheDir: if given, parsed textgrids are cached in this directory and
+             reused until the file changes, which skips parsing entirely.
+             See utilities/textgrid_cache.py
+        cacheUsesHash: if True, a cached textgrid is reused if the file's
+             size and content hash are unchanged; otherwise if its size
+             and modification time are unchanged
 
     Returns:
         A Textgrid
@@ -65,19 +108,231 @@ def openTextgrid(
     utils.validateOption(
         "duplicateNamesMode", duplicateNamesMode, constants.DuplicateNames
     )
-    try:
-        with io.open(fnFullPath, "r", encoding="utf-16") as fd:
-            data = fd.read()
-    except UnicodeError:
-        with io.open(fnFullPath, "r", encoding="utf-8") as fd:
-            data = fd.read()
+    tgAsDict = _openTextgridAsDict(
+        fnFullPath,
+        includeEmptyIntervals,
+        duplicateNamesMode,
+        tierNames,
+        encoding,
+        cacheDir,
+        cacheUsesHash,
+    )
+
+    return _dictionaryToTg(tgAsDict, reportingMode)
+
+
+def openTextgrids(
+    fnFullPaths: Iterable[str],
+    includeEmptyIntervals: bool,
+    reportingMode: Literal["silence", "warning", "error"] = "warning",
+    duplicateNamesMode: Literal["error", "rename"] = "error",
+    tierNames: Optional[Iterable[str]] = None,
+    encoding: Optional[str] = None,
+    cacheDir: Optional[str] = None,
+    cacheUsesHash: bool = False,
+    workers: Optional[int] = None,
+) -> Iterator["TextgridResult"]:
+    """Open many textgrid files in parallel.
+
+    The files are parsed by a pool of worker processes and sent back in a
+    compact form (see textgrid_io.packTextgrid()).  Results are yielded in
+    the order of /fnFullPaths/ as soon as they are ready.  Only a few files
+    per worker are read ahead, so /fnFullPaths/ can be a long generator.
+
+    Args:
+        fnFullPaths: the paths to the textgrids to open
+        workers: the number of worker processes; if None, the number of CPUs.
+            With 1, the files are opened in this process.
+        The other arguments are the same as for openTextgrid()
+
+    Returns:
+        A TextgridResult for each file.  If the file could not be opened,
+        its textgrid is None and its error is the exception that was raised.
+    """
+    utils.validateOption("reportingMode", reportingMode, constants.ErrorReportingMode)
+    utils.validateOption(
+        "duplicateNamesMode", duplicateNamesMode, constants.DuplicateNames
+    )
+    tierNames = None if tierNames is None else list(tierNames)
+
+    if workers == 1:
+        for fnFullPath in fnFullPaths:
+            try:
+                tg = openTextgrid(
+                    fnFullPath,
+                    includeEmptyIntervals,
+                    reportingMode,
+                    duplicateNamesMode,
+                    tierNames,
+                    encoding,
+                    cacheDir,
+                    cacheUsesHash,
+                )
+            except Exception as e:
+                yield TextgridResult(fnFullPath, None, e)
+            else:
+                yield TextgridResult(fnFullPath, tg, None)
+        return
+
+    fnFullPaths, argsList = itertools.tee(fnFullPaths)
+    results = _runInProcessPool(
+        _openPackedTextgrid,
+        (
+            (
+                fnFullPath,
+                includeEmptyIntervals,
+                duplicateNamesMode,
+                tierNames,
+                encoding,
+                cacheDir,
+                cacheUsesHash,
+            )
+            for fnFullPath in argsList
+        ),
+        workers,
+    )
+    for fnFullPath, (packedTg, error) in zip(fnFullPaths, results):
+        if error is not None:
+            yield TextgridResult(fnFullPath, None, error)
+            continue
+        if packedTg is None:
+            # _openPackedTextgrid() only returns no textgrid along with an error
+            yield TextgridResult(
+                fnFullPath,
+                None,
+                errors.UnexpectedError(f"No textgrid was returned for {fnFullPath}."),
+            )
+            continue
+
+        try:
+            tg = _dictionaryToTg(textgrid_io.unpackTextgrid(packedTg), reportingMode)
+        except errors.PraatioException as e:
+            yield TextgridResult(fnFullPath, None, e)
+        else:
+            yield TextgridResult(fnFullPath, tg, None)
+
+
+def saveTextgrids(
+    textgrids: Iterable[Tuple[str, Textgrid]],
+    format: Literal[
+        "short_textgrid",
+        "long_textgrid",
+        "json",
+        "textgrid_json",
+        "binary_textgrid",
+        "columnar_json",
+    ],
+    includeBlankSpaces: bool,
+    minTimestamp: Optional[float] = None,
+    maxTimestamp: Optional[float] = None,
+    minimumIntervalLength: float = constants.MIN_INTERVAL_LENGTH,
+    reportingMode: Literal["silence", "warning", "error"] = "warning",
+    workers: Optional[int] = None,
+) -> Iterator["TextgridResult"]:
+    """Save many textgrids in parallel.
+
+    The textgrids are validated like in Textgrid.save() and then sent to a
+    pool of worker processes in a compact form (see textgrid_io.packTextgrid())
+    to be written.  Results are yielded in the order of /textgrids/ as each
+    file is saved.
+
+    Args:
+        textgrids: pairs of (the path to save to, the textgrid to save)
+        workers: the number of worker processes; if None, the number of CPUs.
+            With 1, the files are saved in this process.
+        The other arguments are the same as for Textgrid.save()
+
+    Returns:
+        A TextgridResult for each file.  If the file could not be saved,
+        its error is the exception that was raised.
+    """
+    utils.validateOption("format", format, constants.TextgridFormats)
+    utils.validateOption("reportingMode", reportingMode, constants.ErrorReportingMode)
+
+    if workers == 1:
+        for fn, tg in textgrids:
+            try:
+                tg.save(
+                    fn,
+                    format,
+                    includeBlankSpaces,
+                    minTimestamp,
+                    maxTimestamp,
+                    minimumIntervalLength,
+                    reportingMode,
+                )
+            except Exception as e:
+                yield TextgridResult(fn, tg, e)
+            else:
+                yield TextgridResult(fn, tg, None)
+        return
+
+    def validateAndPack():
+        for fn, tg in textgrids:
+            try:
+                tg.validate(reportingMode)
+                packedTg = textgrid_io.packTextgrid(_tgToDictionary(tg))
+            except Exception as e:
+                yield fn, tg, None, e
+            else:
+                yield fn, tg, packedTg, None
+
+    packedTextgrids, argsList = itertools.tee(validateAndPack())
+    results = _runInProcessPool(
+        _savePackedTextgrid,
+        (
+            (
+                fn,
+                packedTg,
+                format,
+                includeBlankSpaces,
+                minTimestamp,
+                maxTimestamp,
+                minimumIntervalLength,
+            )
+            for fn, _, packedTg, _ in argsList
+        ),
+        workers,
+    )
+    for (fn, tg, _, error), saveError in zip(packedTextgrids, results):
+        yield TextgridResult(fn, tg, error or saveError)
+
+
+class TextgridResult(NamedTuple):
+    """The outcome of opening or saving one file with openTextgrids/saveTextgrids."""
 
-    tgAsDict = textgrid_io.parseTextgridStr(data, includeEmptyIntervals)
+    fnFullPath: str
+    textgrid: Optional[Textgrid]
+    error: Optional[Exception]
 
-    tierNames: List[str] = []
+
+def _openTextgridAsDict(
+    fnFullPath: str,
+    includeEmptyIntervals: bool,
+    duplicateNamesMode: Literal["error", "rename"],
+    tierNames: Optional[Iterable[str]],
+    encoding: Optional[str],
+    cacheDir: Optional[str],
+    cacheUsesHash: bool,
+) -> dict:
+    if cacheDir is None:
+        tgAsDict = _parseTextgridFile(
+            fnFullPath, includeEmptyIntervals, tierNames, encoding
+        )
+    else:
+        # The whole textgrid is cached, so that it can be reused with any filters
+        tgAsDict = textgrid_cache.getCache(cacheDir).load(
+            fnFullPath,
+            lambda: _parseTextgridFile(fnFullPath, True, None, encoding),
+            encoding,
+            useHash=cacheUsesHash,
+        )
+        textgrid_io.filterTextgrid(tgAsDict, includeEmptyIntervals, tierNames)
+
+    loadedTierNames: List[str] = []
     for tier in tgAsDict["tiers"]:
         name = tier["name"]
-        if name in tierNames:
+        if name in loadedTierNames:
             if duplicateNamesMode == constants.DuplicateNames.ERROR:
                 raise errors.DuplicateTierName(
                     f"Your textgrid contains tiers with the same name {name!r}. "
@@ -89,14 +344,117 @@ def openTextgrid(
             elif duplicateNamesMode == constants.DuplicateNames.RENAME:
                 newName = name
                 i = 2
-                while newName in tierNames:
+                while newName in loadedTierNames:
                     newName = f"{name}_{i}"
                     i += 1
                 name = newName
                 tier["name"] = name
-        tierNames.append(name)
+        loadedTierNames.append(name)
 
-    return _dictionaryToTg(tgAsDict, reportingMode)
+    return tgAsDict
+
+
+def _openPackedTextgrid(
+    fnFullPath: str, *args: Any
+) -> Tuple[Optional[bytes], Optional[Exception]]:
+    """Open a textgrid in a worker process.  See openTextgrids()."""
+    try:
+        tgAsDict = _openTextgridAsDict(fnFullPath, *args)
+        return textgrid_io.packTextgrid(tgAsDict), None
+    except Exception as e:
+        return None, _picklableException(e)
+
+
+def _savePackedTextgrid(
+    fn: str, packedTg: Optional[bytes], format: str, *args: Any
+) -> Optional[Exception]:
+    """Save a textgrid in a worker process.  See saveTextgrids()."""
+    if packedTg is None:  # The textgrid failed validation
+        return None
+
+    if format == constants.TextgridFormats.BINARY_TEXTGRID:
+        mode, encoding = "wb", None
+    else:
+        mode, encoding = "w", "utf-8"
+
+    try:
+        tgAsDict = textgrid_io.unpackTextgrid(packedTg)
+        with utils.openFileForReplacing(fn, mode, encoding=encoding) as fd:
+            textgrid_io.writeTextgrid(tgAsDict, fd, format, *args)  # type: ignore
+        return None
+    except Exception as e:
+        return _picklableException(e)
+
+
+def _picklableException(exception: Exception) -> Exception:
+    """Exceptions are sent back from worker processes, so they must survive pickling."""
+    try:
+        pickle.loads(pickle.dumps(exception))
+        return exception
+    except Exception:
+        return errors.PraatioException(f"{type(exception).__name__}: {exception}")
+
+
+def _runInProcessPool(
+    function: Callable[..., T], argsList: Iterable[Tuple], workers: Optional[int]
+) -> Iterator[T]:
+    """Call /function/ on each of /argsList/ in worker processes, yielding results in order.
+
+    At most a couple of calls per worker are queued at a time.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[concurrent.futures.Future] = collections.deque()
+        try:
+            for args in argsList:
+                pending.append(executor.submit(function, *args))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _parseTextgridFile(
+    fnFullPath: str,
+    includeEmptyIntervals: bool,
+    tierNames: Optional[Iterable[str]],
+    encoding: Optional[str],
+) -> dict:
+    with utils.openFile(fnFullPath, "rb") as fd:
+        binaryData = fd.read()
+
+    if binaryData.startswith(textgrid_io.BINARY_TEXTGRID_HEADER):
+        return textgrid_io.parseBinaryTextgrid(
+            binaryData, includeEmptyIntervals, tierNames
+        )
+
+    data = utils.decodeText(binaryData, encoding)
+    return textgrid_io.parseTextgridStr(data, includeEmptyIntervals, tierNames)
+
+
+def probeTextgrid(fnFullPath: str, encoding: Optional[str] = None) -> dict:
+    """Get the format, duration, and tiers of a textgrid without opening it.
+
+    Only the headers of the textgrid and its tiers are read; the entries
+    are skipped over, so this is much faster than openTextgrid() for
+    summarizing many files.
+
+    Args:
+        fnFullPath: the path to the textgrid to probe
+        encoding: the encoding of a text textgrid.  If None, it is detected.
+
+    Returns:
+        A dictionary with the "format", "xmin", and "xmax" of the textgrid
+        and a list of "tiers", each a dictionary with the tier's "class",
+        "name", "xmin", "xmax", and "size" (the number of entries)
+    """
+    return textgrid_io.probeTextgrid(fnFullPath, encoding)
 
 
 def _dictionaryToTg(
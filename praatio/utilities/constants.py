@@ -1,6 +1,7 @@
 """Constant values and primitive definitions that can be shared throughout the code."""
 from typing import NamedTuple, Any
 import math
+import sys
 
 from typing_extensions import Final
 
@@ -25,6 +26,7 @@ class Interval(NamedTuple):
         Should only be used on validated data.
 
         Interval.build() is robust and performs type conversion and label stripping.
+        Labels are interned, so entries with the same label share one string.
         It accepts either 3 arguments (start, end, label),
         or 1 argument (another Interval or a tuple or list of 3 elements).
 
@@ -34,7 +36,7 @@ class Interval(NamedTuple):
         """
         try:
             start, end, label = args[0] if len(args) == 1 else args
-            return cls(float(start), float(end), str(label).strip())
+            return cls(float(start), float(end), sys.intern(str(label).strip()))
         except (TypeError, ValueError):
             raise errors.ArgumentError(f"Cannot build Interval from {args}")
 
@@ -74,6 +76,7 @@ class Point(NamedTuple):
         Should only be used on validated data.
 
         Point.build() is robust and performs type conversion and label stripping.
+        Labels are interned, so entries with the same label share one string.
         It accepts either 2 arguments (time, label),
         or 1 argument (another Point or a tuple or list of 2 elements).
 
@@ -83,7 +86,7 @@ class Point(NamedTuple):
         """
         try:
             time, label = args[0] if len(args) == 1 else args
-            return cls(float(time), str(label).strip())
+            return cls(float(time), sys.intern(str(label).strip()))
         except (TypeError, ValueError):
             raise errors.ArgumentError(f"Cannot build Point from {args}")
 
@@ -165,8 +168,17 @@ class TextgridFormats:
     SHORT_TEXTGRID: Final = "short_textgrid"
     JSON: Final = "json"
     TEXTGRID_JSON: Final = "textgrid_json"
-
-    validOptions = [LONG_TEXTGRID, SHORT_TEXTGRID, JSON, TEXTGRID_JSON]
+    BINARY_TEXTGRID: Final = "binary_textgrid"
+    COLUMNAR_JSON: Final = "columnar_json"
+
+    validOptions = [
+        LONG_TEXTGRID,
+        SHORT_TEXTGRID,
+        JSON,
+        TEXTGRID_JSON,
+        BINARY_TEXTGRID,
+        COLUMNAR_JSON,
+    ]
 
 
 class DataPointTypes:
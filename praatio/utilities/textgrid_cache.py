@@ -0,0 +1,276 @@
+"""An on-disk cache of parsed textgrids.
+
+Parsing a large text textgrid is much slower than loading a compact
+binary copy of it.  A TextgridCache stores the parsed textgrid dictionary
+of each file it sees (packed with textgrid_io.packTextgrid()) in a cache
+directory and reuses it as long as the file hasn't changed.  A file is
+considered unchanged if its size and modification time (or, optionally,
+a hash of its content) are the same as when it was cached.
+
+Cache files are evicted, least recently used first, when the cache
+directory grows over its size limit.  The most recently used textgrids
+are also kept in memory.
+
+Cache files are pickles, so only use cache directories that no one
+else can write to.
+
+see textgrid.openTextgrid(..., cacheDir=...)
+"""
+
+import collections
+import hashlib
+import io
+import os
+import pickle
+import tempfile
+from typing import Callable, Dict, Optional, Tuple
+
+from praatio.utilities import textgrid_io
+
+# Bump when the cached form changes to ignore files written by older versions
+CACHE_VERSION = 1
+CACHE_FILE_EXTENSION = ".tgcache"
+
+DEFAULT_MAX_SIZE = 1024 * 1024 * 1024  # 1 GB on disk
+DEFAULT_MEMORY_ENTRIES = 128
+
+_caches: Dict[str, "TextgridCache"] = {}
+
+
+def getCache(
+    cacheDir: str,
+    maxSize: Optional[int] = None,
+    memoryEntries: Optional[int] = None,
+) -> "TextgridCache":
+    """Get the cache for /cacheDir/, creating it if needed.
+
+    The same cache object (and in-memory cache) is shared by all
+    callers using the same directory.
+
+    Args:
+        cacheDir: the directory to store cached textgrids in
+        maxSize: if given, the size limit of the cache directory in bytes
+        memoryEntries: if given, the number of textgrids kept in memory
+    """
+    key = os.path.abspath(cacheDir)
+    if key not in _caches:
+        _caches[key] = TextgridCache(cacheDir)
+
+    cache = _caches[key]
+    if maxSize is not None:
+        cache.maxSize = maxSize
+    if memoryEntries is not None:
+        cache.memoryEntries = memoryEntries
+
+    return cache
+
+
+class TextgridCache:
+    def __init__(
+        self,
+        cacheDir: str,
+        maxSize: int = DEFAULT_MAX_SIZE,
+        memoryEntries: int = DEFAULT_MEMORY_ENTRIES,
+    ):
+        """
+        Args:
+            cacheDir: the directory to store cached textgrids in;
+                it is created if it doesn't exist
+            maxSize: the size limit of the cache directory in bytes
+            memoryEntries: the number of textgrids kept in memory
+        """
+        os.makedirs(cacheDir, exist_ok=True)
+        self.cacheDir = cacheDir
+        self.maxSize = maxSize
+        self.memoryEntries = memoryEntries
+
+        # Maps a cache key to the (signature, serialized textgrid) of a file
+        self._memory: "collections.OrderedDict[str, Tuple[Tuple, bytes]]" = (
+            collections.OrderedDict()
+        )
+        self._diskSize: Optional[int] = None
+
+    def load(
+        self,
+        fnFullPath: str,
+        parse: Callable[[], Dict],
+        encoding: Optional[str] = None,
+        useHash: bool = False,
+    ) -> Dict:
+        """Get the textgrid dictionary of a file from the cache or by parsing it.
+
+        Args:
+            fnFullPath: the path to the textgrid
+            parse: called to parse the file if it is not in the cache;
+                returns the textgrid dictionary
+            encoding: the encoding the file is parsed with; files parsed
+                with different encodings are cached separately
+            useHash: if True, a file is considered unchanged if its size
+                and content hash match.  Otherwise its size and
+                modification time have to match.
+
+        Returns:
+            The textgrid dictionary.  The caller is free to modify it.
+        """
+        key = _getKey(fnFullPath, encoding)
+        signature = _getSignature(fnFullPath, useHash)
+
+        payload = self._loadFromMemory(key, signature, useHash)
+        if payload is None:
+            payload = self._loadFromDisk(key, signature, useHash)
+
+        if payload is not None:
+            self._saveToMemory(key, signature, payload)
+            return textgrid_io.unpackTextgrid(payload)
+
+        tgAsDict = parse()
+        try:
+            payload = textgrid_io.packTextgrid(tgAsDict)
+        except (TypeError, ValueError):
+            # Entries that can't be stored compactly are not cached
+            return tgAsDict
+
+        self._saveToMemory(key, signature, payload)
+        self._saveToDisk(key, signature, payload)
+
+        return tgAsDict
+
+    def clear(self) -> None:
+        """Remove all cached textgrids, in memory and on disk."""
+        self._memory.clear()
+        for fn in os.listdir(self.cacheDir):
+            if fn.endswith(CACHE_FILE_EXTENSION):
+                os.remove(os.path.join(self.cacheDir, fn))
+        self._diskSize = 0
+
+    def _cacheFN(self, key: str) -> str:
+        return os.path.join(self.cacheDir, key + CACHE_FILE_EXTENSION)
+
+    def _loadFromMemory(
+        self, key: str, signature: Tuple, useHash: bool
+    ) -> Optional[bytes]:
+        if key not in self._memory:
+            return None
+
+        cachedSignature, payload = self._memory[key]
+        if not _isSameFile(cachedSignature, signature, useHash):
+            del self._memory[key]
+            return None
+
+        return payload
+
+    def _saveToMemory(self, key: str, signature: Tuple, payload: bytes) -> None:
+        self._memory[key] = (signature, payload)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memoryEntries:
+            self._memory.popitem(last=False)
+
+    def _loadFromDisk(
+        self, key: str, signature: Tuple, useHash: bool
+    ) -> Optional[bytes]:
+        cacheFN = self._cacheFN(key)
+        try:
+            with io.open(cacheFN, "rb") as fd:
+                version, cachedSignature, payload = pickle.load(fd)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+            # A corrupt or unreadable cache file is treated as a cache miss
+            return None
+
+        if version != CACHE_VERSION or not _isSameFile(
+            cachedSignature, signature, useHash
+        ):
+            return None
+
+        # The modification time of a cache file records when it was last used
+        try:
+            os.utime(cacheFN)
+        except OSError:
+            pass
+
+        return payload
+
+    def _saveToDisk(self, key: str, signature: Tuple, payload: bytes) -> None:
+        cacheFN = self._cacheFN(key)
+        tmpFN = None
+        try:
+            tmpFd, tmpFN = tempfile.mkstemp(dir=self.cacheDir, suffix=".tmp")
+            with os.fdopen(tmpFd, "wb") as fd:
+                pickle.dump(
+                    (CACHE_VERSION, signature, payload),
+                    fd,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmpFN, cacheFN)
+        except OSError:
+            # The cache is an optimization; failing to write to it is not an error
+            if tmpFN is not None and os.path.exists(tmpFN):
+                os.remove(tmpFN)
+            return
+
+        if self._diskSize is None:
+            self._diskSize = self._computeDiskSize()
+        else:
+            self._diskSize += os.path.getsize(cacheFN)
+
+        if self._diskSize > self.maxSize:
+            self._evict()
+
+    def _listCacheFiles(self):
+        for entry in os.scandir(self.cacheDir):
+            if entry.name.endswith(CACHE_FILE_EXTENSION):
+                yield entry
+
+    def _computeDiskSize(self) -> int:
+        return sum(entry.stat().st_size for entry in self._listCacheFiles())
+
+    def _evict(self) -> None:
+        """Remove the least recently used cache files until under the size limit."""
+        entries = []
+        for entry in self._listCacheFiles():
+            stat = entry.stat()
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        entries.sort()
+
+        diskSize = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if diskSize <= self.maxSize:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            diskSize -= size
+
+        self._diskSize = diskSize
+
+
+def _getKey(fnFullPath: str, encoding: Optional[str]) -> str:
+    keyStr = f"{os.path.abspath(fnFullPath)}\0{encoding}"
+    return hashlib.sha1(keyStr.encode("utf-8")).hexdigest()
+
+
+def _getSignature(fnFullPath: str, useHash: bool) -> Tuple[int, int, Optional[str]]:
+    """The size, modification time, and (optionally) content hash of a file."""
+    stat = os.stat(fnFullPath)
+    contentHash = None
+    if useHash:
+        hasher = hashlib.blake2b(digest_size=16)
+        with io.open(fnFullPath, "rb") as fd:
+            for chunk in iter(lambda: fd.read(1 << 20), b""):
+                hasher.update(chunk)
+        contentHash = hasher.hexdigest()
+
+    return (stat.st_size, stat.st_mtime_ns, contentHash)
+
+
+def _isSameFile(cachedSignature: Tuple, signature: Tuple, useHash: bool) -> bool:
+    cachedSize, cachedMTime, cachedHash = cachedSignature
+    size, mTime, contentHash = signature
+    if cachedSize != size:
+        return False
+    if useHash:
+        return cachedHash is not None and cachedHash == contentHash
+
+    return cachedMTime == mTime
@@ -1,8 +1,27 @@
-import re
+import contextlib
+import io
+import itertools
 import json
-from typing import Optional, Union, Tuple, List, Any, Dict, Match
+import pickle
+import struct
+import sys
+from array import array
+from typing import (
+    Optional,
+    Tuple,
+    List,
+    Any,
+    Dict,
+    Union,
+    Iterable,
+    Iterator,
+    BinaryIO,
+    IO,
+    Set,
+    cast,
+)
 
-from typing_extensions import Literal
+from typing_extensions import Literal, TypedDict
 
 from praatio.utilities import errors
 from praatio.utilities import my_math
@@ -16,18 +35,30 @@ from praatio.utilities.constants import (
     POINT_TIER,
 )
 
+# Praat's binary files start with this signature
+BINARY_TEXTGRID_HEADER = b"ooBinaryFile"
 
-def reSearch(pattern: Union[str, re.Pattern], string: str, flags=None) -> Match[str]:
-    """Search for the string to match. Throws an error if no match is found."""
-    if flags:
-        matches = re.search(pattern, string, flags)
-    else:
-        matches = re.search(pattern, string)
+# How much of a file is read into memory at once when streaming it
+STREAM_BUFFER_SIZE = 1 << 16
 
-    if not matches:
-        raise errors.ParsingError("Expected field in Textgrid missing.")
 
-    return matches
+class TextgridHeader(TypedDict):
+    """The first item yielded by iterTextgrid()."""
+
+    format: str
+    xmin: float
+    xmax: float
+
+
+# Yielded by iterTextgrid() before the entries of each tier.  'class' is
+# a keyword, so this can't be declared with the class syntax.
+TierHeader = TypedDict(
+    "TierHeader",
+    {"class": str, "name": str, "xmin": float, "xmax": float, "size": int},
+)
+
+# What is read from a textgrid after the textgrid's own header
+TierItem = Union[TierHeader, Interval, Point]
 
 
 def _removeBlanks(tier: Dict) -> None:
@@ -135,7 +166,11 @@ def _fillInBlanks(
     tier["entries"] = newEntries
 
 
-def parseTextgridStr(data: str, includeEmptyIntervals: bool = False) -> Dict:
+def parseTextgridStr(
+    data: str,
+    includeEmptyIntervals: bool = False,
+    tierNames: Optional[Iterable[str]] = None,
+) -> Dict:
     """Convert a string representation of a Textgrid into a dictionary.
 
     https://www.fon.hum.uva.nl/praat/manual/TextGrid_file_formats.html
@@ -144,33 +179,275 @@ def parseTextgridStr(data: str, includeEmptyIntervals: bool = False) -> Dict:
         fnFullPath: the path to the textgrid to open
         includeEmptyIntervals: if False, points and intervals with
              an empty label '' are not included in the returned dictionary
+        tierNames: if given, only the tiers with these names are parsed;
+             the entries of all other tiers are skipped over.  Names
+             that are not in the textgrid are ignored.
 
     Returns:
         Dictionary
     """
+    tierNameSet = None if tierNames is None else set(tierNames)
 
     try:
         tgAsDict = json.loads(data)
-        if "start" in tgAsDict.keys():  # Using simplified json format
-            tgAsDict = _upconvertDictionaryFromJson(tgAsDict)
+        tgAsDict = _upconvertJsonTextgrid(tgAsDict)[0]
+        filterTextgrid(tgAsDict, True, tierNameSet)
     except ValueError:
         caseA = "ooTextFile short" in data
         caseB = "item [" not in data
         if caseA or caseB:
-            tgAsDict = _parseShortTextgrid(data)
+            tgAsDict = _parseShortTextgrid(data, tierNameSet)
         else:
-            tgAsDict = _parseNormalTextgrid(data)
+            tgAsDict = _parseNormalTextgrid(data, tierNameSet)
+
+    filterTextgrid(tgAsDict, includeEmptyIntervals)
+
+    return tgAsDict
+
+
+def parseBinaryTextgrid(
+    data: bytes,
+    includeEmptyIntervals: bool = False,
+    tierNames: Optional[Iterable[str]] = None,
+) -> Dict:
+    """Convert a binary Textgrid (Praat's ooBinaryFile format) into a dictionary.
+
+    Args:
+        data: the contents of the binary textgrid file
+        includeEmptyIntervals: if False, points and intervals with
+             an empty label '' are not included in the returned dictionary
+        tierNames: if given, only the tiers with these names are parsed
+
+    Returns:
+        Dictionary
+
+    Raises:
+        ParsingError: The data is not a valid binary textgrid
+    """
+    tierNameSet = None if tierNames is None else set(tierNames)
+    tgAsDict = _parseBinaryTextgrid(data, tierNameSet)
+
+    filterTextgrid(tgAsDict, includeEmptyIntervals)
+
+    return tgAsDict
+
+
+def filterTextgrid(
+    tgAsDict: Dict,
+    includeEmptyIntervals: bool,
+    tierNames: Optional[Iterable[str]] = None,
+) -> None:
+    """Remove unwanted tiers and entries from a textgrid dictionary, in place.
+
+    Args:
+        tgAsDict: the textgrid dictionary
+        includeEmptyIntervals: if False, points and intervals with
+             an empty label '' are removed
+        tierNames: if given, only the tiers with these names are kept
+    """
+    if tierNames is not None:
+        tierNameSet = set(tierNames)
+        tgAsDict["tiers"] = [
+            tier for tier in tgAsDict["tiers"] if tier["name"] in tierNameSet
+        ]
 
     if not includeEmptyIntervals:
         for tier in tgAsDict["tiers"]:
             _removeBlanks(tier)
 
-    return tgAsDict
+
+def iterTextgrid(
+    fnFullPath: str,
+    includeEmptyIntervals: bool = False,
+    tierNames: Optional[Iterable[str]] = None,
+    encoding: Optional[str] = None,
+) -> Iterator[Union[TextgridHeader, TierItem]]:
+    """Read a textgrid file incrementally, without loading all of it into memory.
+
+    The file is read in buffered chunks and its contents are yielded in
+    file order:
+    - first a TextgridHeader, a dictionary with the textgrid's "format",
+      "xmin" and "xmax"
+    - then for each tier, a TierHeader, a dictionary with the tier's "class",
+      "name", "xmin", "xmax" and "size" (the number of entries in the file),
+      followed by the tier's entries as Intervals or Points
+
+    Long, short, and binary textgrids are streamed.  Json textgrids
+    can't be streamed and are read in full before being yielded.
+
+    Args:
+        fnFullPath: the path to the textgrid to open
+        includeEmptyIntervals: if False, points and intervals with
+             an empty label '' are not yielded
+        tierNames: if given, only the tiers with these names are yielded
+        encoding: the encoding of a text textgrid.  If None, it is detected.
+
+    Raises:
+        ParsingError: The file is not a valid textgrid
+    """
+    tierNameSet = None if tierNames is None else set(tierNames)
+    with _openTextgridFile(fnFullPath, tierNameSet, encoding) as (tgHeader, items):
+        yield tgHeader
+        for item in items:
+            if (
+                includeEmptyIntervals
+                or not isinstance(item, (Interval, Point))
+                or item.label != ""
+            ):
+                yield item
+
+
+def probeTextgrid(fnFullPath: str, encoding: Optional[str] = None) -> Dict:
+    """Read the metadata of a textgrid file without parsing its entries.
+
+    Only the header of the textgrid and of each tier is parsed; the entries
+    are skipped over.  This is much faster than opening the textgrid when
+    only its duration, tiers or size is needed.
+
+    Json textgrids don't have separate headers and are parsed in full.
+
+    Args:
+        fnFullPath: the path to the textgrid to probe
+        encoding: the encoding of a text textgrid.  If None, it is detected.
+
+    Returns:
+        A dictionary with the "format", "xmin", and "xmax" of the textgrid
+        and a list of "tiers", each a dictionary with the tier's "class",
+        "name", "xmin", "xmax", and "size" (the number of entries)
+
+    Raises:
+        ParsingError: The file is not a valid textgrid
+    """
+    with _openTextgridFile(fnFullPath, encoding=encoding, headersOnly=True) as (
+        tgHeader,
+        tierHeaders,
+    ):
+        return {
+            "format": tgHeader["format"],
+            "xmin": tgHeader["xmin"],
+            "xmax": tgHeader["xmax"],
+            "tiers": list(tierHeaders),
+        }
+
+
+@contextlib.contextmanager
+def _openTextgridFile(
+    fnFullPath: str,
+    tierNames: Optional[Set[str]] = None,
+    encoding: Optional[str] = None,
+    headersOnly: bool = False,
+) -> Iterator[Tuple[TextgridHeader, Iterator[TierItem]]]:
+    """Detect the format of a textgrid file and start reading it incrementally.
+
+    Gives the textgrid's header and an iterator over the rest of the
+    textgrid, which must be used while the file is open.
+    """
+    with io.BufferedReader(
+        utils.openFile(fnFullPath, "rb"), STREAM_BUFFER_SIZE  # type: ignore
+    ) as fd:
+        start = fd.peek(len(BINARY_TEXTGRID_HEADER))
+        if start.startswith(BINARY_TEXTGRID_HEADER):
+            yield _streamBinaryTextgrid(fd, tierNames, headersOnly)
+            return
+
+        if encoding is None:
+            encoding = utils.sniffEncoding(fd.peek(4))
+
+        textFd = io.TextIOWrapper(fd, encoding=encoding, newline=None)
+        lines = iter(textFd)
+
+        # The format is decided by the first line after the file header
+        peekedLines = []
+        for line in lines:
+            peekedLines.append(line)
+            if "ooTextFile short" in line:
+                format = TextgridFormats.SHORT_TEXTGRID
+                break
+            if line.lstrip().startswith("{"):
+                tgAsDict, format = _parseJsonTextgrid(
+                    "".join(itertools.chain(peekedLines, lines))
+                )
+                if tierNames is not None:
+                    tgAsDict["tiers"] = [
+                        tier for tier in tgAsDict["tiers"] if tier["name"] in tierNames
+                    ]
+                tgHeader = TextgridHeader(
+                    format=format, xmin=tgAsDict["xmin"], xmax=tgAsDict["xmax"]
+                )
+                yield tgHeader, _iterTextgridDictTiers(tgAsDict, headersOnly)
+                return
+            if line.strip() and len(peekedLines) > 2:
+                if "=" in line:
+                    format = TextgridFormats.LONG_TEXTGRID
+                else:
+                    format = TextgridFormats.SHORT_TEXTGRID
+                break
+        else:
+            raise errors.ParsingError("Textgrid is empty or truncated.")
+
+        lines = itertools.chain(peekedLines, lines)
+        if format == TextgridFormats.SHORT_TEXTGRID:
+            yield _streamShortTextgrid(lines, tierNames, headersOnly)
+        else:
+            yield _streamNormalTextgrid(lines, tierNames, headersOnly)
+
+
+def _parseJsonTextgrid(data: str) -> Tuple[Dict, str]:
+    """Read a json textgrid in either json format, returning it and its format."""
+    try:
+        tgAsDict = json.loads(data)
+    except ValueError:
+        raise errors.ParsingError("Json textgrid is not valid json.")
+
+    return _upconvertJsonTextgrid(tgAsDict)
+
+
+def _upconvertJsonTextgrid(tgAsDict: Dict) -> Tuple[Dict, str]:
+    """Convert any of the json formats to a textgrid dictionary.
+
+    Returns the textgrid dictionary and the json format it was in.
+    """
+    if "start" in tgAsDict.keys():  # Using simplified json format
+        return _upconvertDictionaryFromJson(tgAsDict), TextgridFormats.JSON
+
+    tiers = tgAsDict["tiers"]
+    if tiers and "labels" in tiers[0]:
+        return (
+            _upconvertDictionaryFromColumnarJson(tgAsDict),
+            TextgridFormats.COLUMNAR_JSON,
+        )
+
+    return tgAsDict, TextgridFormats.TEXTGRID_JSON
+
+
+def _iterTextgridDictTiers(
+    tgAsDict: Dict, headersOnly: bool = False
+) -> Iterator[TierItem]:
+    """The inverse of _collectTextgrid(), for the tiers."""
+    for tier in tgAsDict["tiers"]:
+        entries = list(tier["entries"])
+        yield {
+            "class": tier["class"],
+            "name": tier["name"],
+            "xmin": tier["xmin"],
+            "xmax": tier["xmax"],
+            "size": len(entries),
+        }
+        if headersOnly:
+            continue
+        if tier["class"] == INTERVAL_TIER:
+            for entry in entries:
+                yield Interval.build(entry)
+        else:
+            for entry in entries:
+                yield Point.build(entry)
 
 
 def getTextgridAsStr(
     tg: Dict,
-    format: Literal["short_textgrid", "long_textgrid", "json", "textgrid_json"],
+    format: Literal[
+        "short_textgrid", "long_textgrid", "json", "textgrid_json", "columnar_json"
+    ],
     includeBlankSpaces: bool,
     minTimestamp: Optional[float] = None,
     maxTimestamp: Optional[float] = None,
@@ -180,7 +457,8 @@ def getTextgridAsStr(
 
     Args:
         tg: the textgrid to convert to a string
-        format: one of ['short_textgrid', 'long_textgrid', 'json', 'textgrid_json']
+        format: one of ['short_textgrid', 'long_textgrid', 'json', 'textgrid_json',
+            'columnar_json']
         includeBlankSpaces: if True, blank sections in interval
             tiers will be filled in with an empty interval
             (with a label of "")
@@ -200,24 +478,186 @@ def getTextgridAsStr(
 
     Returns:
         a string representation of the textgrid
+
+    Raises:
+        ArgumentError: The format is 'binary_textgrid'; use getTextgridAsBinary() instead
     """
 
+    utils.validateOption("format", format, TextgridFormats)
+    if format == TextgridFormats.BINARY_TEXTGRID:
+        raise errors.ArgumentError(
+            "A binary textgrid cannot be represented as a string. "
+            "Use getTextgridAsBinary() instead."
+        )
+
+    fd = io.StringIO()
+    writeTextgrid(
+        tg,
+        fd,
+        format,
+        includeBlankSpaces,
+        minTimestamp,
+        maxTimestamp,
+        minimumIntervalLength,
+    )
+
+    return fd.getvalue()
+
+
+def writeTextgrid(
+    tg: Dict,
+    fd: Union[IO[str], IO[bytes]],
+    format: Literal[
+        "short_textgrid",
+        "long_textgrid",
+        "json",
+        "textgrid_json",
+        "binary_textgrid",
+        "columnar_json",
+    ],
+    includeBlankSpaces: bool = True,
+    minTimestamp: Optional[float] = None,
+    maxTimestamp: Optional[float] = None,
+    minimumIntervalLength: float = MIN_INTERVAL_LENGTH,
+) -> None:
+    """Write a textgrid to an open file, one piece at a time.
+
+    The textgrid is never held in memory as one large string, so this can
+    be used to write big textgrids to files, pipes, or in-memory buffers.
+
+    Args:
+        tg: the textgrid to write
+        fd: a file object open for writing; a binary file object
+            for 'binary_textgrid' and a text file object otherwise
+        format: one of ['short_textgrid', 'long_textgrid', 'json', 'textgrid_json',
+            'binary_textgrid', 'columnar_json']
+        includeBlankSpaces: if True, blank sections in interval
+            tiers will be filled in with an empty interval
+            (with a label of "")
+        minTimestamp: the minTimestamp of the saved Textgrid;
+            if None, use whatever is defined in the Textgrid object.
+        maxTimestamp: the maxTimestamp of the saved Textgrid;
+            if None, use whatever is defined in the Textgrid object.
+        minimumIntervalLength: any labeled intervals smaller
+            than this will be removed; if None, don't remove any.
+    """
     utils.validateOption("format", format, TextgridFormats)
 
     tg = _prepTgForSaving(
         tg, includeBlankSpaces, minTimestamp, maxTimestamp, minimumIntervalLength
     )
 
+    if format == TextgridFormats.BINARY_TEXTGRID:
+        cast(IO[bytes], fd).writelines(_iterBinaryForm(tg))
+        return
+
+    textFd = cast(IO[str], fd)
     if format == TextgridFormats.LONG_TEXTGRID:
-        outputTxt = _tgToLongTextForm(tg)
+        textFd.writelines(_iterLongTextForm(tg))
     elif format == TextgridFormats.SHORT_TEXTGRID:
-        outputTxt = _tgToShortTextForm(tg)
+        textFd.writelines(_iterShortTextForm(tg))
     elif format == TextgridFormats.JSON:
-        outputTxt = _tgToJson(_downconvertDictionaryForJson(tg))
+        _writeJson(_downconvertDictionaryForJson(tg), textFd)
     elif format == TextgridFormats.TEXTGRID_JSON:
-        outputTxt = _tgToJson(tg)
+        _writeJson(tg, textFd)
+    elif format == TextgridFormats.COLUMNAR_JSON:
+        _writeJson(_downconvertDictionaryForColumnarJson(tg), textFd)
 
-    return outputTxt
+
+def getTextgridAsBinary(
+    tg: Dict,
+    includeBlankSpaces: bool,
+    minTimestamp: Optional[float] = None,
+    maxTimestamp: Optional[float] = None,
+    minimumIntervalLength: float = MIN_INTERVAL_LENGTH,
+) -> bytes:
+    """Convert a textgrid to Praat's binary format, suitable for saving.
+
+    The binary format is smaller and faster to read than the text formats.
+    Timestamps are stored as 64-bit floats, so no precision is lost.
+
+    Args:
+        tg: the textgrid to convert
+        includeBlankSpaces: if True, blank sections in interval
+            tiers will be filled in with an empty interval
+            (with a label of "")
+        minTimestamp: the minTimestamp of the saved Textgrid;
+            if None, use whatever is defined in the Textgrid object.
+        maxTimestamp: the maxTimestamp of the saved Textgrid;
+            if None, use whatever is defined in the Textgrid object.
+        minimumIntervalLength: any labeled intervals smaller
+            than this will be removed; if None, don't remove any.
+
+    Returns:
+        a binary representation of the textgrid
+    """
+    fd = io.BytesIO()
+    writeTextgrid(
+        tg,
+        fd,
+        TextgridFormats.BINARY_TEXTGRID,
+        includeBlankSpaces,
+        minTimestamp,
+        maxTimestamp,
+        minimumIntervalLength,
+    )
+
+    return fd.getvalue()
+
+
+def packTextgrid(tgAsDict: Dict) -> bytes:
+    """Convert a textgrid dictionary to a compact binary form.
+
+    The timestamps of each tier are stored in arrays of doubles, so the
+    result is much smaller and faster to load than the pickled entries.
+    This is meant for caching and for passing textgrids between processes,
+    not as a file format: see unpackTextgrid().
+
+    Raises:
+        ValueError, TypeError: A timestamp is not a number
+    """
+    tiers = []
+    for tier in tgAsDict["tiers"]:
+        entries = list(tier["entries"])
+        if tier["class"] == INTERVAL_TIER:
+            columns = [
+                array("d", [float(entry[0]) for entry in entries]).tobytes(),
+                array("d", [float(entry[1]) for entry in entries]).tobytes(),
+            ]
+        else:
+            columns = [array("d", [float(entry[0]) for entry in entries]).tobytes()]
+        labels = [entry[-1] for entry in entries]
+        tiers.append(
+            (tier["class"], tier["name"], tier["xmin"], tier["xmax"], columns, labels)
+        )
+
+    return pickle.dumps(
+        (tgAsDict["xmin"], tgAsDict["xmax"], tiers), protocol=pickle.HIGHEST_PROTOCOL
+    )
+
+
+def unpackTextgrid(data: bytes) -> Dict:
+    """Convert the output of packTextgrid() back to a textgrid dictionary.
+
+    Entries are returned as tuples; the tier constructors convert them.
+    Only unpack data that you trust, as it is unpickled.
+    """
+    tgMin, tgMax, packedTiers = pickle.loads(data)
+
+    tiers = []
+    for tierType, name, xmin, xmax, columns, labels in packedTiers:
+        timeColumns = [array("d", column) for column in columns]
+        tiers.append(
+            {
+                "class": tierType,
+                "name": name,
+                "xmin": xmin,
+                "xmax": xmax,
+                "entries": list(zip(*timeColumns, labels)),
+            }
+        )
+
+    return {"xmin": tgMin, "xmax": tgMax, "tiers": tiers}
 
 
 def _upconvertDictionaryFromJson(tgAsDict: dict) -> dict:
@@ -258,6 +698,62 @@ def _downconvertDictionaryForJson(tgAsDict: Dict) -> dict:
     }
 
 
+def _upconvertDictionaryFromColumnarJson(tgAsDict: Dict) -> Dict:
+    """Convert from the columnar json format to the one shaped like a textgrid.
+
+    Interval tiers store their entries as parallel "starts", "ends" and
+    "labels" lists and point tiers as parallel "times" and "labels" lists.
+    """
+    tiers = []
+    for tier in tgAsDict["tiers"]:
+        # Like the other json formats, entries are converted to
+        # Intervals and Points when the tiers are built
+        labels = tier["labels"]
+        if tier["class"] == INTERVAL_TIER:
+            columns = [tier["starts"], tier["ends"], labels]
+        else:
+            columns = [tier["times"], labels]
+        if len(set(map(len, columns))) > 1:
+            raise errors.ParsingError(
+                f"The columns of tier {tier['name']!r} have different lengths."
+            )
+        entries = list(zip(*columns))
+
+        tiers.append(
+            {
+                "class": tier["class"],
+                "name": tier["name"],
+                "xmin": tier["xmin"],
+                "xmax": tier["xmax"],
+                "entries": entries,
+            }
+        )
+
+    return {"xmin": tgAsDict["xmin"], "xmax": tgAsDict["xmax"], "tiers": tiers}
+
+
+def _downconvertDictionaryForColumnarJson(tgAsDict: Dict) -> Dict:
+    """Convert from the textgrid-shaped json format to the columnar json format."""
+    tiers = []
+    for tier in tgAsDict["tiers"]:
+        columnarTier = {
+            "class": tier["class"],
+            "name": tier["name"],
+            "xmin": tier["xmin"],
+            "xmax": tier["xmax"],
+        }
+        entries = tier["entries"]
+        if tier["class"] == INTERVAL_TIER:
+            columnarTier["starts"] = [entry[0] for entry in entries]
+            columnarTier["ends"] = [entry[1] for entry in entries]
+        else:
+            columnarTier["times"] = [entry[0] for entry in entries]
+        columnarTier["labels"] = [entry[-1] for entry in entries]
+        tiers.append(columnarTier)
+
+    return {"xmin": tgAsDict["xmin"], "xmax": tgAsDict["xmax"], "tiers": tiers}
+
+
 def _sortEntries(tg: Dict) -> None:
     for tier in tg["tiers"]:
         tier["entries"] = sorted(tier["entries"])
@@ -299,311 +795,711 @@ def _prepTgForSaving(
     return tg
 
 
-def _tgToShortTextForm(
-    tg: Dict,
-) -> str:
+def _iterShortTextForm(tg: Dict) -> Iterator[str]:
+    """Yield the short text form of a textgrid, one piece at a time."""
+    numToStr = my_math.numToStr
+    escapeQuotes = utils.escapeQuotes
 
     # Header
-    outputTxt = ""
-    outputTxt += 'File type = "ooTextFile"\n'
-    outputTxt += 'Object class = "TextGrid"\n\n'
-    outputTxt += "%s\n%s\n" % (
-        my_math.numToStr(tg["xmin"]),
-        my_math.numToStr(tg["xmax"]),
-    )
-    outputTxt += "<exists>\n%d\n" % len(tg["tiers"])
+    yield 'File type = "ooTextFile"\n'
+    yield 'Object class = "TextGrid"\n\n'
+    yield f"{numToStr(tg['xmin'])}\n{numToStr(tg['xmax'])}\n"
+    yield "<exists>\n%d\n" % len(tg["tiers"])
     for tier in tg["tiers"]:
-        text = ""
-        text += '"%s"\n' % tier["class"]
-        text += '"%s"\n' % utils.escapeQuotes(tier["name"])
-        text += "%s\n%s\n%s\n" % (
-            my_math.numToStr(tier["xmin"]),
-            my_math.numToStr(tier["xmax"]),
+        yield '"%s"\n' % tier["class"]
+        yield '"%s"\n' % escapeQuotes(tier["name"])
+        yield "%s\n%s\n%s\n" % (
+            numToStr(tier["xmin"]),
+            numToStr(tier["xmax"]),
             len(tier["entries"]),
         )
 
-        for entry in tier["entries"]:
-            entry = [my_math.numToStr(val) for val in entry[:-1]] + [
-                '"%s"' % utils.escapeQuotes(entry[-1])
-            ]
-
-            text += "\n".join([str(val) for val in entry]) + "\n"
-
-        outputTxt += text
+        if tier["class"] == INTERVAL_TIER:
+            for start, end, label in tier["entries"]:
+                yield f'{numToStr(start)}\n{numToStr(end)}\n"{escapeQuotes(label)}"\n'
+        else:
+            for timestamp, label in tier["entries"]:
+                yield f'{numToStr(timestamp)}\n"{escapeQuotes(label)}"\n'
 
-    return outputTxt
 
+def _iterLongTextForm(tg: Dict) -> Iterator[str]:
+    """Yield the long text form of a textgrid, one piece at a time."""
+    numToStr = my_math.numToStr
+    escapeQuotes = utils.escapeQuotes
 
-def _tgToLongTextForm(tg: Dict) -> str:
-    outputTxt = ""
-    outputTxt += 'File type = "ooTextFile"\n'
-    outputTxt += 'Object class = "TextGrid"\n\n'
+    yield 'File type = "ooTextFile"\n'
+    yield 'Object class = "TextGrid"\n\n'
 
     tab = " " * 4
 
     # Header
-    outputTxt += "xmin = %s \n" % my_math.numToStr(tg["xmin"])
-    outputTxt += "xmax = %s \n" % my_math.numToStr(tg["xmax"])
-    outputTxt += "tiers? <exists> \n"
-    outputTxt += "size = %d \n" % len(tg["tiers"])
-    outputTxt += "item []: \n"
+    yield "xmin = %s \n" % numToStr(tg["xmin"])
+    yield "xmax = %s \n" % numToStr(tg["xmax"])
+    yield "tiers? <exists> \n"
+    yield "size = %d \n" % len(tg["tiers"])
+    yield "item []: \n"
 
     for tierNum, tier in enumerate(tg["tiers"]):
         # Interval header
-        outputTxt += tab + "item [%d]:\n" % (tierNum + 1)
-        outputTxt += tab * 2 + 'class = "%s" \n' % tier["class"]
-        outputTxt += tab * 2 + 'name = "%s" \n' % utils.escapeQuotes(tier["name"])
-        outputTxt += tab * 2 + "xmin = %s \n" % my_math.numToStr(tier["xmin"])
-        outputTxt += tab * 2 + "xmax = %s \n" % my_math.numToStr(tier["xmax"])
+        yield tab + "item [%d]:\n" % (tierNum + 1)
+        yield tab * 2 + 'class = "%s" \n' % tier["class"]
+        yield tab * 2 + 'name = "%s" \n' % escapeQuotes(tier["name"])
+        yield tab * 2 + "xmin = %s \n" % numToStr(tier["xmin"])
+        yield tab * 2 + "xmax = %s \n" % numToStr(tier["xmax"])
 
         entries = tier["entries"]
         if tier["class"] == INTERVAL_TIER:
-            outputTxt += tab * 2 + "intervals: size = %d \n" % len(entries)
-            for intervalNum, entry in enumerate(entries):
-                start, end, label = entry
-                outputTxt += tab * 2 + "intervals [%d]:\n" % (intervalNum + 1)
-                outputTxt += tab * 3 + "xmin = %s \n" % my_math.numToStr(start)
-                outputTxt += tab * 3 + "xmax = %s \n" % my_math.numToStr(end)
-                outputTxt += tab * 3 + 'text = "%s" \n' % utils.escapeQuotes(label)
+            yield tab * 2 + "intervals: size = %d \n" % len(entries)
+            for intervalNum, (start, end, label) in enumerate(entries, 1):
+                yield (
+                    f"{tab * 2}intervals [{intervalNum}]:\n"
+                    f"{tab * 3}xmin = {numToStr(start)} \n"
+                    f"{tab * 3}xmax = {numToStr(end)} \n"
+                    f'{tab * 3}text = "{escapeQuotes(label)}" \n'
+                )
         else:
-            outputTxt += tab * 2 + "points: size = %d \n" % len(entries)
-            for pointNum, entry in enumerate(entries):
-                timestamp, label = entry
-                outputTxt += tab * 2 + "points [%d]:\n" % (pointNum + 1)
-                outputTxt += tab * 3 + "number = %s \n" % my_math.numToStr(timestamp)
-                outputTxt += tab * 3 + 'mark = "%s" \n' % utils.escapeQuotes(label)
+            yield tab * 2 + "points: size = %d \n" % len(entries)
+            for pointNum, (timestamp, label) in enumerate(entries, 1):
+                yield (
+                    f"{tab * 2}points [{pointNum}]:\n"
+                    f"{tab * 3}number = {numToStr(timestamp)} \n"
+                    f'{tab * 3}mark = "{escapeQuotes(label)}" \n'
+                )
 
-    return outputTxt
 
+def _writeJson(tgAsDict: Dict, fd: IO[str]) -> None:
+    """Write a json representation of a textgrid"""
+    json.dump(tgAsDict, fd, ensure_ascii=False)
 
-def _tgToJson(tgAsDict: Dict) -> str:
-    """Returns a json representation of a textgrid"""
-    return json.dumps(tgAsDict, ensure_ascii=False)
 
+def _packBinaryText(text: str, lengthFormat: str, escape: int) -> bytes:
+    """Encode a string like Praat's binputw8/binputw16.
 
-def _parseNormalTextgrid(data: str) -> Dict:
-    """Read a normal textgrid."""
-    data = data.replace("\r\n", "\n")
+    ASCII text is stored as is, prefixed by its length.  Other text is
+    marked by /escape/ and stored as UTF-16, prefixed by its length
+    in characters.
+    """
+    if len(text) >= escape:
+        raise errors.ArgumentError(
+            f"Text is too long to be saved in a binary textgrid: {text[:20]!r}..."
+        )
 
-    # Toss textgrid header
-    header, data = re.split(r"item ?\[", data, maxsplit=1, flags=re.MULTILINE)
+    if text.isascii():
+        return struct.pack(lengthFormat, len(text)) + text.encode("ascii")
 
-    headerList = header.split("\n")
-    tgMin = float(headerList[3].split("=")[1].strip())
-    tgMax = float(headerList[4].split("=")[1].strip())
+    return (
+        struct.pack(lengthFormat, escape)
+        + struct.pack(lengthFormat, len(text))
+        + text.encode("utf-16-be")
+    )
 
-    # Process each tier individually (will be output to separate folders)
-    tiers: List[Dict] = []
-    tierList = re.split(r"item ?\[", data, flags=re.MULTILINE)[1:]
-    for tierTxt in tierList:
-        if 'class = "IntervalTier"' in tierTxt:
-            tierType = INTERVAL_TIER
-            searchWord = r"intervals ?\["
-        else:
-            tierType = POINT_TIER
-            searchWord = r"points ?\["
-
-        # Get tier meta-information
-        try:
-            d = re.split(searchWord, tierTxt, flags=re.MULTILINE)
-            header, tierData = d[0], d[1:]
-        except ValueError:
-            # A tier with no entries
-            if re.search(r"size ?= ?0", tierTxt):
-                header = tierTxt
-                tierData: List[str] = []
-            else:
-                raise
-        tierName = reSearch(
-            r"name ?= ?\"(.*)\"\s*$", header, flags=re.MULTILINE
-        ).groups()[0]
-        tierName = re.sub(r'""', '"', tierName)
-
-        # "-0" has been reported as a potential start time
-        tierStartTimeStr = reSearch(
-            r"xmin ?= ?-?([\d.]+)\s*$", header, flags=re.MULTILINE
-        ).groups()[0]
-        tierStartTime = utils.strToIntOrFloat(tierStartTimeStr)
-
-        tierEndTimeStr = reSearch(
-            r"xmax ?= ?([\d.]+)\s*$", header, flags=re.MULTILINE
-        ).groups()[0]
-        tierEndTime = utils.strToIntOrFloat(tierEndTimeStr)
-
-        # Get the tier entry list
-        entries: List[Any] = []
-        if tierType == INTERVAL_TIER:
-            for element in tierData:
-                timeStart = reSearch(
-                    r"xmin ?= ?-?([\d.]+)\s*$", element, flags=re.MULTILINE
-                ).groups()[0]
-                timeEnd = reSearch(
-                    r"xmax ?= ?([\d.]+)\s*$", element, flags=re.MULTILINE
-                ).groups()[0]
-                label = reSearch(
-                    r"text ?= ?\"(.*)\"\s*$",
-                    element,
-                    flags=re.MULTILINE | re.DOTALL,
-                ).groups()[0]
-
-                label = label.strip()
-                label = re.sub(r'""', '"', label)
-                entries.append(Interval(timeStart, timeEnd, label))
-        else:
-            for element in tierData:
-                time = reSearch(
-                    r"number ?= ?-?([\d.]+)\s*$", element, flags=re.MULTILINE
-                ).groups()[0]
-                label = reSearch(
-                    r"mark ?= ?\"(.*)\"\s*$",
-                    element,
-                    flags=re.MULTILINE | re.DOTALL,
-                ).groups()[0]
-                label = label.strip()
-                entries.append(Point(time, label))
-
-        tierAsDict = {
-            "class": tierType,
-            "name": tierName,
-            "xmin": float(tierStartTime),
-            "xmax": float(tierEndTime),
-            "entries": entries,
-        }
-        tiers.append(tierAsDict)
 
-    tgDict = {"xmin": tgMin, "xmax": tgMax, "tiers": tiers}
+def _readBinary(fd: BinaryIO, numBytes: int) -> bytes:
+    data = fd.read(numBytes)
+    if len(data) != numBytes:
+        raise errors.ParsingError("Binary Textgrid is truncated.")
+
+    return data
 
-    return tgDict
 
+def _readBinaryStruct(fd: BinaryIO, structFormat: str) -> Tuple[Any, ...]:
+    return struct.unpack(structFormat, _readBinary(fd, struct.calcsize(structFormat)))
 
-def _parseShortTextgrid(data: str) -> Dict:
-    """Read a short textgrid file."""
-    data = data.replace("\r\n", "\n")
 
-    intervalIndicies = [(i, True) for i in utils.findAll(data, '"IntervalTier"')]
-    pointIndicies = [(i, False) for i in utils.findAll(data, '"TextTier"')]
+def _readBinaryText(fd: BinaryIO, lengthFormat: str, escape: int) -> str:
+    """Decode a string written by Praat's binputw8/binputw16."""
+    (length,) = _readBinaryStruct(fd, lengthFormat)
+    if length != escape:
+        return _readBinary(fd, length).decode("ascii")
 
-    indexList = [*intervalIndicies, *pointIndicies]
-    indexList.append((len(data), True))  # The 'end' of the file
-    indexList.sort()
+    (length,) = _readBinaryStruct(fd, lengthFormat)
+    data = _readBinary(fd, 2 * length)
+    text = data.decode("utf-16-be", "surrogatepass")
 
-    tupleList = [
-        (indexList[i][0], indexList[i + 1][0], indexList[i][1])
-        for i in range(len(indexList) - 1)
-    ]
+    # Characters outside of the BMP count as one character
+    # but take up two UTF-16 code units
+    while len(text) < length or "\ud800" <= text[-1:] <= "\udbff":
+        data += _readBinary(fd, 2)
+        text = data.decode("utf-16-be", "surrogatepass")
 
-    # Set the textgrid's min and max times
-    header = data[: tupleList[0][0]]
-    headerList = header.split("\n")
-    tgMin = float(headerList[3].strip())
-    tgMax = float(headerList[4].strip())
+    return text
 
-    # Load the data for each tier
+
+def _iterBinaryForm(tg: Dict) -> Iterator[bytes]:
+    """Yield the binary form of a textgrid, one piece at a time."""
+    yield BINARY_TEXTGRID_HEADER
+    yield _packBinaryText("TextGrid", ">B", 0xFF)
+    yield struct.pack(">dd?i", tg["xmin"], tg["xmax"], True, len(tg["tiers"]))
+
+    for tier in tg["tiers"]:
+        yield _packBinaryText(tier["class"], ">B", 0xFF)
+        yield _packBinaryText(tier["name"], ">H", 0xFFFF)
+        yield struct.pack(">ddi", tier["xmin"], tier["xmax"], len(tier["entries"]))
+        for entry in tier["entries"]:
+            yield struct.pack(f">{len(entry) - 1}d", *entry[:-1])
+            yield _packBinaryText(entry[-1], ">H", 0xFFFF)
+
+
+def _streamBinaryTextgrid(
+    fd: BinaryIO,
+    tierNames: Optional[Set[str]] = None,
+    headersOnly: bool = False,
+) -> Tuple[TextgridHeader, Iterator[TierItem]]:
+    """Read the header of a binary textgrid and then the rest incrementally.
+
+    See iterTextgrid().
+    """
+    if fd.read(len(BINARY_TEXTGRID_HEADER)) != BINARY_TEXTGRID_HEADER:
+        raise errors.ParsingError("Binary textgrid header missing.")
+
+    try:
+        objectClass = _readBinaryText(fd, ">B", 0xFF)
+    except UnicodeDecodeError:
+        raise errors.ParsingError("Binary Textgrid is corrupt.")
+    if objectClass != "TextGrid":
+        raise errors.ParsingError(
+            f"Expected a binary TextGrid but found a {objectClass!r}."
+        )
+
+    tgMin, tgMax, tiersExist = _readBinaryStruct(fd, ">dd?")
+    numTiers = _readBinaryStruct(fd, ">i")[0] if tiersExist else 0
+    tgHeader = TextgridHeader(
+        format=TextgridFormats.BINARY_TEXTGRID, xmin=tgMin, xmax=tgMax
+    )
+
+    return tgHeader, _iterBinaryTextgridTiers(fd, numTiers, tierNames, headersOnly)
+
+
+def _iterBinaryTextgridTiers(
+    fd: BinaryIO,
+    numTiers: int,
+    tierNames: Optional[Set[str]] = None,
+    headersOnly: bool = False,
+) -> Iterator[TierItem]:
+    try:
+        for _ in range(numTiers):
+            tierType = _readBinaryText(fd, ">B", 0xFF)
+            tierName = _readBinaryText(fd, ">H", 0xFFFF)
+            tierStartTime, tierEndTime, numEntries = _readBinaryStruct(fd, ">ddi")
+            if tierType not in [INTERVAL_TIER, POINT_TIER]:
+                raise errors.ParsingError(
+                    f"Unsupported tier type {tierType!r} in binary Textgrid."
+                )
+
+            isWanted = tierNames is None or tierName in tierNames
+            if isWanted:
+                yield {
+                    "class": tierType,
+                    "name": tierName,
+                    "xmin": tierStartTime,
+                    "xmax": tierEndTime,
+                    "size": numEntries,
+                }
+
+            # Entries are variable length, so skipped tiers still need to be read
+            if not isWanted or headersOnly:
+                for _ in range(numEntries):
+                    if tierType == INTERVAL_TIER:
+                        _readBinary(fd, 16)
+                    else:
+                        _readBinary(fd, 8)
+                    _readBinaryText(fd, ">H", 0xFFFF)
+                continue
+
+            if tierType == INTERVAL_TIER:
+                for _ in range(numEntries):
+                    start, end = _readBinaryStruct(fd, ">dd")
+                    label = _readBinaryText(fd, ">H", 0xFFFF)
+                    yield Interval(start, end, sys.intern(label.strip()))
+            else:
+                for _ in range(numEntries):
+                    (time,) = _readBinaryStruct(fd, ">d")
+                    label = _readBinaryText(fd, ">H", 0xFFFF)
+                    yield Point(time, sys.intern(label.strip()))
+    except UnicodeDecodeError:
+        raise errors.ParsingError("Binary Textgrid is corrupt.")
+
+
+def _parseBinaryTextgrid(data: bytes, tierNames: Optional[Set[str]] = None) -> Dict:
+    """Read a binary textgrid."""
+    return _collectTextgrid(*_streamBinaryTextgrid(io.BytesIO(data), tierNames))
+
+
+def _collectTextgrid(tgHeader: TextgridHeader, items: Iterable[TierItem]) -> Dict:
+    """Gather the output of iterTextgrid() into a textgrid dictionary."""
     tiers: List[Dict] = []
-    for blockStartI, blockEndI, isInterval in tupleList:
-        tierData = data[blockStartI:blockEndI]
-
-        # First row contains the tier type, which we already know
-        metaStartI = _fetchRow(tierData, 0)[1]
-
-        # Tier meta-information
-        tierName, tierNameEndI = _fetchTextRow(tierData, metaStartI)
-        tierStartTimeStr, tierStartTimeI = _fetchRow(tierData, tierNameEndI)
-        tierEndTimeStr, tierEndTimeI = _fetchRow(tierData, tierStartTimeI)
-        startTimeI = _fetchRow(tierData, tierEndTimeI)[1]
-
-        tierStartTime = utils.strToIntOrFloat(tierStartTimeStr)
-        tierEndTime = utils.strToIntOrFloat(tierEndTimeStr)
-
-        # Tier entry data
-        entries: List[Any] = []
-        if isInterval:
-            className = INTERVAL_TIER
-            while True:
-                try:
-                    startTime, endTimeI = _fetchRow(tierData, startTimeI)
-                    endTime, labelI = _fetchRow(tierData, endTimeI)
-                    label, startTimeI = _fetchTextRow(tierData, labelI)
-                except (ValueError, IndexError):
-                    break
-
-                label = label.strip()
-                entries.append(Interval(startTime, endTime, label))
+    entries: List[Any] = []
+    for item in items:
+        if isinstance(item, (Interval, Point)):
+            entries.append(item)
         else:
-            className = POINT_TIER
-            while True:
-                try:
-                    time, labelI = _fetchRow(tierData, startTimeI)
-                    label, startTimeI = _fetchTextRow(tierData, labelI)
-                except (ValueError, IndexError):
-                    break
-                label = label.strip()
-                entries.append(Point(time, label))
-
-        tierAsDict = {
-            "class": className,
-            "name": tierName,
-            "xmin": float(tierStartTime),
-            "xmax": float(tierEndTime),
-            "entries": entries,
-        }
-        tiers.append(tierAsDict)
+            entries = []
+            tiers.append(
+                {
+                    "class": item["class"],
+                    "name": item["name"],
+                    "xmin": item["xmin"],
+                    "xmax": item["xmax"],
+                    "entries": entries,
+                }
+            )
 
-    tgDict = {"xmin": tgMin, "xmax": tgMax, "tiers": tiers}
+    return {"xmin": tgHeader["xmin"], "xmax": tgHeader["xmax"], "tiers": tiers}
 
-    return tgDict
 
+def _strToTime(value: str) -> float:
+    time = float(value)
+    # "-0" has been reported as a potential start time
+    return time if time != 0 else 0.0
 
-def _fetchRow(
-    dataStr: str, index: int, searchStr: Optional[str] = None
-) -> Tuple[str, int]:
-    if searchStr is None:
-        startIndex = index
-    else:
-        startIndex = dataStr.index(searchStr, index) + len(searchStr)
 
-    endIndex = dataStr.index("\n", startIndex)
+def _readLongTextgridText(value: str, lines: Iterator[str]) -> str:
+    """Read a quoted text that starts in /value/, the remainder of the current line.
+
+    The text may continue onto the following lines.  Returns the text, without
+    the surrounding quotes and with escaped quotes ("") unescaped.
+    """
+    # A text ends with a double quote. Double quotes that appear
+    # in the text are escaped by a preceeding double quote, so
+    # the text is complete when the number of quotes is even.
+    quoteCount = value.count('"')
+    if quoteCount % 2 != 0:
+        chunks = [value]
+        for line in lines:
+            chunks.append(line)
+            quoteCount += line.count('"')
+            if quoteCount % 2 == 0:
+                break
+        else:
+            raise errors.ParsingError("Unterminated text in Textgrid.")
+        value = "".join(chunks)
+
+    value = value[value.index('"') + 1 : value.rindex('"')]
+    if quoteCount > 2:
+        value = value.replace('""', '"')
+
+    return value
 
-    word = dataStr[startIndex:endIndex]
-    word = word.strip()
-    if word[0] == '"' and word[-1] == '"':
-        word = word[1:-1]
-    word = word.strip()
 
-    return word, endIndex + 1
+def _readLongTextgridFields(lines: Iterator[str], numFields: int) -> Dict[str, str]:
+    """Read the next /numFields/ 'key = value' lines of a long textgrid."""
+    fields: Dict[str, str] = {}
+    for line in itertools.islice(lines, numFields):
+        key, _, value = line.partition("=")
+        if '"' in value:
+            value = _readLongTextgridText(value, lines)
+        fields[key.strip()] = value
 
+    return fields
 
-def _fetchTextRow(
-    dataStr: str, index: int, searchStr: Optional[str] = None
-) -> Tuple[str, int]:
-    if searchStr is None:
-        startIndex = index
+
+def _longTextgridTierHeader(fields: Dict[str, str]) -> TierHeader:
+    if fields["class"] == INTERVAL_TIER:
+        tierType = INTERVAL_TIER
+        size = fields.get("intervals: size", "0")
     else:
-        startIndex = dataStr.index(searchStr, index) + len(searchStr)
+        tierType = POINT_TIER
+        size = fields.get("points: size", "0")
+
+    return {
+        "class": tierType,
+        "name": fields["name"],
+        "xmin": _strToTime(fields["xmin"]),
+        "xmax": float(fields["xmax"]),
+        "size": int(size),
+    }
+
+
+def _skipLongTextgridTier(lines: Iterator[str]) -> Optional[str]:
+    """Skip over the entries of a tier in a long textgrid.
+
+    Returns the 'item [n]:' line that starts the next tier or None at the
+    end of the textgrid.  Lines inside of multi-line texts are recognized
+    by the parity of the number of quotes seen so far.
+    """
+    quoteCount = 0
+    for line in lines:
+        if quoteCount % 2 == 0 and line.lstrip().startswith("item"):
+            return line
+        quoteCount += line.count('"')
+
+    return None
 
-    # A textgrid text is ended by double quotes. Double quotes that
-    # appear in the text are escaped by a preceeding double quotes.
-    # We know we're at the end of a text if the number of double
-    # quotes is odd.
-    endIndex = startIndex + 1
-    while True:
-        quoteStartIndex = dataStr.index('"', endIndex)
-        quoteEndIndex = quoteStartIndex
-        while dataStr[quoteEndIndex] == '"':
-            quoteEndIndex += 1
 
-        endIndex = quoteEndIndex
+def _streamNormalTextgrid(
+    lines: Iterable[str],
+    tierNames: Optional[Set[str]] = None,
+    headersOnly: bool = False,
+) -> Tuple[TextgridHeader, Iterator[TierItem]]:
+    """Read the header of a normal textgrid and then the rest incrementally.
 
-        if (quoteEndIndex - quoteStartIndex) % 2 != 0:
-            break
+    See iterTextgrid().
+
+    The textgrid is read in a single pass over its lines.  Each line is
+    either a 'key = value' field or opens a new tier ('item [1]:') or
+    a new entry ('intervals [1]:' or 'points [1]:').  The lines must
+    keep their line endings.
+    """
+    lineIter: Iterator[str] = iter(lines)
+    header: Dict[str, str] = {}
+    try:
+        for line in lineIter:
+            key, sep, value = line.partition("=")
+            if sep:
+                if '"' in value:
+                    value = _readLongTextgridText(value, lineIter)
+                header[key.strip()] = value
+            elif key.strip():
+                # The fields of the textgrid are complete
+                lineIter = itertools.chain([line], lineIter)
+                break
+
+        tgHeader = TextgridHeader(
+            format=TextgridFormats.LONG_TEXTGRID,
+            xmin=float(header["xmin"]),
+            xmax=float(header["xmax"]),
+        )
+    except (KeyError, ValueError):
+        raise errors.ParsingError("Expected field in Textgrid missing.")
+
+    return tgHeader, _iterNormalTextgridTiers(lineIter, tierNames, headersOnly)
+
+
+def _iterNormalTextgridTiers(
+    lines: Iterator[str],
+    tierNames: Optional[Set[str]] = None,
+    headersOnly: bool = False,
+) -> Iterator[TierItem]:
+    """Read the tiers of a normal textgrid, after its header.
+
+    The entries of tiers that are not in /tierNames/ (or of all tiers,
+    if /headersOnly/) are skipped without being parsed.
+    """
+    fields: Dict[str, str] = {}
+    tierFields: Optional[Dict[str, str]] = None
+
+    try:
+        for line in lines:
+            key, sep, value = line.partition("=")
+            if sep:
+                if '"' in value:
+                    value = _readLongTextgridText(value, lines)
+                fields[key.strip()] = value
+                continue
+
+            key = key.strip()
+            if not key:
+                continue
+
+            # The fields of a tier are complete
+            if tierFields is not None:
+                tierHeader = _longTextgridTierHeader(tierFields)
+                tierFields = None
+                isWanted = tierNames is None or tierHeader["name"] in tierNames
+                if isWanted:
+                    yield tierHeader
+                if (not isWanted or headersOnly) and not key.startswith("item"):
+                    nextTierLine = _skipLongTextgridTier(lines)
+                    if nextTierLine is None:
+                        break
+                    key = nextTierLine.strip()
+
+            if key.startswith("intervals"):
+                entryFields = _readLongTextgridFields(lines, 3)
+                yield Interval(
+                    _strToTime(entryFields["xmin"]),
+                    float(entryFields["xmax"]),
+                    sys.intern(entryFields["text"].strip()),
+                )
+
+            elif key.startswith("points"):
+                entryFields = _readLongTextgridFields(lines, 2)
+                yield Point(
+                    _strToTime(entryFields["number"]),
+                    sys.intern(entryFields["mark"].strip()),
+                )
+
+            # The start of a new tier (but not the 'item []:' that precedes all tiers)
+            elif key.startswith("item") and "[]" not in key.replace(" ", ""):
+                fields = tierFields = {}
+
+        if tierFields is not None:
+            tierHeader = _longTextgridTierHeader(tierFields)
+            if tierNames is None or tierHeader["name"] in tierNames:
+                yield tierHeader
+    except (KeyError, ValueError):
+        raise errors.ParsingError("Expected field in Textgrid missing.")
+
+
+def _parseNormalTextgrid(data: str, tierNames: Optional[Set[str]] = None) -> Dict:
+    """Read a normal textgrid."""
+    lines = io.StringIO(data, newline=None)
+    return _collectTextgrid(*_streamNormalTextgrid(lines, tierNames))
 
-    word = dataStr[startIndex:endIndex]
-    word = word[1:-1]  # Remove the quote marks around the text
-    word = word.strip()
 
-    word = word.replace('""', '"')  # Unescape quote marks
+def _iterShortTextgridValues(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the values of a short textgrid, one per non-blank line.
 
-    # Advance to the end of the line
-    endIndex = dataStr.index("\n", endIndex)
+    Texts are returned with their quotes and may span several lines.
+    """
+    lines = iter(lines)
+    for line in lines:
+        value = line.strip()
+        if not value:
+            continue
+
+        if value[0] == '"' and value.count('"') % 2 != 0:
+            value = _readLongTextgridText(line, lines)
+            value = '"' + value.replace('"', '""') + '"'
+
+        yield value
+
+
+def _isShortTextgridHeader(value: str) -> bool:
+    """Is this value part of the file header of a short textgrid?
+
+    The header is 'File type = "ooTextFile"' and 'Object class = "TextGrid"',
+    or in files from older versions of Praat, 'File type = "ooTextFile short"'
+    and a bare '"TextGrid"'.  The first value after it is a number.
+    """
+    return "=" in value or value.startswith('"')
+
+
+def _shortTextgridText(value: str) -> str:
+    if len(value) < 2 or value[0] != '"' or value[-1] != '"':
+        raise errors.ParsingError(f"Expected a text in Textgrid but found {value!r}.")
+
+    return value[1:-1].replace('""', '"')
+
+
+def _streamShortTextgrid(
+    lines: Iterable[str],
+    tierNames: Optional[Set[str]] = None,
+    headersOnly: bool = False,
+) -> Tuple[TextgridHeader, Iterator[TierItem]]:
+    """Read the header of a short textgrid and then the rest incrementally.
+
+    See iterTextgrid().
+
+    A short textgrid contains one value per line, in a fixed order.  The
+    number of entries in each tier precedes the entries, so entries are
+    read without having to search for the start of the next tier.
+    """
+    values = _iterShortTextgridValues(lines)
+
+    try:
+        value = next(values)
+        while _isShortTextgridHeader(value):
+            value = next(values)
+
+        tgHeader = TextgridHeader(
+            format=TextgridFormats.SHORT_TEXTGRID,
+            xmin=float(value),
+            xmax=float(next(values)),
+        )
+    except (StopIteration, ValueError):
+        raise errors.ParsingError("Expected field in Textgrid missing.")
 
-    return word, endIndex + 1
+    return tgHeader, _iterShortTextgridTiers(values, tierNames, headersOnly)
+
+
+def _iterShortTextgridTiers(
+    values: Iterator[str],
+    tierNames: Optional[Set[str]] = None,
+    headersOnly: bool = False,
+) -> Iterator[TierItem]:
+    """Read the tiers of a short textgrid, after its header."""
+    try:
+        if next(values) != "<exists>":
+            return
+
+        numTiers = int(next(values))
+        for _ in range(numTiers):
+            tierType = _shortTextgridText(next(values))
+            tierName = _shortTextgridText(next(values)).strip()
+            tierStartTime = float(next(values))
+            tierEndTime = float(next(values))
+            numEntries = int(next(values))
+            if tierType not in [INTERVAL_TIER, POINT_TIER]:
+                raise errors.ParsingError(
+                    f"Unsupported tier type {tierType!r} in Textgrid."
+                )
+
+            isWanted = tierNames is None or tierName in tierNames
+            if isWanted:
+                yield {
+                    "class": tierType,
+                    "name": tierName,
+                    "xmin": tierStartTime,
+                    "xmax": tierEndTime,
+                    "size": numEntries,
+                }
+
+            if not isWanted or headersOnly:
+                valuesPerEntry = 3 if tierType == INTERVAL_TIER else 2
+                for _ in range(numEntries * valuesPerEntry):
+                    next(values)
+                continue
+
+            if tierType == INTERVAL_TIER:
+                for _ in range(numEntries):
+                    start = _strToTime(next(values))
+                    end = float(next(values))
+                    label = _shortTextgridText(next(values))
+                    yield Interval(start, end, sys.intern(label.strip()))
+            else:
+                for _ in range(numEntries):
+                    time = _strToTime(next(values))
+                    label = _shortTextgridText(next(values))
+                    yield Point(time, sys.intern(label.strip()))
+    except (StopIteration, ValueError):
+        raise errors.ParsingError("Expected field in Textgrid missing.")
+
+
+def _parseShortTextgrid(data: str, tierNames: Optional[Set[str]] = None) -> Dict:
+    """Read a short textgrid file.
+
+    The file is split into values, one per line, and each tier's entries
+    are read in one go using the number of entries that precedes them.
+    Texts that span several lines are rare, so the file is first read
+    assuming there are none.  Only if a text with an odd number of quotes
+    (the start of a multi-line text) is found are the lines merged and
+    the file read again.
+    """
+    if "\r" in data:
+        data = data.replace("\r\n", "\n").replace("\r", "\n")
+    lines = data.split("\n")
+    values = [line.strip() for line in lines]
+
+    tgAsDict = _readShortTextgridValues(
+        [value for value in values if value], tierNames, checkTexts=True
+    )
+    if tgAsDict is None:
+        values = _mergeShortTextgridTexts(lines, values)
+        tgAsDict = _readShortTextgridValues(values, tierNames, checkTexts=False)
+
+    assert tgAsDict is not None
+    return tgAsDict
+
+
+def _readShortTextgridValues(
+    values: List[str], tierNames: Optional[Set[str]], checkTexts: bool
+) -> Optional[Dict]:
+    """Read a short textgrid from its values, one per line.
+
+    Args:
+        values: the non-blank lines of the textgrid, stripped
+        tierNames: if given, only the tiers with these names are read
+        checkTexts: if True, None is returned as soon as a text with an
+            odd number of quotes is found.  That text continues on the
+            next line, so the values are out of step from there on.
+
+    Returns:
+        The textgrid dictionary
+    """
+
+    def hasMultilineText(textValues: List[str]) -> bool:
+        return checkTexts and any(
+            [value for value in textValues if value.count('"') % 2 != 0]
+        )
+
+    try:
+        i = 0
+        while _isShortTextgridHeader(values[i]):
+            i += 1
+
+        tgMin = float(values[i])
+        tgMax = float(values[i + 1])
+        tiers: List[Dict] = []
+        if values[i + 2] != "<exists>":
+            return {"xmin": tgMin, "xmax": tgMax, "tiers": tiers}
+
+        numTiers = int(values[i + 3])
+        i += 4
+        for _ in range(numTiers):
+            if hasMultilineText(values[i : i + 2]):
+                return None
+            tierType = _shortTextgridText(values[i])
+            tierName = _shortTextgridText(values[i + 1]).strip()
+            tierStartTime = float(values[i + 2])
+            tierEndTime = float(values[i + 3])
+            numEntries = int(values[i + 4])
+            i += 5
+
+            if tierType == INTERVAL_TIER:
+                valuesPerEntry = 3
+            elif tierType == POINT_TIER:
+                valuesPerEntry = 2
+            else:
+                raise errors.ParsingError(
+                    f"Unsupported tier type {tierType!r} in Textgrid."
+                )
+
+            entryValues = values[i : i + numEntries * valuesPerEntry]
+            i += numEntries * valuesPerEntry
+            labelValues = entryValues[valuesPerEntry - 1 :: valuesPerEntry]
+            if hasMultilineText(labelValues):
+                return None
+            if len(entryValues) != numEntries * valuesPerEntry:
+                raise IndexError()
+            if tierNames is not None and tierName not in tierNames:
+                continue
+
+            # 'or 0.0' turns "-0", which has been reported as a start time, into 0
+            times = [float(value) or 0.0 for value in entryValues[0::valuesPerEntry]]
+            for value in labelValues:
+                if len(value) < 2 or value[0] != '"' or value[-1] != '"':
+                    # Raises a ParsingError for the unquoted text
+                    _shortTextgridText(value)
+            # Labels repeat a lot (e.g. phones), so they are interned to share one string each
+            labels = [
+                sys.intern(value[1:-1].replace('""', '"').strip()) for value in labelValues
+            ]
+            entries: List[Any]
+            if tierType == INTERVAL_TIER:
+                endTimes = list(map(float, entryValues[1::3]))
+                entries = list(zip(times, endTimes, labels))
+            else:
+                entries = list(zip(times, labels))
+
+            tiers.append(
+                {
+                    "class": tierType,
+                    "name": tierName,
+                    "xmin": tierStartTime,
+                    "xmax": tierEndTime,
+                    "entries": entries,
+                }
+            )
+    except (IndexError, ValueError):
+        raise errors.ParsingError("Expected field in Textgrid missing.")
+
+    return {"xmin": tgMin, "xmax": tgMax, "tiers": tiers}
+
+
+def _mergeShortTextgridTexts(lines: List[str], values: List[str]) -> List[str]:
+    """Join the lines of texts that span several lines into one value each.
+
+    A text that continues on the next line starts with a line with an odd
+    number of quotes.  Returns the non-blank values, texts with their quotes.
+    """
+    mergedValues: List[str] = []
+    nextI = 0
+    for startI, value in enumerate(values):
+        if startI < nextI or value[:1] != '"' or value.count('"') % 2 == 0:
+            continue
+        mergedValues.extend(values[nextI:startI])
+
+        endI = startI
+        quoteCount = value.count('"')
+        while quoteCount % 2 != 0:
+            endI += 1
+            if endI == len(lines):
+                raise errors.ParsingError("Unterminated text in Textgrid.")
+            quoteCount += lines[endI].count('"')
+
+        mergedValues.append("\n".join(lines[startI : endI + 1]).strip())
+        nextI = endI + 1
+    mergedValues.extend(values[nextI:])
+
+    return [value for value in mergedValues if value]
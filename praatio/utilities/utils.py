@@ -1,13 +1,35 @@
 """Various generic utility functions."""
 
 import os
+import io
+import bisect
+import bz2
+import codecs
+import contextlib
+import gzip
+import lzma
 import subprocess
+import tempfile
 import itertools
+import operator
+import stat
 import wave
 from importlib import resources
 from typing_extensions import Literal
 from typing import (
-    Any, List, Tuple, NoReturn, Type, Optional, Iterable, Collection, Sequence, Callable, TypeVar
+    Any,
+    List,
+    Tuple,
+    NoReturn,
+    Type,
+    Optional,
+    Iterable,
+    Collection,
+    Sequence,
+    Callable,
+    TypeVar,
+    IO,
+    Iterator,
 )
 
 from praatio.utilities import errors
@@ -23,6 +45,11 @@ else:
     with resources.path("praatio", "praatScripts") as path:
         scriptsPath = path
 
+# The umask can only be read by changing it, which would race with other
+# threads creating files, so it is only read once, when praatio is imported
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 class TogglableLogger:
     """
@@ -342,6 +369,11 @@ def getValuesInInterval(
     return intervalDataList
 
 
+def isSorted(values: Sequence[Any]) -> bool:
+    """Return True if the values are in non-decreasing order."""
+    return all(map(operator.le, values, itertools.islice(values, 1, None)))
+
+
 def sign(x: float) -> int:
     """Return 1 if x is positive, 0 if x is 0, and -1 otherwise."""
     retVal = 0
@@ -410,6 +442,163 @@ def makeDir(path: str) -> None:
         os.mkdir(path)
 
 
+def sniffEncoding(data: bytes) -> str:
+    """Guess the encoding of a text file from its first few bytes.
+
+    Praat writes UTF-16 files with a byte order mark.  Files without one
+    are UTF-16 if every other byte of the (ascii) header is null and
+    UTF-8 otherwise.
+    """
+    if data.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if data.startswith((codecs.BOM_UTF16_BE, codecs.BOM_UTF16_LE)):
+        return "utf-16"
+    if len(data) >= 2 and data[0] == 0 and data[1] != 0:
+        return "utf-16-be"
+    if len(data) >= 2 and data[0] != 0 and data[1] == 0:
+        return "utf-16-le"
+
+    return "utf-8"
+
+
+def decodeText(data: bytes, encoding: Optional[str] = None) -> str:
+    """Decode the contents of a text file, in one pass.
+
+    Line endings are normalized to '\\n', as when reading a file in text mode.
+
+    Args:
+        data: the contents of the file
+        encoding: if None, the encoding is detected with sniffEncoding()
+    """
+    if encoding is None:
+        encoding = sniffEncoding(data[:4])
+
+    text = data.decode(encoding)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    return text
+
+
+# The modules used to (de)compress files, by file extension and by magic bytes
+COMPRESSION_EXTENSIONS = {".gz": gzip, ".bz2": bz2, ".xz": lzma}
+COMPRESSION_MAGIC_BYTES = [
+    (b"\x1f\x8b", gzip),
+    (b"BZh", bz2),
+    (b"\xfd7zXZ\x00", lzma),
+]
+
+
+def openFile(
+    fnFullPath: str,
+    mode: str = "r",
+    encoding: Optional[str] = None,
+    newline: Optional[str] = None,
+) -> IO:
+    """Open a file that may be compressed with gzip, bzip2 or xz.
+
+    Compressed files are read if they start with the magic bytes of one
+    of these formats, whatever their name.  Files are written compressed
+    if their name ends in '.gz', '.bz2' or '.xz'.  The data is
+    (de)compressed as it is streamed, without a temporary file.
+
+    Args:
+        fnFullPath: the path to the file
+        mode: as in io.open(); 'r', 'w', 'a' or 'x', optionally with 'b' or 't'
+        encoding: as in io.open(); only for text modes
+        newline: as in io.open(); only for text modes
+    """
+    module = None
+    if "r" in mode:
+        with io.open(fnFullPath, "rb") as fd:
+            start = fd.read(6)
+        for magicBytes, compressionModule in COMPRESSION_MAGIC_BYTES:
+            if start.startswith(magicBytes):
+                module = compressionModule
+                break
+    else:
+        extension = os.path.splitext(fnFullPath)[1].lower()
+        module = COMPRESSION_EXTENSIONS.get(extension)
+
+    if module is None:
+        return io.open(fnFullPath, mode, encoding=encoding, newline=newline)
+
+    if "b" not in mode and "t" not in mode:
+        mode += "t"
+    return module.open(  # type: ignore[attr-defined]
+        fnFullPath, mode, encoding=encoding, newline=newline
+    )
+
+
+@contextlib.contextmanager
+def openFileForReplacing(
+    fnFullPath: str, mode: str = "w", encoding: Optional[str] = None
+) -> Iterator[IO]:
+    """Open a file to write that only replaces /fnFullPath/ once it is complete.
+
+    The data is written to a temporary file in the same directory, which
+    is moved over /fnFullPath/ when the block ends.  If the block raises
+    an exception, the temporary file is removed and any existing file at
+    /fnFullPath/ is left as it was.  See openFile() for the arguments.
+
+    If /fnFullPath/ is a symlink, the file it points to is replaced.  An
+    existing file keeps its permissions (and its owner, where allowed).
+    If no temporary file can be made because the directory is read-only,
+    /fnFullPath/ is written to directly instead.
+    """
+    fnFullPath = os.path.realpath(fnFullPath)
+    directory, name = os.path.split(fnFullPath)
+    try:
+        # Keep the extension, which determines the compression
+        tmpFd, tmpFN = tempfile.mkstemp(
+            suffix=os.path.splitext(name)[1], prefix=f".{name}.", dir=directory
+        )
+    except PermissionError:
+        tmpFN = None
+
+    if tmpFN is None:
+        with openFile(fnFullPath, mode, encoding=encoding) as fd:
+            yield fd
+        return
+
+    os.close(tmpFd)
+    try:
+        with openFile(tmpFN, mode, encoding=encoding) as fd:
+            yield fd
+
+        # mkstemp() makes the file private; give it the permissions
+        # of the file it replaces, or else those of a new file
+        try:
+            fileStat = os.stat(fnFullPath)
+        except FileNotFoundError:
+            os.chmod(tmpFN, 0o666 & ~_UMASK)
+        else:
+            os.chmod(tmpFN, stat.S_IMODE(fileStat.st_mode))
+            if hasattr(os, "chown"):
+                # Only the superuser can give a file to another user
+                with contextlib.suppress(PermissionError):
+                    os.chown(tmpFN, fileStat.st_uid, fileStat.st_gid)
+        os.replace(tmpFN, fnFullPath)
+    except BaseException:
+        os.remove(tmpFN)
+        raise
+
+
+def readTextFile(fnFullPath: str, encoding: Optional[str] = None) -> str:
+    """Read a text file, reading and decoding it only once.
+
+    The file may be compressed (see openFile()).
+
+    Args:
+        fnFullPath: the path to the file
+        encoding: if None, the encoding is detected with sniffEncoding()
+    """
+    with openFile(fnFullPath, "rb") as fd:
+        data = fd.read()
+
+    return decodeText(data, encoding)
+
+
 def findAll(txt: str, subStr: str) -> List[int]:
     """Find the starting indices of all instances of subStr in txt."""
     indexList: List[int] = []
@@ -498,6 +687,25 @@ def chooseClosestTime(
     return min(candidates, key=lambda x: abs(x - targetTime))
 
 
+def getNearestValue(targetTime: float, sortedValues: Sequence[float]) -> float:
+    """Get the value in a sorted sequence that is closest to the target time.
+
+    Uses a binary search, so /sortedValues/ must be sorted.  If two values
+    are equally close, the smaller one is returned.
+
+    Raises:
+        ValueError: sortedValues is empty (as min() would raise)
+    """
+    if len(sortedValues) == 0:
+        raise ValueError("getNearestValue() arg is an empty sequence")
+
+    i = bisect.bisect_left(sortedValues, targetTime)
+    before = sortedValues[i - 1] if i > 0 else None
+    after = sortedValues[i] if i < len(sortedValues) else None
+
+    return chooseClosestTime(targetTime, before, after)
+
+
 def getInterval(
     startTime: float, duration: float, maximum: float, reverse: bool
 ) -> Tuple[float, float]:
@@ -0,0 +1,115 @@
+import unittest
+import copy
+import pickle
+
+from praatio.data_classes.columnar_entries import ColumnarEntries
+from praatio.utilities import errors
+from praatio.utilities.constants import Interval, Point, KlattPoint
+
+from tests.praatio_test_case import PraatioTestCase
+
+
+class TestColumnarEntries(PraatioTestCase):
+    def setUp(self):
+        super(TestColumnarEntries, self).setUp()
+        self.intervals = [
+            Interval(0.5, 1.0, "a"),
+            Interval(1.0, 2.0, "b"),
+            Interval(3.0, 4.5, "c"),
+        ]
+
+    def test_entries_are_read_back_as_named_tuples(self):
+        sut = ColumnarEntries(Interval, self.intervals)
+
+        self.assertEqual(3, len(sut))
+        self.assertEqual(self.intervals, list(sut))
+        self.assertEqual(self.intervals[::-1], list(reversed(sut)))
+        self.assertEqual(Interval(3.0, 4.5, "c"), sut[-1])
+        self.assertIsInstance(sut[0], Interval)
+        self.assertEqual(self.intervals[1:], sut[1:])
+        self.assertEqual(self.intervals, sut)
+        self.assertIn(Interval(1.0, 2.0, "b"), sut)
+
+    def test_timestamps_are_stored_in_arrays(self):
+        sut = ColumnarEntries(Point, [Point(0.5, "a"), Point(1.5, "b")])
+
+        self.assertEqual("d", sut.column(0).typecode)
+        self.assertEqual(["a", "b"], sut.column(1))
+        self.assertEqual(
+            "d", ColumnarEntries(KlattPoint, [KlattPoint(1.0, 2.0)]).column(1).typecode
+        )
+
+    def test_entries_can_be_changed_like_a_list(self):
+        sut = ColumnarEntries(Interval, self.intervals)
+        expected = list(self.intervals)
+
+        for entries in [sut, expected]:
+            entries.append(Interval(5.0, 6.0, "d"))
+            entries.insert(0, Interval(0.0, 0.5, "e"))
+            entries[1] = Interval(0.5, 0.75, "f")
+            del entries[2]
+            entries[-2:] = [Interval(7.0, 8.0, "g")]
+            entries.remove(Interval(0.0, 0.5, "e"))
+            entries.extend([Interval(6.0, 7.0, "h")])
+            entries.sort()
+
+        self.assertEqual(expected, sut)
+
+    def test_copies_do_not_share_columns(self):
+        sut = ColumnarEntries(Interval, self.intervals)
+
+        for entriesCopy in [
+            sut.copy(),
+            sut + [],
+            copy.deepcopy(sut),
+            pickle.loads(pickle.dumps(sut)),
+        ]:
+            self.assertEqual(sut, entriesCopy)
+            del entriesCopy[0]
+            self.assertEqual(3, len(sut))
+
+    def test_categorical_entries_store_labels_as_codes(self):
+        sut = ColumnarEntries(
+            Point, [Point(0.5, "a"), Point(1.5, "b"), Point(2.5, "a")], categorical=True
+        )
+
+        self.assertTrue(sut.isCategorical)
+        self.assertEqual(["a", "b"], sut.vocabulary)
+        self.assertEqual([0, 1, 0], list(sut.column(1)))
+        self.assertEqual(1, sut.labelCode("b"))
+        self.assertIsNone(sut.labelCode("c"))
+        self.assertEqual([Point(0.5, "a"), Point(1.5, "b"), Point(2.5, "a")], sut)
+        self.assertEqual(Point(2.5, "a"), sut[-1])
+        self.assertEqual([Point(1.5, "b"), Point(0.5, "a")], list(reversed(sut))[1:])
+
+    def test_categorical_entries_can_be_changed_like_a_list(self):
+        sut = ColumnarEntries(Interval, self.intervals, categorical=True)
+        expected = list(self.intervals)
+
+        for entries in [sut, expected]:
+            entries.append(Interval(5.0, 6.0, "d"))
+            entries.insert(0, Interval(0.0, 0.5, "a"))
+            entries[1] = Interval(0.5, 0.75, "f")
+            entries[-2:] = [Interval(7.0, 8.0, "g")]
+            entries.extend(ColumnarEntries(Interval, [Interval(8.0, 9.0, "b")]))
+            entries.sort()
+
+        self.assertEqual(expected, sut)
+        self.assertEqual(["a", "b", "c", "d", "f", "g"], sut.vocabulary)
+
+    def test_categorical_copies_do_not_share_vocabularies(self):
+        sut = ColumnarEntries(Interval, self.intervals, categorical=True)
+
+        for entriesCopy in [sut.copy(), copy.deepcopy(sut), pickle.loads(pickle.dumps(sut))]:
+            self.assertTrue(entriesCopy.isCategorical)
+            self.assertEqual(sut, entriesCopy)
+            entriesCopy.append(Interval(5.0, 6.0, "d"))
+            self.assertEqual(["a", "b", "c"], sut.vocabulary)
+
+    def test_categorical_entries_need_labels(self):
+        with self.assertRaises(errors.ArgumentError) as _:
+            ColumnarEntries(KlattPoint, [KlattPoint(1.0, 2.0)], categorical=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
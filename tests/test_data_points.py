@@ -34,6 +34,19 @@ class TestDataPoint(PraatioTestCase):
             areTheSameFiles(inputFN, outputFN, data_points.open2DPointObject)
         )
 
+    def test_compressed_pitch_io(self):
+        """Tests for reading/writing compressed pitch tiers."""
+        fn = "mary.PitchTier"
+        inputFN = join(self.dataRoot, fn)
+        outputFN = join(self.outputRoot, fn + ".bz2")
+
+        pp = data_points.open2DPointObject(inputFN)
+        pp.save(outputFN)
+
+        self.assertTrue(
+            areTheSameFiles(inputFN, outputFN, data_points.open2DPointObject)
+        )
+
     def test_pitch_io_long_vs_short(self):
         """Tests reading of long vs short 2d point objects."""
 
@@ -0,0 +1,163 @@
+import unittest
+
+from praatio import textgrid
+from praatio.data_classes.interval_index import IntervalIndex, IndexedInterval
+from praatio.utilities import errors
+from praatio.utilities import utils
+from praatio.utilities.constants import Interval
+
+from tests.praatio_test_case import PraatioTestCase
+from tests.testing_utils import makeIntervalTier, makePointTier
+
+
+class TestIntervalIndex(PraatioTestCase):
+    def setUp(self):
+        super(TestIntervalIndex, self).setUp()
+        self.annotatorA = makeIntervalTier(
+            "words",
+            [[0.0, 1.0, "hello"], [1.0, 2.5, "world"], [3.0, 4.0, "bye"]],
+        )
+        self.annotatorB = makeIntervalTier(
+            "words",
+            [[0.2, 0.9, "hello"], [1.2, 3.2, "world"], [3.5, 4.0, "bye"]],
+        )
+        self.sut = IntervalIndex([self.annotatorA, self.annotatorB])
+
+    def test_find_overlapping_across_tiers(self):
+        self.assertEqual(
+            [
+                IndexedInterval(0, Interval(1.0, 2.5, "world")),
+                IndexedInterval(1, Interval(1.2, 3.2, "world")),
+                IndexedInterval(0, Interval(3.0, 4.0, "bye")),
+            ],
+            self.sut.findOverlapping(2.0, 3.1),
+        )
+        self.assertEqual([], self.sut.findOverlapping(4.0, 5.0))
+
+    def test_find_overlapping_with_thresholds(self):
+        # [1.0, 2.5] overlaps [2.0, 3.1] by 0.5s, 23% of the time they span
+        self.assertEqual(
+            [IndexedInterval(1, Interval(1.2, 3.2, "world"))],
+            self.sut.findOverlapping(2.0, 3.1, percentThreshold=0.3),
+        )
+        self.assertEqual(
+            [
+                IndexedInterval(0, Interval(1.0, 2.5, "world")),
+                IndexedInterval(1, Interval(1.2, 3.2, "world")),
+            ],
+            self.sut.findOverlapping(2.0, 3.1, timeThreshold=0.5),
+        )
+        self.assertEqual(
+            [
+                IndexedInterval(0, Interval(3.0, 4.0, "bye")),
+                IndexedInterval(1, Interval(3.5, 4.0, "bye")),
+            ],
+            self.sut.findOverlapping(4.0, 5.0, boundaryInclusive=True),
+        )
+
+    def test_find_within_and_containing(self):
+        self.assertEqual(
+            [
+                IndexedInterval(0, Interval(0.0, 1.0, "hello")),
+                IndexedInterval(1, Interval(0.2, 0.9, "hello")),
+            ],
+            self.sut.findWithin(0.0, 1.2),
+        )
+        self.assertEqual(
+            [
+                IndexedInterval(0, Interval(1.0, 2.5, "world")),
+                IndexedInterval(1, Interval(1.2, 3.2, "world")),
+            ],
+            self.sut.findContaining(1.5, 2.0),
+        )
+
+    def test_find_at(self):
+        self.assertEqual(
+            [IndexedInterval(0, Interval(1.0, 2.5, "world"))],
+            self.sut.findAt(1.0),
+        )
+        self.assertEqual(
+            [
+                IndexedInterval(0, Interval(0.0, 1.0, "hello")),
+                IndexedInterval(0, Interval(1.0, 2.5, "world")),
+            ],
+            self.sut.findAt(1.0, boundaryInclusive=True),
+        )
+
+    def test_find_overlapping_pairs(self):
+        self.assertEqual(
+            [
+                (
+                    IndexedInterval(0, Interval(0.0, 1.0, "hello")),
+                    IndexedInterval(1, Interval(0.2, 0.9, "hello")),
+                ),
+                (
+                    IndexedInterval(0, Interval(1.0, 2.5, "world")),
+                    IndexedInterval(1, Interval(1.2, 3.2, "world")),
+                ),
+                (
+                    IndexedInterval(0, Interval(3.0, 4.0, "bye")),
+                    IndexedInterval(1, Interval(1.2, 3.2, "world")),
+                ),
+                (
+                    IndexedInterval(0, Interval(3.0, 4.0, "bye")),
+                    IndexedInterval(1, Interval(3.5, 4.0, "bye")),
+                ),
+            ],
+            self.sut.findOverlappingPairs(),
+        )
+
+    def test_queries_match_checking_every_interval(self):
+        # Enough intervals that the queries search the tree, not just scan it
+        tiers = [
+            makeIntervalTier(
+                intervals=[[i * step, i * step + length, str(i)] for i in range(40)]
+            )
+            for step, length in [(1.0, 0.5), (1.5, 1.5), (2.0, 0.3), (40.0, 30.0)]
+        ]
+        sut = IntervalIndex(tiers)
+        allEntries = sorted(
+            [IndexedInterval(i, entry) for i, tier in enumerate(tiers) for entry in tier],
+            key=lambda entry: (entry.interval[:2], entry.tierIndex),
+        )
+
+        for start, end in [(0, 0.2), (3.2, 7.7), (10.0, 10.0), (50.5, 62.0), (99, 120)]:
+            self.assertEqual(
+                [
+                    entry
+                    for entry in allEntries
+                    if utils.intervalOverlapCheck(
+                        Interval(start, end, ""), entry.interval
+                    )
+                ],
+                sut.findOverlapping(start, end),
+            )
+            self.assertEqual(
+                [
+                    entry
+                    for entry in allEntries
+                    if entry.interval.start <= start < entry.interval.end
+                ],
+                sut.findAt(start),
+            )
+
+    def test_single_and_empty_tiers(self):
+        tier = makeIntervalTier(intervals=[[1.0, 2.0, "hello"]])
+
+        self.assertEqual(
+            [IndexedInterval(0, Interval(1.0, 2.0, "hello"))],
+            IntervalIndex(tier).findAt(1.5),
+        )
+        self.assertEqual([], IntervalIndex([]).findOverlapping(0, 10))
+        self.assertEqual(0, len(IntervalIndex(makeIntervalTier(intervals=[]))))
+
+    def test_raises_error_for_point_tiers(self):
+        with self.assertRaises(errors.IncompatibleTierError) as _:
+            IntervalIndex([self.annotatorA, makePointTier()])
+
+    def test_is_available_from_textgrid(self):
+        self.assertIs(IntervalIndex, textgrid.IntervalIndex)
+
+
+if __name__ == "__main__":
+    unittest.main()
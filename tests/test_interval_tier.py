@@ -1,12 +1,15 @@
 import unittest
+from array import array
 from os.path import join
 import io
 from contextlib import redirect_stdout
 
 from praatio import textgrid
+from praatio.data_classes.textgrid_tier import TextgridTier
 from praatio.utilities.constants import Interval, INTERVAL_TIER, Point
 from praatio.utilities import errors
 from praatio.utilities import constants
+from praatio.utilities import utils
 
 from tests.praatio_test_case import PraatioTestCase
 from tests import testing_utils
@@ -54,6 +57,120 @@ class TestIntervalTier(PraatioTestCase):
         sut.maxTimestamp = 5
         self.assertEqual(sut, intervalTier)
 
+    def test_from_sorted_entries_creates_the_same_tier_as_the_constructor(self):
+        intervals = [Interval(1.0, 2.0, "hello"), Interval(2.5, 3.0, "world")]
+
+        sut = textgrid.IntervalTier.fromSortedEntries("foo", intervals, 0.5)
+
+        self.assertEqual(textgrid.IntervalTier("foo", intervals, 0.5), sut)
+        self.assertEqual((0.5, 3.0), (sut.minTimestamp, sut.maxTimestamp))
+
+    def test_new_without_entries_copies_the_tier(self):
+        tier = makeIntervalTier(intervals=[[1.0, 2.0, "hello"]])
+
+        sut = tier.new()
+        sut.insertEntry(Interval(2.0, 3.0, "world"))
+
+        self.assertEqual((Interval(1.0, 2.0, "hello"),), tier.entries)
+        self.assertEqual(2, len(sut))
+
+    def test_new_shares_entries_until_either_tier_is_modified(self):
+        intervals = [Interval(1.0, 2.0, "hello"), Interval(2.5, 3.0, "world")]
+        modifications = [
+            lambda tier: tier.insertEntry(Interval(4.0, 5.0, "bye")),
+            lambda tier: tier.deleteEntry(Interval(1.0, 2.0, "hello")),
+            lambda tier: tier.__setitem__(0, Interval(0.0, 1.0, "hi")),
+            lambda tier: tier.__delitem__(slice(0, 1)),
+        ]
+        for modify in modifications:
+            for compact in [False, True]:
+                tier = makeIntervalTier(intervals=intervals)
+                if compact:
+                    tier.compact()
+                sut = tier.new()
+                self.assertIs(tier._entries, sut._entries)
+
+                modify(sut)
+                self.assertEqual(tuple(intervals), tier.entries)
+
+                expected = tier.new(entries=tier.entries)
+                modify(tier)
+                self.assertEqual(sut, tier)
+                self.assertNotEqual(expected, sut)
+
+    def test_new_shares_entries_without_sharing_later_searches(self):
+        tier = makeIntervalTier(
+            intervals=[[1.0, 2.0, "hello"], [2.5, 3.0, "world"], [4.0, 5.0, "hello"]]
+        )
+        self.assertEqual([0, 2], tier.find("hello"))
+        sut = tier.new()
+
+        sut.insertEntry(Interval(0.0, 0.5, "hello"))
+
+        self.assertEqual([0, 2], tier.find("hello"))
+        self.assertEqual([0, 1, 3], sut.find("hello"))
+
+    def test_compact_tiers_behave_like_other_tiers(self):
+        tier = makeIntervalTier(
+            intervals=[[1.0, 2.0, "hello"], [2.5, 3.0, "world"], [4.0, 5.0, "bye"]]
+        )
+        sut = tier.new()
+        sut.compact()
+
+        self.assertTrue(sut.isCompact)
+        self.assertFalse(tier.isCompact)
+        self.assertEqual(tier, sut)
+        self.assertEqual(tier.entries, sut.entries)
+        self.assertEqual(tier[1:], sut[1:])
+        self.assertTrue(sut.new().isCompact)
+        self.assertEqual(
+            tier.crop(1.5, 4.5, "truncated", True),
+            sut.crop(1.5, 4.5, "truncated", True),
+        )
+        self.assertEqual(tier.appendTier(tier), sut.appendTier(sut))
+        self.assertEqual(tier.find("bye"), sut.find("bye"))
+
+        for entries in [tier, sut]:
+            entries.insertEntry(Interval(3.0, 4.0, "new"))
+            entries.deleteEntry(Interval(1.0, 2.0, "hello"))
+            entries[0] = Interval(2.5, 2.75, "world")
+        self.assertEqual(tier, sut)
+        self.assertTrue(sut.isCompact)
+
+    def test_categorical_tiers_behave_like_other_tiers(self):
+        tier = makeIntervalTier(
+            intervals=[[1.0, 2.0, "hello"], [2.5, 3.0, "the"], [4.0, 5.0, "hello"]]
+        )
+        sut = tier.new()
+        sut.compact(categorical=True)
+
+        self.assertTrue(sut.isCompact)
+        self.assertTrue(sut.isCategorical)
+        self.assertEqual(tier, sut)
+        self.assertTrue(sut.new().isCategorical)
+        self.assertTrue(sut.union(tier).isCategorical)
+        for matchLabel, substrMatchFlag, usingRE in [
+            ("hello", False, False),
+            ("mage", False, False),
+            ("he", True, False),
+            ("[eo]", False, True),
+        ]:
+            self.assertEqual(
+                tier.find(matchLabel, substrMatchFlag, usingRE),
+                sut.find(matchLabel, substrMatchFlag, usingRE),
+            )
+
+        for entries in [tier, sut]:
+            entries.insertEntries([Interval(3.0, 4.0, "new"), Interval(0.5, 1.0, "the")])
+            entries.deleteEntry(Interval(1.0, 2.0, "hello"))
+        self.assertEqual(tier, sut)
+        self.assertEqual(tier.find("the"), sut.find("the"))
+        self.assertTrue(sut.isCategorical)
+
+        sut.compact()
+        self.assertTrue(sut.isCompact)
+        self.assertFalse(sut.isCategorical)
+
     def test__len__returns_the_number_of_intervals_in_the_interval_tier(self):
         interval1 = Interval(1.0, 2.0, "hello")
         interval2 = Interval(2.0, 3.0, "world")
@@ -265,6 +382,106 @@ class TestIntervalTier(PraatioTestCase):
             [0, 1, 2], sut.find("[eo]", substrMatchFlag=False, usingRE=True)
         )
 
+    def test_entry_at_finds_the_interval_containing_a_time(self):
+        sut = makeIntervalTier(
+            intervals=[
+                Interval(1, 2, "hello"),
+                Interval(2, 3.0, "the"),
+                Interval(3.5, 4.0, "world"),
+            ],
+        )
+
+        self.assertEqual(Interval(1, 2, "hello"), sut.entryAt(1))
+        self.assertEqual(Interval(1, 2, "hello"), sut.entryAt(1.5))
+        self.assertEqual(Interval(2, 3.0, "the"), sut.entryAt(2))
+        self.assertIsNone(sut.entryAt(0.5))
+        self.assertIsNone(sut.entryAt(3.2))
+        self.assertIsNone(sut.entryAt(4.0))
+
+    def test_entries_at_finds_the_intervals_containing_many_times(self):
+        sut = makeIntervalTier(
+            intervals=[Interval(1, 2, "hello"), Interval(3.5, 4.0, "world")],
+        )
+        compactTier = sut.new()
+        compactTier.compact()
+        times = [3.75, 0.5, 1.0, 1.99, 2.5, 3.5, 5]
+
+        for tier in [sut, compactTier]:
+            self.assertEqual([1, None, 0, 0, None, 1, None], tier.indicesAt(times))
+            self.assertEqual(
+                [
+                    Interval(3.5, 4.0, "world"),
+                    None,
+                    Interval(1, 2, "hello"),
+                    Interval(1, 2, "hello"),
+                    None,
+                    Interval(3.5, 4.0, "world"),
+                    None,
+                ],
+                tier.entriesAt(times),
+            )
+
+    def test_find_with_repeated_labels(self):
+        sut = makeIntervalTier(
+            intervals=[
+                Interval(1, 2, "the"),
+                Interval(2.5, 3.0, "THE"),
+                Interval(3.5, 4.0, "world"),
+                Interval(4.5, 5.0, "the"),
+            ],
+        )
+
+        self.assertEqual([0, 3], sut.find("the"))
+        self.assertEqual([0, 3], sut.find("th", substrMatchFlag=True))
+        self.assertEqual([0, 1, 3], sut.find("^the$", usingRE=True))
+
+    def test_find_sees_changes_to_the_tier(self):
+        sut = makeIntervalTier(
+            intervals=[
+                Interval(1, 2, "hello"),
+                Interval(2.5, 3.0, "the"),
+                Interval(3.5, 4.0, "world"),
+            ],
+        )
+        self.assertEqual([1], sut.find("the"))
+
+        sut.insertEntry(Interval(0.5, 1.0, "the"))
+        self.assertEqual([0, 2], sut.find("the"))
+
+        sut.deleteEntry(Interval(0.5, 1.0, "the"))
+        self.assertEqual([1], sut.find("the"))
+
+        sut[0] = Interval(1, 2, "the")
+        self.assertEqual([0, 1], sut.find("the"))
+
+        del sut[0]
+        self.assertEqual([0], sut.find("the"))
+
+        sut.insertEntries([Interval(4.0, 4.5, "the"), Interval(0, 1, "world")])
+        self.assertEqual([1, 3], sut.find("the"))
+
+        with sut.batch():
+            sut.insertEntry(Interval(5.0, 6.0, "the"))
+        self.assertEqual([1, 3, 4], sut.find("the"))
+
+    def test_find_all_finds_many_labels(self):
+        sut = makeIntervalTier(
+            intervals=[
+                Interval(1, 2, "hello"),
+                Interval(2.5, 3.0, "the"),
+                Interval(3.5, 4.0, "world"),
+                Interval(4.5, 5.0, "the"),
+            ],
+        )
+
+        self.assertEqual(
+            {"the": [1, 3], "world": [2], "mage": []},
+            sut.findAll(["the", "world", "mage"]),
+        )
+        self.assertEqual(
+            {"he": [0, 1, 3], "o": [0, 2]}, sut.findAll(["he", "o"], substrMatchFlag=True)
+        )
+
     def test_interval_tier_creation_with_no_times(self):
         with self.assertRaises(errors.TimelessTextgridTierException) as cm:
             textgrid.IntervalTier("phones", [], None, None)
@@ -321,6 +538,63 @@ class TestIntervalTier(PraatioTestCase):
             sut.getValuesInIntervals(dataList2),
         )
 
+    def test_get_values_in_intervals_keeps_the_order_of_unsorted_data(self):
+        sut = makeIntervalTier(
+            intervals=[Interval(1, 2, "hello"), Interval(2, 3, "world")]
+        )
+        dataList = [(2.5, 1), (1.5, 2), (2.0, 3), (1.2, 4)]
+
+        self.assertEqual(
+            [
+                (Interval(1, 2, "hello"), [(1.5, 2), (2.0, 3), (1.2, 4)]),
+                (Interval(2, 3, "world"), [(2.5, 1), (2.0, 3)]),
+            ],
+            sut.getValuesInIntervals(iter(dataList)),
+        )
+
+    def test_get_values_in_intervals_with_a_separate_time_column(self):
+        sut = makeIntervalTier(
+            intervals=[Interval(1, 2, "hello"), Interval(2, 3, "world")]
+        )
+        dataList = [("a", 1), ("b", 2), ("c", 3), ("d", 4)]
+        times = array("d", [0.5, 1.5, 2.0, 2.5])
+
+        self.assertEqual(
+            [
+                (Interval(1, 2, "hello"), [("b", 2), ("c", 3)]),
+                (Interval(2, 3, "world"), [("c", 3), ("d", 4)]),
+            ],
+            sut.getValuesInIntervals(dataList, times),
+        )
+
+    def test_get_values_in_intervals_matches_a_scan_of_each_interval(self):
+        sut = makeIntervalTier(
+            intervals=[
+                Interval(0.5, 1, "a"),
+                Interval(1, 2, "b"),
+                Interval(2.5, 3, "c"),
+                Interval(3, 4, "d"),
+            ]
+        )
+        dataList = [(i / 4, i) for i in range(20)]
+
+        for data in [dataList, dataList[::-1]]:
+            self.assertEqual(
+                [
+                    (interval, utils.getValuesInInterval(data, *interval[:2]))
+                    for interval in sut.entries
+                ],
+                sut.getValuesInIntervals(data),
+            )
+
+    def test_get_values_in_intervals_raises_error_if_times_do_not_match_data(self):
+        sut = makeIntervalTier(intervals=[Interval(1, 2, "hello")])
+
+        with self.assertRaises(errors.ArgumentError) as cm:
+            sut.getValuesInIntervals([(1.5, 1), (1.6, 2)], [1.5])
+
+        self.assertEqual("Got 1 times for 2 rows of data.", str(cm.exception))
+
     def test_get_non_entries_when_final_interval_is_less_than_textgrid_max(self):
         sut = textgrid.IntervalTier(
             "pitch_values",
@@ -353,6 +627,26 @@ class TestIntervalTier(PraatioTestCase):
             sut.getNonEntries(),
         )
 
+    def test_crop_finds_the_same_intervals_as_a_full_scan(self):
+        # Intervals of 0.5 seconds, with a gap after every third one
+        intervals = [
+            Interval(start, start + 0.5, str(i))
+            for i, start in enumerate(x * 0.5 + (x // 3) * 0.25 for x in range(60))
+        ]
+        tier = makeIntervalTier(intervals=intervals, maxT=40)
+        compactTier = tier.new()
+        compactTier.compact()
+
+        cropRegions = [(0, 40), (0, 0.5), (0.5, 1.0), (1.2, 1.7), (1.5, 1.75), (10.3, 20.1)]
+        for sut in [tier, compactTier]:
+            for mode in ["strict", "lax", "truncated"]:
+                for cropStart, cropEnd in cropRegions:
+                    expectedEntries = utils.getIntervalsInInterval(
+                        cropStart, cropEnd, intervals, mode
+                    )
+                    croppedTier = sut.crop(cropStart, cropEnd, mode, False)
+                    self.assertEqual(expectedEntries, list(croppedTier.entries))
+
     def test_crop_raises_error_if_mode_invalid(self):
         sut = textgrid.Textgrid()
 
@@ -599,6 +893,12 @@ class TestIntervalTier(PraatioTestCase):
             sut.dejitter(refInterval, 0.1)._entries,
         )
 
+    def test_dejitter_raises_error_when_reference_tier_is_empty(self):
+        sut = makeIntervalTier()
+
+        with self.assertRaises(ValueError):
+            sut.dejitter(makeIntervalTier(intervals=[]), 0.1)
+
     def test_delete_entry(self):
         sut = makeIntervalTier(
             intervals=[
@@ -655,6 +955,60 @@ class TestIntervalTier(PraatioTestCase):
         )
         self.assertEqual(expectedIntervalTier, sut)
 
+    def test_differences_when_entries_span_several_entries(self):
+        mainTier = makeIntervalTier(
+            intervals=[
+                Interval(1, 3, "hello"),
+                Interval(3, 3.5, "the"),
+                Interval(3.5, 4.0, "world"),
+            ]
+        )
+        diffTier = makeIntervalTier(
+            intervals=[
+                Interval(1.5, 2, "cup"),
+                Interval(2.5, 3.2, "think"),
+                Interval(3.3, 3.7, "time"),
+            ]
+        )
+        sut = mainTier.difference(diffTier)
+
+        expectedIntervalTier = makeIntervalTier(
+            intervals=[
+                Interval(1, 1.5, "hello"),
+                Interval(2, 2.5, "hello"),
+                Interval(3.2, 3.3, "the"),
+                Interval(3.7, 4.0, "world"),
+            ]
+        )
+        self.assertEqual(expectedIntervalTier, sut)
+
+    def test_union_merges_chains_of_overlapping_intervals(self):
+        mainTier = makeIntervalTier(
+            intervals=[
+                Interval(1, 2, "hello"),
+                Interval(2.5, 3.0, "the"),
+                Interval(3.2, 4.0, "world"),
+            ]
+        )
+        otherTier = makeIntervalTier(
+            intervals=[
+                Interval(0.2, 0.6, "cup"),
+                Interval(1.5, 2.7, "think"),
+                Interval(2.8, 3.5, "time"),
+                Interval(4.0, 4.2, "sunlight"),
+            ]
+        )
+        sut = mainTier.union(otherTier)
+
+        expectedIntervalTier = makeIntervalTier(
+            intervals=[
+                Interval(0.2, 0.6, "cup"),
+                Interval(1, 4.0, "hello-think-the-time-world"),
+                Interval(4.0, 4.2, "sunlight"),
+            ]
+        )
+        self.assertEqual(expectedIntervalTier, sut)
+
     def test_edit_timestamps_raises_error_when_reporting_mode_is_invalid(self):
         sut = makeIntervalTier(
             intervals=[Interval(1, 2, "hello"), Interval(3, 4, "world")], maxT=5.0
@@ -959,6 +1313,29 @@ class TestIntervalTier(PraatioTestCase):
 
         self.assertEqual([Interval(1, 2, "hello")], sut._entries)
 
+    def test_insert_entry_keeps_entries_sorted(self):
+        sut = makeIntervalTier(
+            intervals=[Interval(1, 2, "hello"), Interval(3.5, 4, "world")]
+        )
+        sut.insertEntry(Interval(2.5, 3, "the"))
+        sut.insertEntry(Interval(0.5, 1, "oh"))
+
+        self.assertEqual(
+            [
+                Interval(0.5, 1, "oh"),
+                Interval(1, 2, "hello"),
+                Interval(2.5, 3, "the"),
+                Interval(3.5, 4, "world"),
+            ],
+            sut._entries,
+        )
+
+    def test_insert_entry_raises_error_if_interval_starts_after_it_ends(self):
+        sut = makeIntervalTier(intervals=[])
+
+        with self.assertRaises(errors.ArgumentError):
+            sut.insertEntry(Interval(2, 1, "hello"))
+
     def test_insert_has_no_collision_when_boundaries_are_shared(self):
         sut = makeIntervalTier(
             intervals=[Interval(1, 2, "hello"), Interval(3.5, 4, "world")]
@@ -1032,6 +1409,122 @@ class TestIntervalTier(PraatioTestCase):
         )
         self.assertEqual(expectedErrMsg, str(cm.exception))
 
+    def test_insert_collides_with_an_interval_that_contains_the_new_one(self):
+        def makeSut():
+            return makeIntervalTier("words", intervals=[Interval(1, 4, "hello")])
+
+        sut = makeSut()
+        with self.assertRaises(errors.CollisionError):
+            sut.insertEntry([2, 3, "world"])
+
+        sut = makeSut()
+        sut.insertEntry(
+            [2, 3, "world"],
+            collisionMode=constants.IntervalCollision.REPLACE,
+            collisionReportingMode=constants.ErrorReportingMode.SILENCE,
+        )
+        self.assertEqual([Interval(2, 3, "world")], sut._entries)
+
+        sut = makeSut()
+        sut.insertEntry(
+            [2, 3, "world"],
+            collisionMode=constants.IntervalCollision.MERGE,
+            collisionReportingMode=constants.ErrorReportingMode.SILENCE,
+        )
+        self.assertEqual([Interval(1, 4, "hello-world")], sut._entries)
+
+    def test_insert_entries_sorts_new_entries_among_existing_ones(self):
+        sut = makeIntervalTier(
+            intervals=[Interval(1, 2, "hello"), Interval(3.5, 4, "world")]
+        )
+        sut.insertEntries([[4, 5.5, "again"], Interval(2.5, 3, "the"), (0.5, 1, "oh")])
+
+        self.assertEqual(
+            [
+                Interval(0.5, 1, "oh"),
+                Interval(1, 2, "hello"),
+                Interval(2.5, 3, "the"),
+                Interval(3.5, 4, "world"),
+                Interval(4, 5.5, "again"),
+            ],
+            sut._entries,
+        )
+        self.assertEqual(5.5, sut.maxTimestamp)
+
+    def test_insert_entries_is_the_same_as_inserting_each_entry(self):
+        intervals = [Interval(1, 2, "hello"), Interval(3.5, 4, "world")]
+        newIntervals = [
+            Interval(1.5, 3, "the"),
+            Interval(0.5, 1, "oh"),
+            Interval(2.5, 3.6, "blue"),
+            Interval(3.8, 5, "cat"),
+        ]
+
+        for collisionMode in ["replace", "merge"]:
+            expectedTier = makeIntervalTier(intervals=intervals)
+            for interval in newIntervals:
+                expectedTier.insertEntry(interval, collisionMode, "silence")
+
+            sut = makeIntervalTier(intervals=intervals)
+            sut.insertEntries(newIntervals, collisionMode, "silence")
+
+            self.assertEqual(expectedTier, sut)
+
+    def test_insert_entries_throws_error_with_overlapping_intervals_when_mode_is_error(
+        self,
+    ):
+        sut = makeIntervalTier("words", intervals=[Interval(1, 2, "hello")])
+
+        with self.assertRaises(errors.CollisionError):
+            sut.insertEntries([[2, 3, "the"], [2.5, 4, "world"]])
+
+    def test_insert_entries_keeps_a_compact_tier_compact(self):
+        sut = makeIntervalTier(intervals=[Interval(1, 2, "hello")])
+        sut.compact()
+        sut.insertEntries([[2, 3, "world"]])
+
+        self.assertTrue(sut.isCompact)
+        self.assertEqual([Interval(1, 2, "hello"), Interval(2, 3, "world")], sut._entries)
+
+    def test_batch_inserts_entries_at_the_end_of_the_block(self):
+        sut = makeIntervalTier(intervals=[Interval(1, 2, "hello")])
+
+        with sut.batch():
+            sut.insertEntry([2.5, 3, "the"])
+            sut.insertEntry([1.5, 2.5, "world"], "merge", "silence")
+            sut.insertEntry([3, 4, "cat"])
+            self.assertEqual([Interval(1, 2, "hello")], sut._entries)
+
+        self.assertEqual(
+            [Interval(1, 2.5, "hello-world"), Interval(2.5, 3, "the"), Interval(3, 4, "cat")],
+            sut._entries,
+        )
+
+    def test_batch_discards_entries_if_the_block_raises_an_error(self):
+        sut = makeIntervalTier(intervals=[Interval(1, 2, "hello")])
+
+        with self.assertRaises(ValueError):
+            with sut.batch():
+                sut.insertEntry([2, 3, "world"])
+                raise ValueError()
+
+        self.assertEqual([Interval(1, 2, "hello")], sut._entries)
+        sut.insertEntry([2, 3, "world"])
+        self.assertEqual([Interval(1, 2, "hello"), Interval(2, 3, "world")], sut._entries)
+
+    def test_textgrid_tiers_check_for_collisions_by_default(self):
+        # The check that tiers use if they don't override _isDisjoint()
+        self.assertNotIn("_isDisjoint", TextgridTier.__abstractmethods__)
+        isDisjoint = TextgridTier._isDisjoint
+        sut = makeIntervalTier()
+
+        self.assertTrue(isDisjoint(sut, [Interval(1, 2, "a"), Interval(3, 4, "b")]))
+        self.assertFalse(isDisjoint(sut, [Interval(1, 3, "a"), Interval(2, 4, "b")]))
+        self.assertFalse(isDisjoint(sut, [Interval(2, 1, "a")]))
+        # Touching entries are left to insertEntry() to judge
+        self.assertFalse(isDisjoint(sut, [Interval(1, 2, "a"), Interval(2, 3, "b")]))
+        self.assertTrue(sut._isDisjoint([Interval(1, 2, "a"), Interval(2, 3, "b")]))
+
     def test_insert_space_raises_error_if_collision_mode_is_invalid(self):
         sut = makeIntervalTier()
 
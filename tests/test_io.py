@@ -14,12 +14,17 @@ generated files.
 
 import unittest
 import io
+import os
+import json
+import struct
 from os.path import join
+from unittest.mock import patch
 
 
 from praatio import textgrid
 from praatio.data_classes import textgrid as tg_data_class
 from praatio.utilities import constants
+from praatio.utilities.constants import Interval
 from praatio.utilities import textgrid_io
 from praatio.utilities import errors
 
@@ -111,6 +116,19 @@ class TestIo(PraatioTestCase):
 
         self.assertEqual(baselineTg, sut)
 
+    def test_reading_short_textgrids_with_legacy_header(self):
+        """Tests for reading textgrids with the header of older Praat versions."""
+        fn = "mary.TextGrid"
+        inputFN = join(self.dataRoot, fn)
+        baselineTg = textgrid.openTextgrid(inputFN, False)
+
+        # 'File type = "ooTextFile short"' and then just '"TextGrid"'
+        fn = "mary_with_legacy_short_header.TextGrid"
+        legacyHeaderTgFn = join(self.dataRoot, fn)
+        sut = textgrid.openTextgrid(legacyHeaderTgFn, False)
+
+        self.assertEqual(baselineTg, sut)
+
     def test_tg_io(self):
         """Tests for reading/writing textgrid io."""
         fn = "textgrid_to_merge.TextGrid"
@@ -169,6 +187,48 @@ class TestIo(PraatioTestCase):
 
         self.assertSequenceEqual(["Mary", "Mary_2", "Mary_3"], sut.tierNames)
 
+    def test_parsing_long_textgrid_labels_with_quotes_and_equal_signs(self):
+        data = "\n".join(
+            [
+                'File type = "ooTextFile"',
+                'Object class = "TextGrid"',
+                "",
+                "xmin = 0 ",
+                "xmax = 2 ",
+                "tiers? <exists> ",
+                "size = 1 ",
+                "item []: ",
+                "    item [1]:",
+                '        class = "IntervalTier" ',
+                '        name = "a ""quoted"" tier" ',
+                "        xmin = 0 ",
+                "        xmax = 2 ",
+                "        intervals: size = 2 ",
+                "        intervals [1]:",
+                "            xmin = 0 ",
+                "            xmax = 1 ",
+                '            text = "x = ""y"" " ',
+                "        intervals [2]:",
+                "            xmin = 1 ",
+                "            xmax = 2 ",
+                '            text = "first line',
+                'item [2]: ""',
+                'last line" ',
+            ]
+        )
+
+        sut = textgrid_io.parseTextgridStr(data, includeEmptyIntervals=True)
+
+        tier = sut["tiers"][0]
+        self.assertEqual('a "quoted" tier', tier["name"])
+        self.assertEqual(
+            [
+                Interval(0.0, 1.0, 'x = "y"'),
+                Interval(1.0, 2.0, 'first line\nitem [2]: "\nlast line'),
+            ],
+            list(tier["entries"]),
+        )
+
     def test_tg_io_long_vs_short(self):
         """Tests reading of long vs short textgrids."""
 
@@ -253,6 +313,566 @@ class TestIo(PraatioTestCase):
 
         self.assertTrue(areTheSameFiles(shortFN, outputLastFN, readFile))
 
+    def test_saving_and_loading_columnar_json(self):
+        """Tests that columnar json files round trip with the text formats."""
+        fn = join(self.dataRoot, "bobby_words_with_newlines.TextGrid")
+        outputFN = join(self.outputRoot, "saved_textgrid_as_columnar_json.json")
+
+        tg = textgrid.openTextgrid(fn, True)
+        tg.save(outputFN, constants.TextgridFormats.COLUMNAR_JSON, True)
+        sut = textgrid.openTextgrid(outputFN, True)
+
+        self.assertEqual(tg, sut)
+        self.assertEqual("columnar_json", textgrid.probeTextgrid(outputFN)["format"])
+
+    def test_columnar_json_layout(self):
+        tg = textgrid.Textgrid()
+        tg.addTier(textgrid.IntervalTier("words", [(0.5, 1.0, "a")], 0, 2.0))
+        tg.addTier(textgrid.PointTier("peaks", [(0.7, "b")], 0, 2.0))
+
+        sut = textgrid_io.getTextgridAsStr(
+            tg_data_class._tgToDictionary(tg),
+            constants.TextgridFormats.COLUMNAR_JSON,
+            False,
+        )
+
+        self.assertEqual(
+            {
+                "xmin": 0,
+                "xmax": 2.0,
+                "tiers": [
+                    {
+                        "class": "IntervalTier",
+                        "name": "words",
+                        "xmin": 0,
+                        "xmax": 2.0,
+                        "starts": [0.5],
+                        "ends": [1.0],
+                        "labels": ["a"],
+                    },
+                    {
+                        "class": "TextTier",
+                        "name": "peaks",
+                        "xmin": 0,
+                        "xmax": 2.0,
+                        "times": [0.7],
+                        "labels": ["b"],
+                    },
+                ],
+            },
+            json.loads(sut),
+        )
+
+    def test_parsing_columnar_json_with_mismatched_columns_raises_error(self):
+        data = json.dumps(
+            {
+                "xmin": 0,
+                "xmax": 2.0,
+                "tiers": [
+                    {
+                        "class": "IntervalTier",
+                        "name": "words",
+                        "xmin": 0,
+                        "xmax": 2.0,
+                        "starts": [0.5, 1.0],
+                        "ends": [1.0],
+                        "labels": ["a"],
+                    }
+                ],
+            }
+        )
+
+        with self.assertRaises(errors.ParsingError):
+            textgrid_io.parseTextgridStr(data)
+
+    def test_saving_and_loading_binary_textgrid(self):
+        """Tests that binary textgrids round trip with the text formats."""
+        for fn in ["mary.TextGrid", "bobby_words_with_newlines.TextGrid"]:
+            shortFN = join(self.dataRoot, fn)
+            outputFN = join(self.outputRoot, fn + ".bin")
+            outputLastFN = join(self.outputRoot, "saved_binary_then_textgrid.TextGrid")
+
+            tgFromTgFile = textgrid.openTextgrid(shortFN, True)
+            tgFromTgFile.save(
+                outputFN,
+                format=constants.TextgridFormats.BINARY_TEXTGRID,
+                includeBlankSpaces=True,
+            )
+
+            tgFromBinaryFile = textgrid.openTextgrid(outputFN, True)
+            tgFromBinaryFile.save(
+                outputLastFN,
+                format=constants.TextgridFormats.SHORT_TEXTGRID,
+                includeBlankSpaces=True,
+            )
+
+            self.assertEqual(tgFromTgFile, tgFromBinaryFile)
+            self.assertTrue(areTheSameFiles(shortFN, outputLastFN, readFile))
+
+    def test_saving_and_loading_compressed_textgrids(self):
+        inputFN = join(self.dataRoot, "mary.TextGrid")
+        tg = textgrid.openTextgrid(inputFN, True)
+        magicBytes = {".gz": b"\x1f\x8b", ".bz2": b"BZh", ".xz": b"\xfd7zXZ\x00"}
+
+        for extension, magic in magicBytes.items():
+            for format in [
+                constants.TextgridFormats.LONG_TEXTGRID,
+                constants.TextgridFormats.BINARY_TEXTGRID,
+            ]:
+                outputFN = join(self.outputRoot, "compressed.TextGrid" + extension)
+                tg.save(outputFN, format, True)
+
+                with io.open(outputFN, "rb") as fd:
+                    self.assertEqual(magic, fd.read(len(magic)))
+                self.assertEqual(tg, textgrid.openTextgrid(outputFN, True))
+                self.assertEqual(
+                    textgrid.probeTextgrid(inputFN)["tiers"],
+                    textgrid.probeTextgrid(outputFN)["tiers"],
+                )
+
+    def test_a_failed_save_leaves_the_existing_file_as_it_was(self):
+        inputFN = join(self.dataRoot, "mary.TextGrid")
+        outputFN = join(self.outputRoot, "failed_save.TextGrid")
+        tg = textgrid.openTextgrid(inputFN, True)
+        tg.save(outputFN, constants.TextgridFormats.BINARY_TEXTGRID, True)
+        with io.open(outputFN, "rb") as fd:
+            expectedData = fd.read()
+        expectedFiles = os.listdir(self.outputRoot)
+
+        # The label is too long for a binary textgrid, which is only
+        # found once the tiers before it have been written
+        tg.addTier(textgrid.IntervalTier("long", [(0.5, 1.0, "a" * 70000)]))
+        with self.assertRaises(errors.ArgumentError):
+            tg.save(outputFN, constants.TextgridFormats.BINARY_TEXTGRID, True)
+
+        with io.open(outputFN, "rb") as fd:
+            self.assertEqual(expectedData, fd.read())
+        self.assertEqual(sorted(expectedFiles), sorted(os.listdir(self.outputRoot)))
+
+    def test_saving_over_a_file_keeps_its_permissions(self):
+        tg = textgrid.openTextgrid(join(self.dataRoot, "mary.TextGrid"), True)
+        outputFN = join(self.outputRoot, "mary_with_permissions.TextGrid")
+        tg.save(outputFN, constants.TextgridFormats.SHORT_TEXTGRID, True)
+        os.chmod(outputFN, 0o640)
+
+        tg.save(outputFN, constants.TextgridFormats.LONG_TEXTGRID, True)
+
+        self.assertEqual(0o640, os.stat(outputFN).st_mode & 0o777)
+        self.assertEqual(tg, textgrid.openTextgrid(outputFN, True))
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "symlinks are not supported")
+    def test_saving_to_a_symlink_replaces_the_file_it_points_to(self):
+        tg = textgrid.openTextgrid(join(self.dataRoot, "mary.TextGrid"), True)
+        targetFN = join(self.outputRoot, "mary_symlink_target.TextGrid")
+        linkFN = join(self.outputRoot, "mary_symlink.TextGrid")
+        tg.save(targetFN, constants.TextgridFormats.SHORT_TEXTGRID, True)
+        if os.path.lexists(linkFN):
+            os.remove(linkFN)
+        os.symlink(os.path.basename(targetFN), linkFN)
+
+        tg.save(linkFN, constants.TextgridFormats.LONG_TEXTGRID, True)
+
+        self.assertTrue(os.path.islink(linkFN))
+        self.assertEqual(
+            constants.TextgridFormats.LONG_TEXTGRID,
+            textgrid.probeTextgrid(targetFN)["format"],
+        )
+
+    def test_saving_in_a_read_only_directory_writes_the_file_in_place(self):
+        tg = textgrid.openTextgrid(join(self.dataRoot, "mary.TextGrid"), True)
+        outputFN = join(self.outputRoot, "mary_in_read_only_dir.TextGrid")
+        tg.save(outputFN, constants.TextgridFormats.SHORT_TEXTGRID, True)
+
+        with patch("tempfile.mkstemp", side_effect=PermissionError):
+            tg.save(outputFN, constants.TextgridFormats.LONG_TEXTGRID, True)
+
+        self.assertEqual(
+            constants.TextgridFormats.LONG_TEXTGRID,
+            textgrid.probeTextgrid(outputFN)["format"],
+        )
+
+    def test_compressed_textgrids_are_detected_by_their_content(self):
+        tg = textgrid.openTextgrid(join(self.dataRoot, "mary.TextGrid"), True)
+        outputFN = join(self.outputRoot, "compressed_mary.TextGrid.gz")
+        renamedFN = join(self.outputRoot, "compressed_mary.TextGrid")
+        tg.save(outputFN, constants.TextgridFormats.SHORT_TEXTGRID, True)
+        with io.open(outputFN, "rb") as fromFd, io.open(renamedFN, "wb") as toFd:
+            toFd.write(fromFd.read())
+
+        self.assertEqual(tg, textgrid.openTextgrid(renamedFN, True))
+
+    def test_binary_textgrid_layout(self):
+        tier = textgrid.IntervalTier("ph\u00f3ne", [(0.5, 1.0, "a")], 0, 2.0)
+        tg = textgrid.Textgrid()
+        tg.addTier(tier)
+
+        sut = textgrid_io.getTextgridAsBinary(tg_data_class._tgToDictionary(tg), False)
+
+        self.assertEqual(
+            b"ooBinaryFile\x08TextGrid"
+            + struct.pack(">dd?i", 0.0, 2.0, True, 1)
+            + b"\x0cIntervalTier"
+            + b"\xff\xff\x00\x05" + "ph\u00f3ne".encode("utf-16-be")
+            + struct.pack(">ddi", 0.0, 2.0, 1)
+            + struct.pack(">dd", 0.5, 1.0)
+            + b"\x00\x01a",
+            sut,
+        )
+
+    def test_binary_textgrid_matches_its_text_twin(self):
+        """Tests reading a binary textgrid that wasn't saved by praatio.
+
+        mary_binary.TextGrid was packed by hand from mary.TextGrid,
+        following Praat's description of the binary format; it was not
+        saved by Praat.  This is therefore not an independent check of
+        compatibility with files written by Praat itself.  Replace the
+        fixture with one saved from Praat when one is available.
+        """
+        binaryFN = join(self.dataRoot, "mary_binary.TextGrid")
+        textFN = join(self.dataRoot, "mary.TextGrid")
+
+        binaryTg = textgrid.openTextgrid(binaryFN, True)
+        textTg = textgrid.openTextgrid(textFN, True)
+
+        # The phone tier has a label outside of ASCII, stored as UTF-16
+        labels = [entry.label for entry in binaryTg.getTier("phone").entries]
+        self.assertIn("ə", labels)
+        self.assertEqual(textTg.tierNames, binaryTg.tierNames)
+        for tierName in textTg.tierNames:
+            self.assertEqual(textTg.getTier(tierName), binaryTg.getTier(tierName))
+        self.assertEqual(textTg, binaryTg)
+
+    def test_write_textgrid_streams_to_text_and_binary_buffers(self):
+        inputFN = join(self.dataRoot, "bobby_words_with_newlines_longfile.TextGrid")
+        tg = textgrid.openTextgrid(inputFN, False)
+
+        for format in [
+            constants.TextgridFormats.SHORT_TEXTGRID,
+            constants.TextgridFormats.LONG_TEXTGRID,
+            constants.TextgridFormats.JSON,
+            constants.TextgridFormats.TEXTGRID_JSON,
+        ]:
+            fd = io.StringIO()
+            textgrid_io.writeTextgrid(tg_data_class._tgToDictionary(tg), fd, format)
+
+            self.assertEqual(
+                textgrid_io.getTextgridAsStr(
+                    tg_data_class._tgToDictionary(tg), format, True
+                ),
+                fd.getvalue(),
+            )
+
+        fd = io.BytesIO()
+        textgrid_io.writeTextgrid(
+            tg_data_class._tgToDictionary(tg),
+            fd,
+            constants.TextgridFormats.BINARY_TEXTGRID,
+        )
+        self.assertEqual(
+            textgrid_io.getTextgridAsBinary(tg_data_class._tgToDictionary(tg), True),
+            fd.getvalue(),
+        )
+
+    def test_get_textgrid_as_str_raises_error_for_binary_format(self):
+        tg = textgrid.Textgrid()
+        tg.addTier(textgrid.IntervalTier("words", [(0.5, 1.0, "a")], 0, 2.0))
+
+        with self.assertRaises(errors.ArgumentError):
+            textgrid_io.getTextgridAsStr(
+                tg_data_class._tgToDictionary(tg),
+                constants.TextgridFormats.BINARY_TEXTGRID,
+                True,
+            )
+
+    def test_parsing_a_truncated_binary_textgrid_raises_error(self):
+        tg = textgrid.Textgrid()
+        tg.addTier(textgrid.IntervalTier("words", [(0.5, 1.0, "a")], 0, 2.0))
+        data = textgrid_io.getTextgridAsBinary(tg_data_class._tgToDictionary(tg), True)
+
+        with self.assertRaises(errors.ParsingError):
+            textgrid_io.parseBinaryTextgrid(data[:-10])
+
+    def test_parsing_short_textgrids_with_quotes_and_newlines_in_labels(self):
+        labels = ['"', '""', 'a "quote"\nover "two" lines', "\n\nthree\n", "plain"]
+        tg = textgrid.Textgrid()
+        tg.addTier(
+            textgrid.IntervalTier(
+                'say "hi"',
+                [(i, i + 1, label) for i, label in enumerate(labels)],
+                0,
+                len(labels),
+            )
+        )
+        tg.addTier(textgrid.PointTier("points", [(0.5, '"\n"')], 0, len(labels)))
+        tgAsDict = tg_data_class._tgToDictionary(tg)
+        data = textgrid_io.getTextgridAsStr(
+            tgAsDict, constants.TextgridFormats.SHORT_TEXTGRID, True
+        )
+
+        sut = textgrid_io.parseTextgridStr(data, True)
+
+        self.assertEqual(
+            ['"', '""', 'a "quote"\nover "two" lines', "three", "plain"],
+            [entry[2] for entry in sut["tiers"][0]["entries"]],
+        )
+        self.assertEqual('say "hi"', sut["tiers"][0]["name"])
+        self.assertEqual([(0.5, '"\n"')], sut["tiers"][1]["entries"])
+
+    def test_parsing_a_truncated_short_textgrid_raises_error(self):
+        data = readFile(join(self.dataRoot, "mary.TextGrid"))
+        data = data[: data.rindex('"')]
+
+        with self.assertRaises(errors.ParsingError):
+            textgrid_io.parseTextgridStr(data)
+
+    def test_parsing_short_textgrids_with_unquoted_labels_raises_error(self):
+        data = "\n".join(
+            [
+                'File type = "ooTextFile"',
+                'Object class = "TextGrid"',
+                "",
+                "0",
+                "1",
+                "<exists>",
+                "1",
+                '"IntervalTier"',
+                '"words"',
+                "0",
+                "1",
+                "1",
+                "0",
+                "1",
+                "abc",
+            ]
+        )
+
+        with self.assertRaises(errors.ParsingError) as cm:
+            textgrid_io.parseTextgridStr(data)
+
+        self.assertEqual(
+            "Expected a text in Textgrid but found 'abc'.", str(cm.exception)
+        )
+
+    def test_open_textgrid_detects_or_uses_the_given_encoding(self):
+        inputFN = join(self.dataRoot, "mary.TextGrid")
+        outputFN = join(self.outputRoot, "mary_utf16_without_bom.TextGrid")
+        with io.open(outputFN, "wb") as fd:
+            fd.write(readFile(inputFN).encode("utf-16-le"))
+        expectedTg = textgrid.openTextgrid(inputFN, False)
+
+        self.assertEqual(expectedTg, textgrid.openTextgrid(outputFN, False))
+        self.assertEqual(
+            expectedTg, textgrid.openTextgrid(outputFN, False, encoding="utf-16-le")
+        )
+
+    def test_open_textgrid_only_loads_the_requested_tiers(self):
+        binaryFN = join(self.outputRoot, "mary_for_tier_names.TextGrid")
+        jsonFN = join(self.outputRoot, "mary_for_tier_names.json")
+        tg = textgrid.openTextgrid(join(self.dataRoot, "mary.TextGrid"), True)
+        tg.save(binaryFN, constants.TextgridFormats.BINARY_TEXTGRID, True)
+        tg.save(jsonFN, constants.TextgridFormats.JSON, True)
+
+        for fn in [
+            join(self.dataRoot, "mary.TextGrid"),
+            join(self.dataRoot, "mary_longfile.TextGrid"),
+            binaryFN,
+            jsonFN,
+        ]:
+            fullTg = textgrid.openTextgrid(fn, False)
+
+            sut = textgrid.openTextgrid(fn, False, tierNames=["pitch", "phone"])
+
+            self.assertSequenceEqual(["phone", "pitch"], sut.tierNames)
+            self.assertEqual(fullTg.getTier("phone"), sut.getTier("phone"))
+            self.assertEqual(fullTg.getTier("pitch"), sut.getTier("pitch"))
+
+    def test_open_textgrid_skips_tiers_with_multiline_labels(self):
+        for fn in [
+            "bobby_words_with_newlines.TextGrid",
+            "bobby_words_with_newlines_longfile.TextGrid",
+        ]:
+            inputFN = join(self.dataRoot, fn)
+            fullTg = textgrid.openTextgrid(inputFN, True)
+
+            sut = textgrid.openTextgrid(inputFN, True, tierNames=["phrase", ""])
+
+            self.assertSequenceEqual(["phrase", ""], sut.tierNames)
+            self.assertEqual(fullTg.getTier("phrase"), sut.getTier("phrase"))
+            self.assertEqual(fullTg.getTier(""), sut.getTier(""))
+
+    def test_open_textgrids_yields_results_in_order(self):
+        fns = [
+            join(self.dataRoot, "mary.TextGrid"),
+            join(self.dataRoot, "does_not_exist.TextGrid"),
+            join(self.dataRoot, "mary_longfile.TextGrid"),
+            join(self.dataRoot, "bobby_words_with_newlines.TextGrid"),
+        ]
+
+        for workers in [1, 2]:
+            sut = list(textgrid.openTextgrids(fns, False, workers=workers))
+
+            self.assertEqual(fns, [result.fnFullPath for result in sut])
+            for fn, result in zip(fns, sut):
+                if "does_not_exist" in fn:
+                    self.assertIsNone(result.textgrid)
+                    self.assertIsInstance(result.error, FileNotFoundError)
+                else:
+                    self.assertIsNone(result.error)
+                    self.assertEqual(textgrid.openTextgrid(fn, False), result.textgrid)
+
+    def test_open_textgrids_reports_an_error_when_a_worker_returns_nothing(self):
+        fn = join(self.dataRoot, "mary.TextGrid")
+
+        with patch.object(textgrid, "_runInProcessPool", return_value=[(None, None)]):
+            sut = list(textgrid.openTextgrids([fn], False, workers=2))
+
+        self.assertEqual(1, len(sut))
+        self.assertIsNone(sut[0].textgrid)
+        self.assertIsInstance(sut[0].error, errors.UnexpectedError)
+
+    def test_save_textgrids_saves_each_textgrid(self):
+        tg = textgrid.openTextgrid(join(self.dataRoot, "mary.TextGrid"), False)
+        fns = [join(self.outputRoot, f"saved_in_bulk_{i}.TextGrid") for i in range(3)]
+
+        sut = list(
+            textgrid.saveTextgrids(
+                [(fn, tg) for fn in fns],
+                constants.TextgridFormats.SHORT_TEXTGRID,
+                True,
+                workers=2,
+            )
+        )
+
+        self.assertEqual(fns, [result.fnFullPath for result in sut])
+        self.assertEqual([None] * 3, [result.error for result in sut])
+        for fn in fns:
+            self.assertTrue(
+                areTheSameFiles(join(self.dataRoot, "mary.TextGrid"), fn, readFile)
+            )
+
+    def test_save_textgrids_reports_any_error_and_saves_the_rest(self):
+        tg = textgrid.openTextgrid(join(self.dataRoot, "mary.TextGrid"), False)
+        fns = [join(self.outputRoot, f"saved_in_bulk_{i}.TextGrid") for i in range(3)]
+
+        for workers in [1, 2]:
+            # Not a textgrid, so validating it raises an AttributeError
+            sut = list(
+                textgrid.saveTextgrids(
+                    [(fns[0], tg), (fns[1], None), (fns[2], tg)],  # type: ignore
+                    constants.TextgridFormats.SHORT_TEXTGRID,
+                    True,
+                    workers=workers,
+                )
+            )
+
+            self.assertEqual(fns, [result.fnFullPath for result in sut])
+            self.assertIsNone(sut[0].error)
+            self.assertIsInstance(sut[1].error, AttributeError)
+            self.assertIsNone(sut[2].error)
+
+    def test_iter_textgrid_yields_the_same_data_as_open_textgrid(self):
+        binaryFN = join(self.outputRoot, "mary_for_iter.TextGrid")
+        textgrid.openTextgrid(join(self.dataRoot, "mary.TextGrid"), True).save(
+            binaryFN, constants.TextgridFormats.BINARY_TEXTGRID, True
+        )
+
+        for fn in [
+            join(self.dataRoot, "mary.TextGrid"),
+            join(self.dataRoot, "mary_with_legacy_short_header.TextGrid"),
+            join(self.dataRoot, "mary_longfile.TextGrid"),
+            join(self.dataRoot, "bobby_words_with_newlines.TextGrid"),
+            join(self.dataRoot, "bobby_words_with_newlines_longfile.TextGrid"),
+            binaryFN,
+        ]:
+            for includeEmptyIntervals in [True, False]:
+                tg = textgrid.openTextgrid(fn, includeEmptyIntervals)
+
+                items = list(textgrid_io.iterTextgrid(fn, includeEmptyIntervals))
+
+                self.assertEqual(
+                    (tg.minTimestamp, tg.maxTimestamp),
+                    (items[0]["xmin"], items[0]["xmax"]),
+                )
+                tierHeaders = [item for item in items if type(item) is dict][1:]
+                self.assertEqual(
+                    tg.tierNames, tuple(header["name"] for header in tierHeaders)
+                )
+                entries = [item for item in items if type(item) is not dict]
+                self.assertEqual(
+                    [entry for tier in tg.tiers for entry in tier.entries], entries
+                )
+
+    def test_iter_textgrid_yields_tier_headers_before_entries(self):
+        fn = join(self.dataRoot, "mary.TextGrid")
+
+        items = textgrid_io.iterTextgrid(fn, True)
+
+        self.assertEqual(
+            {
+                "format": constants.TextgridFormats.SHORT_TEXTGRID,
+                "xmin": 0.0,
+                "xmax": 1.869687,
+            },
+            next(items),
+        )
+        self.assertEqual(
+            {
+                "class": constants.INTERVAL_TIER,
+                "name": "phone",
+                "xmin": 0.0,
+                "xmax": 1.869687,
+                "size": 16,
+            },
+            next(items),
+        )
+        self.assertEqual(Interval(0.0, 0.3154201182247563, ""), next(items))
+
+    def test_probe_textgrid_reads_the_tier_headers(self):
+        binaryFN = join(self.outputRoot, "mary_for_probe.TextGrid")
+        jsonFN = join(self.outputRoot, "mary_for_probe.json")
+        tg = textgrid.openTextgrid(join(self.dataRoot, "mary.TextGrid"), True)
+        tg.save(binaryFN, constants.TextgridFormats.BINARY_TEXTGRID, True)
+        tg.save(jsonFN, constants.TextgridFormats.TEXTGRID_JSON, True)
+
+        for fn, format in [
+            (join(self.dataRoot, "mary.TextGrid"), "short_textgrid"),
+            (
+                join(self.dataRoot, "mary_with_legacy_short_header.TextGrid"),
+                "short_textgrid",
+            ),
+            (join(self.dataRoot, "mary_longfile.TextGrid"), "long_textgrid"),
+            (binaryFN, "binary_textgrid"),
+            (jsonFN, "textgrid_json"),
+        ]:
+            sut = textgrid.probeTextgrid(fn)
+
+            self.assertEqual(format, sut["format"])
+            self.assertEqual((0.0, 1.869687), (sut["xmin"], sut["xmax"]))
+            self.assertEqual(
+                [(tier.name, tier.tierType, len(tier)) for tier in tg.tiers],
+                [(tier["name"], tier["class"], tier["size"]) for tier in sut["tiers"]],
+            )
+
+    def test_probe_textgrid_skips_multiline_labels(self):
+        for fn in [
+            "bobby_words_with_newlines.TextGrid",
+            "bobby_words_with_newlines_longfile.TextGrid",
+        ]:
+            sut = textgrid.probeTextgrid(join(self.dataRoot, fn))
+
+            self.assertEqual(
+                [('"word"', 6), ("phrase", 3), ("", 4)],
+                [(tier["name"], tier["size"]) for tier in sut["tiers"]],
+            )
+
+    def test_iter_textgrid_raises_error_for_truncated_textgrid(self):
+        fn = join(self.outputRoot, "truncated.TextGrid")
+        with io.open(fn, "w", encoding="utf-8") as fd:
+            fd.write(readFile(join(self.dataRoot, "mary.TextGrid"))[:300])
+
+        with self.assertRaises(errors.ParsingError):
+            list(textgrid_io.iterTextgrid(fn))
+
     def test_saving_and_loading_json_leads_to_data_lose_in_one_edgecase(self):
         # Each tier can have a unique min and max timestamp
         # These timestamps can be different from the min and max specified for the file
@@ -19,6 +19,16 @@ class TestKlattgrid(PraatioTestCase):
 
         self.assertTrue(areTheSameFiles(inputFN, outputFN, klattgrid.openKlattgrid))
 
+    def test_reading_and_writing_compressed_klattgrids(self):
+        fn = "bobby.KlattGrid"
+        inputFN = join(self.dataRoot, fn)
+        outputFN = join(self.outputRoot, fn + ".gz")
+
+        kg = klattgrid.openKlattgrid(inputFN)
+        kg.save(outputFN)
+
+        self.assertTrue(areTheSameFiles(inputFN, outputFN, klattgrid.openKlattgrid))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from array import array
 from os.path import join
 import io
 from contextlib import redirect_stdout
@@ -53,6 +54,31 @@ class TestPointTier(PraatioTestCase):
         sut.maxTimestamp = 5
         self.assertEqual(sut, pointTier)
 
+    def test_from_sorted_entries_creates_the_same_tier_as_the_constructor(self):
+        points = [Point(1.0, "hello"), Point(2.5, "world")]
+
+        sut = textgrid.PointTier.fromSortedEntries("foo", points, maxT=4.0)
+
+        self.assertEqual(textgrid.PointTier("foo", points, maxT=4.0), sut)
+        self.assertEqual((1.0, 4.0), (sut.minTimestamp, sut.maxTimestamp))
+
+    def test_new_shares_points_until_either_tier_is_modified(self):
+        points = [Point(1.0, "hello"), Point(2.5, "world")]
+        tier = makePointTier(points=points)
+        sut = tier.new()
+        self.assertIs(tier._entries, sut._entries)
+
+        sut.insertEntry(Point(1.0, "hi"), collisionMode="merge")
+        tier.insertEntry(Point(3.0, "bye"))
+        erasedTier = tier.eraseRegion(2.0, 3.5, doShrink=False)
+
+        self.assertEqual((Point(1.0, "hello-hi"), Point(2.5, "world")), sut.entries)
+        self.assertEqual(
+            (Point(1.0, "hello"), Point(2.5, "world"), Point(3.0, "bye")),
+            tier.entries,
+        )
+        self.assertEqual((Point(1.0, "hello"),), erasedTier.entries)
+
     def test__len__returns_the_number_of_points_in_the_point_tier(self):
         point1 = Point(1, "hello")
         point2 = Point(3.5, "world")
@@ -256,6 +282,42 @@ class TestPointTier(PraatioTestCase):
             [0, 1, 2], sut.find("[eo]", substrMatchFlag=False, usingRE=True)
         )
 
+    def test_find_sees_changes_to_the_tier(self):
+        sut = makePointTier(points=[Point(1, "hello"), Point(2.5, "the")])
+        self.assertEqual([1], sut.find("the"))
+
+        sut.insertEntry(Point(0.5, "the"))
+        self.assertEqual([0, 2], sut.find("the"))
+
+        sut.insertEntry(Point(1, "the"), constants.IntervalCollision.REPLACE, "silence")
+        self.assertEqual([0, 1, 2], sut.find("the"))
+
+        sut = sut.eraseRegion(0.5, 1.5, doShrink=False)
+        self.assertEqual([0], sut.find("the"))
+
+    def test_nearest_finds_the_nearest_point(self):
+        sut = makePointTier(
+            points=[Point(1, "hello"), Point(2.5, "the"), Point(3.5, "world")]
+        )
+
+        self.assertEqual(Point(1, "hello"), sut.nearest(0))
+        self.assertEqual(Point(2.5, "the"), sut.nearest(2.5))
+        self.assertEqual(Point(2.5, "the"), sut.nearest(2.9))
+        self.assertEqual(Point(3.5, "world"), sut.nearest(10))
+        # The earlier point is chosen if two are equally close
+        self.assertEqual(Point(2.5, "the"), sut.nearest(3.0))
+
+        self.assertIsNone(makePointTier(points=[]).nearest(1))
+
+    def test_entries_at_finds_the_nearest_points_to_many_times(self):
+        sut = makePointTier(points=[Point(1, "hello"), Point(3.5, "world")])
+
+        self.assertEqual([1, 0, 0, 1], sut.indicesAt([4, 0.5, 2.25, 2.3]))
+        self.assertEqual(
+            [Point(3.5, "world"), Point(1, "hello")], sut.entriesAt([3, 1.5])
+        )
+        self.assertEqual([None], makePointTier(points=[]).indicesAt([1]))
+
     def test_point_tier_creation_with_no_times(self):
         with self.assertRaises(errors.TimelessTextgridTierException) as cm:
             textgrid.PointTier("pitch_values", [], None, None)
@@ -294,6 +356,17 @@ class TestPointTier(PraatioTestCase):
         )
         self.assertEqual(expectedPointTier, sut)
 
+    def test_crop_keeps_points_on_the_crop_boundaries(self):
+        pointTier = makePointTier(
+            points=[Point(0.5, "12"), Point(1.0, "55"), Point(3.8, "99"), Point(4.5, "32")],
+            minT=0,
+            maxT=5,
+        )
+
+        sut = pointTier.crop(1.0, 3.8, rebaseToZero=False)
+
+        self.assertEqual((Point(1.0, "55"), Point(3.8, "99")), sut.entries)
+
     def test_crop_when_rebase_to_zero_is_false(self):
         pointTier = makePointTier(
             points=[
@@ -362,6 +435,12 @@ class TestPointTier(PraatioTestCase):
             sut.dejitter(refInterval, 0.1)._entries,
         )
 
+    def test_dejitter_raises_error_when_reference_tier_is_empty(self):
+        sut = makePointTier()
+
+        with self.assertRaises(ValueError):
+            sut.dejitter(makePointTier(points=[]), 0.1)
+
     def test_erase_region_when_do_shrink_is_true(self):
         pointTier = makePointTier(
             points=[
@@ -444,6 +523,75 @@ class TestPointTier(PraatioTestCase):
             sut.getValuesAtPoints(dataList2, fuzzyMatching=True),
         )
 
+    def test_get_values_at_points_returns_the_first_row_of_rows_with_the_same_time(
+        self,
+    ):
+        sut = makePointTier(points=[Point(1.0, "a"), Point(1.2, "b")])
+        dataList = [(1.0, 7), (1.0, 3), (2.0, 5)]
+        times = [1.0, 1.0, 2.0]
+
+        # The smallest row, as the rows are sorted
+        self.assertEqual(
+            [(1.0, 3), (1.0, 3)],
+            sut.getValuesAtPoints(dataList, fuzzyMatching=True),
+        )
+        # The first row in the data, as the times are already in order
+        self.assertEqual(
+            [(1.0, 7), (1.0, 7)],
+            sut.getValuesAtPoints(dataList, fuzzyMatching=True, times=times),
+        )
+        # Still the first row in the data when the times must be sorted
+        self.assertEqual(
+            [(1.0, 3), (1.0, 3)],
+            sut.getValuesAtPoints(
+                dataList[::-1], fuzzyMatching=True, times=times[::-1]
+            ),
+        )
+
+    def test_get_values_at_points_with_a_separate_time_column(self):
+        sut = makePointTier(
+            points=[Point(1.3, "55"), Point(3.7, "99"), Point(4.5, "32")],
+        )
+        dataList = [(4.5, 31), (1.3, 34), (1.5, 32), (4.8, 99)]
+        times = array("d", [4.5, 1.3, 1.5, 4.8])
+
+        self.assertEqual(
+            [(1.3, 34), (), (4.5, 31)],
+            sut.getValuesAtPoints(dataList, times=times),
+        )
+        self.assertEqual(
+            [(1.3, 34), (4.5, 31), (4.5, 31)],
+            sut.getValuesAtPoints(dataList, fuzzyMatching=True, times=times),
+        )
+
+    def test_get_values_at_points_with_interpolation(self):
+        sut = makePointTier(
+            points=[
+                Point(0.5, "a"),
+                Point(1.5, "b"),
+                Point(2.0, "c"),
+                Point(3.0, "d"),
+            ],
+        )
+        dataList = [(1.0, 100, 10), (2.0, 200, 30), (2.5, 300, 0)]
+
+        self.assertEqual(
+            [(), (1.5, 150, 20), (2.0, 200, 30), ()],
+            sut.getValuesAtPoints(dataList, interpolate=True),
+        )
+        self.assertEqual(
+            [(1.0, 100, 10), (1.5, 150, 20), (2.0, 200, 30), (2.5, 300, 0)],
+            sut.getValuesAtPoints(dataList, fuzzyMatching=True, interpolate=True),
+        )
+
+    def test_get_values_at_points_raises_error_if_times_do_not_match_data(self):
+        sut = makePointTier(points=[Point(1.3, "55")])
+
+        with self.assertRaises(errors.ArgumentError) as cm:
+            sut.getValuesAtPoints([(1.3, 34)], times=[1.3, 1.5])
+
+        self.assertEqual("Got 2 times for 1 rows of data.", str(cm.exception))
+
     def test_insert_point_at_start_of_point_tier(self):
         sut = makePointTier(
             points=[Point(1.3, "55"), Point(3.7, "99"), Point(4.5, "32")],
@@ -543,6 +691,48 @@ class TestPointTier(PraatioTestCase):
             sut._entries,
         )
 
+    def test_insert_entries_is_the_same_as_inserting_each_entry(self):
+        points = [Point(1.3, "55"), Point(3.7, "99"), Point(4.5, "32")]
+        newPoints = [Point(3.7, "hello"), Point(0.5, "12"), Point(0.5, "world")]
+
+        for collisionMode in ["replace", "merge"]:
+            expectedTier = makePointTier(points=points)
+            for point in newPoints:
+                expectedTier.insertEntry(point, collisionMode, "silence")
+
+            sut = makePointTier(points=points)
+            sut.insertEntries(newPoints, collisionMode, "silence")
+
+            self.assertEqual(expectedTier, sut)
+
+    def test_batch_inserts_points_at_the_end_of_the_block(self):
+        sut = makePointTier(points=[Point(1.3, "55")])
+
+        with sut.batch():
+            sut.insertEntry(Point(3.7, "99"))
+            sut.insertEntries([Point(0.5, "12")])
+            self.assertEqual([Point(1.3, "55")], sut._entries)
+
+        self.assertEqual([Point(0.5, "12"), Point(1.3, "55"), Point(3.7, "99")], sut._entries)
+
+    def test_insert_entries_and_batch_keep_bounds_like_insert_entry(self):
+        expected = makePointTier(points=[Point(1.3, "55")], minT=1.0, maxT=5.0)
+        expected.insertEntry(Point(7.0, "b"))
+        expected.insertEntry(Point(0.5, "a"))
+        self.assertEqual((1.0, 5.0), (expected.minTimestamp, expected.maxTimestamp))
+
+        sut = makePointTier(points=[Point(1.3, "55")], minT=1.0, maxT=5.0)
+        sut.insertEntries([Point(7.0, "b"), Point(0.5, "a")])
+        self.assertEqual(expected, sut)
+        self.assertEqual((1.0, 5.0), (sut.minTimestamp, sut.maxTimestamp))
+
+        sut = makePointTier(points=[Point(1.3, "55")], minT=1.0, maxT=5.0)
+        with sut.batch():
+            sut.insertEntry(Point(7.0, "b"))
+            sut.insertEntry(Point(0.5, "a"))
+        self.assertEqual(expected, sut)
+        self.assertEqual((1.0, 5.0), (sut.minTimestamp, sut.maxTimestamp))
+
     def test_edit_timestamps_throws_error_if_reporting_mode_is_invalid(self):
         sut = makePointTier(
             points=[Point(1.3, "55"), Point(3.7, "99"), Point(4.5, "32")],
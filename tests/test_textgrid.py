@@ -727,6 +727,34 @@ class TestTextgrid(PraatioTestCase):
         with self.assertRaises(errors.ArgumentError) as _:
             sut.eraseRegion(2, 1, False)
 
+    def test_dejitter_moves_timestamps_in_all_tiers_to_the_reference_tier(self):
+        originalTextgrid = textgrid.Textgrid(0, 7)
+        for tier in [
+            makeIntervalTier("words", [[1, 2, "hello"], [3, 4, "world"]], maxT=6),
+            makeIntervalTier("phones", [[1.05, 1.5, "h"], [1.5, 1.98, "i"]], maxT=6),
+            makePointTier("cats", [[2.99, "ice cream"], [3.6, "pizza"]], maxT=6),
+        ]:
+            originalTextgrid.addTier(tier)
+
+        sut = originalTextgrid.dejitter("words", 0.1)
+
+        expectedTextgrid = textgrid.Textgrid(0, 7)
+        for tier in [
+            makeIntervalTier("words", [[1, 2, "hello"], [3, 4, "world"]], maxT=6),
+            makeIntervalTier("phones", [[1, 1.5, "h"], [1.5, 2, "i"]], maxT=6),
+            makePointTier("cats", [[3, "ice cream"], [3.6, "pizza"]], maxT=6),
+        ]:
+            expectedTextgrid.addTier(tier)
+
+        self.assertEqual(expectedTextgrid, sut)
+
+    def test_dejitter_raises_error_if_reference_tier_does_not_exist(self):
+        sut = textgrid.Textgrid(0, 7)
+        sut.addTier(makeIntervalTier("words", [[1, 2, "hello"]], maxT=6))
+
+        with self.assertRaises(KeyError) as _:
+            sut.dejitter("phones")
+
     def test_edit_timestamps_throws_error_if_reporting_mode_is_invalid(self):
         sut = textgrid.Textgrid(0, 7)
 
@@ -1096,6 +1124,22 @@ class TestTextgrid(PraatioTestCase):
         sutCopy.addTier(tier4)
         self.assertNotEqual(sutCopy, sut)
 
+        # The tiers are copied too
+        sutCopy.getTier("phrases").insertEntry(constants.Interval(7, 8, "bye"))
+        self.assertEqual(1, len(sut.getTier("phrases")))
+
+    def test_compact_copies_whole_textgrids(self):
+        tg = textgrid.Textgrid()
+        tg.addTier(makeIntervalTier("words", [[1, 2, "hello"], [3, 4, "world"]]))
+        tg.addTier(makePointTier("peaks", [[1.5, "H*"]]))
+        sut = tg.new()
+        sut.compact()
+
+        self.assertTrue(all(tier.isCompact for tier in sut.tiers))
+        self.assertFalse(any(tier.isCompact for tier in tg.tiers))
+        self.assertEqual(tg, sut)
+        self.assertEqual(tg.crop(1.2, 3.5, "lax", False), sut.crop(1.2, 3.5, "lax", False))
+
     def test_save_throws_error_if_output_format_is_invalid(self):
         sut = textgrid.Textgrid()
 
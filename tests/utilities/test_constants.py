@@ -28,6 +28,20 @@ class TestConstants(PraatioTestCase):
         )
         self.assertNotEqual(constants.Interval(5 / 9.0, 1.0, "hello"), "hello")
 
+    def test_build_interns_labels(self):
+        # Build the labels at runtime, so they aren't the same constant
+        label = "".join(["hel", "lo"])
+        otherLabel = " hello ".strip()
+
+        self.assertIs(
+            constants.Interval.build(0.5, 1, label).label,
+            constants.Interval.build(1, 2, otherLabel).label,
+        )
+        self.assertIs(
+            constants.Point.build(0.5, label).label,
+            constants.Point.build(1, otherLabel).label,
+        )
+
     def test_point_as_named_tuple(self):
         sut = constants.Point(0.5, "hello")
 
@@ -0,0 +1,142 @@
+import unittest
+import io
+import os
+import shutil
+import threading
+from os.path import join
+
+from praatio import textgrid
+from praatio.utilities import textgrid_cache
+
+from tests.praatio_test_case import PraatioTestCase
+
+
+class TestTextgridCache(PraatioTestCase):
+    def setUp(self):
+        super(TestTextgridCache, self).setUp()
+        self.cacheDir = join(self.outputRoot, "textgrid_cache")
+        if os.path.exists(self.cacheDir):
+            shutil.rmtree(self.cacheDir)
+        textgrid_cache._caches.clear()
+
+        self.tgFN = join(self.outputRoot, "cached_mary.TextGrid")
+        shutil.copy(join(self.dataRoot, "mary.TextGrid"), self.tgFN)
+
+    def countingParser(self, tgAsDict):
+        self.numParses = 0
+
+        def parse():
+            self.numParses += 1
+            return tgAsDict
+
+        return parse
+
+    def test_open_textgrid_with_a_cache_gives_the_same_textgrid(self):
+        expectedTg = textgrid.openTextgrid(self.tgFN, False)
+
+        for _ in range(2):
+            sut = textgrid.openTextgrid(self.tgFN, False, cacheDir=self.cacheDir)
+            self.assertEqual(expectedTg, sut)
+
+        # Filters are applied to the cached textgrid
+        sut = textgrid.openTextgrid(
+            self.tgFN, True, tierNames=["word"], cacheDir=self.cacheDir
+        )
+        self.assertEqual(textgrid.openTextgrid(self.tgFN, True, tierNames=["word"]), sut)
+
+    def test_cached_textgrids_are_read_from_disk_by_a_new_cache(self):
+        tgAsDict = {"xmin": 0, "xmax": 1.0, "tiers": []}
+        parse = self.countingParser(tgAsDict)
+
+        textgrid_cache.TextgridCache(self.cacheDir).load(self.tgFN, parse)
+        sut = textgrid_cache.TextgridCache(self.cacheDir).load(self.tgFN, parse)
+
+        self.assertEqual(1, self.numParses)
+        self.assertEqual(tgAsDict, sut)
+
+    def test_changed_files_are_parsed_again(self):
+        cache = textgrid_cache.TextgridCache(self.cacheDir)
+        parse = self.countingParser({"xmin": 0, "xmax": 1.0, "tiers": []})
+
+        cache.load(self.tgFN, parse)
+        with io.open(self.tgFN, "a", encoding="utf-8") as fd:
+            fd.write("\n")
+        cache.load(self.tgFN, parse)
+
+        self.assertEqual(2, self.numParses)
+
+    def test_touched_files_are_not_parsed_again_when_using_hashes(self):
+        cache = textgrid_cache.TextgridCache(self.cacheDir)
+        parse = self.countingParser({"xmin": 0, "xmax": 1.0, "tiers": []})
+
+        cache.load(self.tgFN, parse, useHash=True)
+        stat = os.stat(self.tgFN)
+        os.utime(self.tgFN, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        cache.load(self.tgFN, parse, useHash=True)
+        self.assertEqual(1, self.numParses)
+
+        # Without hashes, the changed modification time invalidates the cache
+        textgrid_cache.TextgridCache(self.cacheDir).load(self.tgFN, parse)
+        self.assertEqual(2, self.numParses)
+
+    def test_least_recently_used_files_are_evicted(self):
+        cache = textgrid_cache.TextgridCache(self.cacheDir, memoryEntries=0)
+        tgAsDict = {
+            "xmin": 0,
+            "xmax": 1000.0,
+            "tiers": [
+                {
+                    "class": "IntervalTier",
+                    "name": "words",
+                    "xmin": 0,
+                    "xmax": 1000.0,
+                    "entries": [(i, i + 1, "word") for i in range(1000)],
+                }
+            ],
+        }
+        fns = []
+        for i in range(3):
+            fn = join(self.outputRoot, f"cached_mary_{i}.TextGrid")
+            shutil.copy(self.tgFN, fn)
+            fns.append(fn)
+
+        cache.load(fns[0], self.countingParser(tgAsDict))
+        cache.maxSize = os.path.getsize(_cacheFN(cache, fns[0])) * 2
+        cache.load(fns[1], self.countingParser(tgAsDict))
+        os.utime(_cacheFN(cache, fns[0]), ns=(0, 0))
+        cache.load(fns[2], self.countingParser(tgAsDict))
+
+        self.assertFalse(os.path.exists(_cacheFN(cache, fns[0])))
+        self.assertTrue(os.path.exists(_cacheFN(cache, fns[1])))
+        self.assertTrue(os.path.exists(_cacheFN(cache, fns[2])))
+
+    def test_threads_saving_the_same_textgrid_leave_one_cache_file(self):
+        cache = textgrid_cache.TextgridCache(self.cacheDir)
+        tgAsDict = {"xmin": 0, "xmax": 1.0, "tiers": []}
+        payload = textgrid_cache.textgrid_io.packTextgrid(tgAsDict)
+        key = textgrid_cache._getKey(self.tgFN, None)
+        signature = textgrid_cache._getSignature(self.tgFN, False)
+
+        threads = [
+            threading.Thread(target=cache._saveToDisk, args=(key, signature, payload))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([key + textgrid_cache.CACHE_FILE_EXTENSION], os.listdir(self.cacheDir))
+        sut = textgrid_cache.TextgridCache(self.cacheDir).load(
+            self.tgFN, self.countingParser(tgAsDict)
+        )
+        self.assertEqual(0, self.numParses)
+        self.assertEqual(tgAsDict, sut)
+
+
+def _cacheFN(cache, fn):
+    return cache._cacheFN(textgrid_cache._getKey(fn, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
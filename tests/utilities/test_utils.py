@@ -77,6 +77,23 @@ class TestUtils(unittest.TestCase):
         expectedZippedResult = [(1, 4), (2, 5), (3, 6), (None, 7)]
         self.assertEqual(expectedZippedResult, list(utils.safeZip(listToZip, False)))
 
+    def test_sniff_encoding(self):
+        text = 'File type = "ooTextFile"'
+
+        self.assertEqual("utf-8", utils.sniffEncoding(text.encode("utf-8")))
+        self.assertEqual("utf-8-sig", utils.sniffEncoding(text.encode("utf-8-sig")))
+        self.assertEqual("utf-16", utils.sniffEncoding(text.encode("utf-16")))
+        self.assertEqual("utf-16-be", utils.sniffEncoding(text.encode("utf-16-be")))
+        self.assertEqual("utf-16-le", utils.sniffEncoding(text.encode("utf-16-le")))
+
+    def test_decode_text(self):
+        data = "a\r\nb\rc\n\u00e9".encode("utf-16-be")
+
+        self.assertEqual("a\nb\nc\n\u00e9", utils.decodeText(data))
+        self.assertEqual(
+            "a\nb\nc\n\u00e9", utils.decodeText(data, encoding="utf-16-be")
+        )
+
     def test_choose_closest_time(self):
         # Prefers not-None candidate
         self.assertEqual(5, utils.chooseClosestTime(6, 5, None))
@@ -97,6 +114,26 @@ class TestUtils(unittest.TestCase):
         with self.assertRaises(errors.ArgumentError) as _:
             utils.chooseClosestTime(6, None, None)
 
+    def test_get_nearest_value(self):
+        values = [1, 2.5, 4, 7]
+
+        self.assertEqual(1, utils.getNearestValue(0, values))
+        self.assertEqual(2.5, utils.getNearestValue(2.5, values))
+        self.assertEqual(4, utils.getNearestValue(4.4, values))
+        self.assertEqual(7, utils.getNearestValue(10, values))
+
+        # Prefers the smaller value if the two are equidistant
+        self.assertEqual(4, utils.getNearestValue(5.5, values))
+
+        with self.assertRaises(ValueError) as _:
+            utils.getNearestValue(6, [])
+
+    def test_is_sorted(self):
+        self.assertTrue(utils.isSorted([]))
+        self.assertTrue(utils.isSorted([1.5]))
+        self.assertTrue(utils.isSorted([1, 2.5, 2.5, 4]))
+        self.assertFalse(utils.isSorted([1, 4, 2.5]))
+
 
 if __name__ == "__main__":
     unittest.main()